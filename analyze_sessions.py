@@ -0,0 +1,176 @@
+"""
+Analyse hors ligne des journaux de session
+Parcourt les segments enregistrés (config.JOURNAL_DIR) en parallèle et produit
+un résumé par session, par utilisateur et pour tout le parc: WPM, percentiles
+de latence, taux d'erreur, carte de chaleur par touche et gestes involontaires
+
+Usage:
+    python analyze_sessions.py [dossiers ou fichiers .atj ...] [--json resume.json] [--csv dossier]
+"""
+
+import argparse
+import csv
+import glob
+import json
+import os
+import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import partial
+
+import config
+from utils.journal import JOURNAL_EXTENSION, GESTURE_NAMES
+from utils.session_analysis import analyze_segment, key_table, merge_partials, merge_session, summarize
+
+
+def find_segments(paths):
+    """
+    Liste les segments de journal à analyser
+
+    Args:
+        paths: Fichiers .atj ou dossiers (parcourus récursivement)
+
+    Returns:
+        Chemins triés des segments
+    """
+    segments = []
+    for path in paths:
+        if os.path.isdir(path):
+            segments.extend(glob.glob(os.path.join(path, '**', '*' + JOURNAL_EXTENSION), recursive=True))
+        elif os.path.exists(path):
+            segments.append(path)
+        else:
+            print(f"Chemin introuvable: {path}")
+    return sorted(set(segments))
+
+
+def _analyze(path, bucket, window):
+    """Analyse un segment dans un processus de travail (None si illisible)"""
+    try:
+        return analyze_segment(path, bucket, window)
+    except (OSError, ValueError) as e:
+        print(f"Segment ignoré: {e}")
+        return None
+
+
+def write_csv(directory, sessions, users, keys, bucket):
+    """
+    Écrit les résumés CSV
+
+    Args:
+        directory: Dossier de sortie
+        sessions: Résumés par session
+        users: Résumés par utilisateur
+        keys: Statistiques par touche du parc
+        bucket: Durée des intervalles de WPM (s)
+    """
+    os.makedirs(directory, exist_ok=True)
+
+    with open(os.path.join(directory, 'users.csv'), 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['user', 'sessions', 'keystrokes', 'wpm', 'error_rate',
+                         'latency_p50', 'latency_p90', 'latency_p99']
+                        + [f"{name}_false" for name in GESTURE_NAMES])
+        for user, summary in sorted(users.items()):
+            latency = summary['latency']
+            writer.writerow([user, summary['sessions'], summary['keystrokes'], summary['wpm'],
+                             summary['error_rate'], latency['p50'], latency['p90'], latency['p99']]
+                            + [summary['false_gestures'][name] for name in GESTURE_NAMES])
+
+    with open(os.path.join(directory, 'wpm_over_time.csv'), 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['user', 'session_start', 'offset_seconds', 'wpm'])
+        for session in sessions:
+            for i, wpm in enumerate(session['wpm_over_time']):
+                writer.writerow([session['user'], session['session_start'], i * bucket, wpm])
+
+    with open(os.path.join(directory, 'keys.csv'), 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=['key', 'presses', 'error_rate', 'latency', 'x', 'y'])
+        writer.writeheader()
+        writer.writerows(keys)
+
+
+def main():
+    """Point d'entrée de l'analyse"""
+    parser = argparse.ArgumentParser(description="Analyse les journaux de session enregistrés")
+    parser.add_argument('paths', nargs='*', default=[config.JOURNAL_DIR],
+                        help="Segments .atj ou dossiers à parcourir")
+    parser.add_argument('--json', help="Fichier JSON du résumé complet")
+    parser.add_argument('--csv', help="Dossier des résumés CSV (users, wpm_over_time, keys)")
+    parser.add_argument('--workers', type=int, default=None, help="Processus de travail (CPU par défaut)")
+    parser.add_argument('--bucket', type=float, default=60.0, help="Intervalle (s) de l'évolution du WPM")
+    parser.add_argument('--false-trigger-window', type=float, default=1.0,
+                        help="Geste à moins de N secondes d'une frappe = déclenchement involontaire")
+    args = parser.parse_args()
+
+    paths = find_segments(args.paths)
+    if not paths:
+        print("Aucun journal de session trouvé")
+        return 1
+
+    # Dossiers de sortie créés avant l'analyse: une erreur ne fait pas perdre le calcul
+    try:
+        for directory in (os.path.dirname(args.json) if args.json else None, args.csv):
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+    except OSError as e:
+        print(f"Dossier de sortie inaccessible: {e}")
+        return 1
+
+    # Un segment par tâche: chaque processus lit son fichier par memmap
+    analyze = partial(_analyze, bucket=args.bucket, window=args.false_trigger_window)
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        chunksize = max(1, len(paths) // (4 * (args.workers or os.cpu_count() or 1)))
+        partials = [p for p in pool.map(analyze, paths, chunksize=chunksize) if p is not None]
+
+    # Segments -> sessions -> utilisateurs -> parc
+    by_session = defaultdict(list)
+    for segment in partials:
+        by_session[(segment['user'], segment['session_start'])].append(segment)
+    sessions = [merge_session(segments) for _, segments in sorted(by_session.items())]
+
+    by_user = defaultdict(list)
+    for session in sessions:
+        by_user[session['user']].append(session)
+
+    session_summaries = []
+    for session in sessions:
+        summary = summarize(session, args.bucket)
+        summary['user'] = session['user']
+        summary['session_start'] = datetime.fromtimestamp(session['session_start']).isoformat(timespec='seconds')
+        session_summaries.append(summary)
+
+    user_summaries = {}
+    for user, user_sessions in by_user.items():
+        summary = summarize(merge_partials(user_sessions))
+        summary['sessions'] = len(user_sessions)
+        user_summaries[user] = summary
+
+    fleet = merge_partials(sessions)
+    fleet_summary = summarize(fleet)
+    fleet_summary['sessions'] = len(sessions)
+    fleet_summary['users'] = len(by_user)
+    keys = key_table(fleet['per_key'])
+
+    print(f"{len(paths)} segment(s), {len(sessions)} session(s), {len(by_user)} utilisateur(s)")
+    latency = fleet_summary['latency']
+    print(f"  WPM: {fleet_summary['wpm']:.1f}  erreurs: {fleet_summary['error_rate'] * 100:.1f}%  "
+          f"latence p50/p90/p99: {latency['p50']}/{latency['p90']}/{latency['p99']} s")
+    for name in GESTURE_NAMES:
+        print(f"  {name:<15} {fleet_summary['gestures'][name]:6d} déclenchements, "
+              f"{fleet_summary['false_gestures'][name]:6d} pendant la frappe")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'fleet': fleet_summary, 'users': user_summaries,
+                       'sessions': session_summaries, 'keys': keys}, f, ensure_ascii=False, indent=2)
+        print(f"Résumé JSON: {args.json}")
+    if args.csv:
+        write_csv(args.csv, session_summaries, user_summaries, keys, args.bucket)
+        print(f"Résumés CSV: {args.csv}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,46 @@
+"""
+Compilation des dictionnaires de prédiction
+Convertit les listes de mots JSON en fichiers binaires mappables en mémoire
+
+Usage:
+    python build_dictionary.py              # toutes les langues de config
+    python build_dictionary.py mots.json sortie.atd
+"""
+
+import argparse
+import os
+import sys
+
+import config
+from utils.dictionary import compile_dictionary, compiled_path
+
+
+def main():
+    """Point d'entrée de la compilation"""
+    parser = argparse.ArgumentParser(description="Compile les dictionnaires de mots")
+    parser.add_argument('source', nargs='?', help="Liste de mots JSON")
+    parser.add_argument('output', nargs='?', help="Fichier binaire de sortie")
+    args = parser.parse_args()
+
+    if args.source:
+        jobs = [(args.source, args.output or compiled_path(args.source))]
+    else:
+        jobs = [(path, compiled_path(path)) for path in config.WORDS_DICTIONARIES.values()]
+
+    failed = False
+    for source, output in jobs:
+        if not os.path.exists(source):
+            print(f"Ignoré (introuvable): {source}")
+            continue
+        try:
+            count = compile_dictionary(source, output)
+            print(f"{source} -> {output} ({count} mots)")
+        except (OSError, ValueError) as e:
+            print(f"Erreur lors de la compilation de {source}: {e}")
+            failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
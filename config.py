@@ -9,6 +9,20 @@ WINDOW_WIDTH = 1280
 WINDOW_HEIGHT = 720
 TARGET_FPS = 60
 
+# ==================== RÉSOLUTION DE RENDU ====================
+# Les tailles et positions en pixels de ce fichier sont exprimées dans un
+# espace de mise en page de référence (LAYOUT_WIDTH x LAYOUT_HEIGHT), converti
+# au démarrage en pixels de rendu par utils.viewport
+LAYOUT_WIDTH = 1280
+LAYOUT_HEIGHT = 720
+RENDER_SCALE = 1.0  # Résolution interne relative à la fenêtre (0.5 = 4x moins de pixels à remplir)
+FULLSCREEN = False  # Plein écran à la résolution du bureau
+SMOOTH_UPSCALE = False  # Agrandissement lissé (plus coûteux) au lieu du plus proche voisin
+# Calculés par utils.viewport (ne pas modifier)
+RENDER_WIDTH = WINDOW_WIDTH
+RENDER_HEIGHT = WINDOW_HEIGHT
+LAYOUT_SCALE = 1.0  # Pixels de rendu par unité de mise en page
+
 # ==================== PARAMÈTRES MEDIAPIPE ====================
 MODEL_PATH = 'hand_landmarker.task'
 NUM_HANDS = 2
@@ -51,11 +65,13 @@ SPACE_KEY_WIDTH = 500  # Barre espace large
 BACKSPACE_KEY_WIDTH = 110
 SHIFT_KEY_WIDTH = 120
 ENTER_KEY_WIDTH = 120
+KEY_GAP = 10  # Espacement horizontal entre les touches
 
 # Tailles de police
 FONT_SIZE_NORMAL = 50
 FONT_SIZE_BIG = 80
 FONT_SIZE_SMALL = 30
+TEXT_SURFACE_CACHE_SIZE = 512  # Textes rendus gardés en cache (LRU)
 
 # Bordures et arrondis
 KEY_BORDER_RADIUS = 12
@@ -68,6 +84,7 @@ KEY_BORDER_THICKNESS_PRESSED = 6
 CURSOR_OUTER_RADIUS = 20
 CURSOR_INNER_RADIUS = 2
 CURSOR_THICKNESS = 2
+CURSOR_LABEL_FONT_SIZE = 20
 
 # Zone de texte
 TEXT_BOX_X = 100
@@ -75,6 +92,10 @@ TEXT_BOX_Y = 50
 TEXT_BOX_WIDTH = 1080
 TEXT_BOX_HEIGHT = 100
 TEXT_BOX_PADDING = 30
+TEXT_BOX_MULTILINE = True  # Retour à la ligne (ENTER) et césure des mots
+TEXT_BOX_MULTILINE_FONT_SIZE = 34  # Police du mode multi-lignes
+TEXT_BOX_LINE_PADDING = 10  # Marge verticale du mode multi-lignes
+TEXT_BOX_LINE_CACHE_SIZE = 256  # Surfaces de lignes gardées en cache
 
 THEMES = {
     'simple_dark': {
@@ -102,31 +123,104 @@ SOUND_VOLUME = 0.5  # 0.0 à 1.0
 AUTO_SAVE = True
 SAVE_FILE = 'typed_text.txt'
 SAVE_INTERVAL = 30  # Secondes
+SAVE_FSYNC = True  # Force l'écriture sur disque du journal et des instantanés (thread d'arrière-plan)
+
+# ==================== JOURNAL DE SESSION ====================
+ENABLE_SESSION_JOURNAL = True  # Frappes, pincements et gestes en binaire (analyse hors ligne)
+JOURNAL_DIR = 'data/journal'  # Segments .atj (lisibles avec numpy.memmap)
+JOURNAL_USER = None  # Nom enregistré dans l'en-tête (None = utilisateur du système)
+JOURNAL_BUFFER_SIZE = 8192  # Événements maximum en attente d'écriture
+JOURNAL_BATCH_SIZE = 256  # Événements en attente qui réveillent le thread d'écriture
+JOURNAL_FLUSH_INTERVAL = 1.0  # Secondes maximum entre deux écritures
+JOURNAL_SEGMENT_RECORDS = 65536  # Événements par segment avant rotation
+JOURNAL_MAX_SEGMENTS = 500  # Segments conservés (les plus anciens sont supprimés)
 
 # ==================== PARAMÈTRES D'ANIMATION ====================
 ENABLE_ANIMATIONS = True
 PARTICLE_COUNT = 5
 PARTICLE_LIFETIME = 30  # Frames
+PARTICLE_CAPACITY = 4096  # Particules vivantes maximum (tableaux pré-alloués)
 GLOW_INTENSITY = 0.5  # 0.0 à 1.0
+ENABLE_KEY_GLOW = True  # Halo autour de la touche survolée
+
+# ==================== QUALITÉ ADAPTATIVE ====================
+ENABLE_QUALITY_GOVERNOR = True  # Réduit les effets quand les frames dépassent le budget
+INFERENCE_FRAME_SKIP = 0  # Frames sans détection des mains entre deux détections
+QUALITY_SMOOTHING = 0.1  # Lissage exponentiel du temps de frame mesuré
+QUALITY_DOWNGRADE_RATIO = 1.0  # Temps de frame / budget au-delà duquel on dégrade
+QUALITY_UPGRADE_RATIO = 0.6  # Temps de frame / budget en deçà duquel on améliore
+QUALITY_DOWNGRADE_FRAMES = 30  # Frames consécutives lentes avant de dégrader
+QUALITY_UPGRADE_FRAMES = 180  # Frames consécutives rapides avant d'améliorer
+# Paliers du plus beau au plus léger: réglages forcés (cumulés) à chaque palier
+QUALITY_TIERS = [
+    ('Haute', {}),
+    ('Moyenne', {'ENABLE_KEY_GLOW': False, 'ENABLE_TRAIL_EFFECT': False}),
+    ('Basse', {'ENABLE_ANIMATIONS': False, 'ENABLE_ENERGY_WAVES': False, 'SHOW_HAND_LANDMARKS': False}),
+    ('Minimale', {'ENABLE_SMART_ZONES': False, 'INFERENCE_FRAME_SKIP': 1}),
+]
 
 # ==================== PARAMÈTRES DE DEBUG ====================
 SHOW_FPS = True
+SHOW_CAMERA = True  # False: fond statique du thème et rendu par zones modifiées (touche V)
+HUD_REFRESH_RATE = 4  # Rafraîchissements par seconde du FPS et du temps affichés
 SHOW_HAND_LANDMARKS = False
 DEBUG_MODE = False
 
 # ==================== PARAMÈTRES STATISTIQUES ====================
 ENABLE_STATS = True
 STATS_WPM_WINDOW = 60  # Fenêtre de calcul WPM en secondes
+STATS_HISTORY_SIZE = 10000  # Nombre maximal de frappes conservées dans l'historique
 STATS_POSITION_X = 100
 STATS_POSITION_Y = 170
 STATS_FONT_SIZE = 25
+STATUS_BAR_HEIGHT = 40
+
+# ==================== ANALYSE PAR TOUCHE ====================
+ENABLE_KEY_ANALYTICS = True  # Temps et corrections par touche et par bigramme
+ANALYTICS_BIGRAM_MAX_GAP = 2.0  # Intervalle maximal (s) pour compter une transition
+ANALYTICS_MIN_SAMPLES = 3  # Mesures minimales pour classer une transition
+SHOW_KEY_HEATMAP = False  # Carte de chaleur sous les touches (touche H)
+HEATMAP_METRIC = 'error_rate'  # 'presses', 'hover_time', 'latency' ou 'error_rate'
+HEATMAP_OPACITY = 0.35  # Opacité de la carte de chaleur
+HEATMAP_REFRESH_RATE = 0.5  # Mises à jour de la carte par seconde
 
 # ==================== PARAMÈTRES GESTES AVANCÉS ====================
 ENABLE_ADVANCED_GESTURES = True
-GESTURE_COOLDOWN = 1.0  # Secondes entre deux gestes
+GESTURE_COOLDOWN = 1.0  # Secondes entre deux déclenchements d'un même geste
+GESTURE_CONFIRM_FRAMES = 3  # Frames consécutives avant de confirmer un geste maintenu
+GESTURE_CONFIRM_TIME = 0.15  # Secondes de maintien avant confirmation (en plus des frames)
+GESTURE_HOLD_TIMES = {'peace_sign': 0.5, 'hands_together': 0.3}  # Maintien propre à certains gestes
+GESTURE_RELEASE_FRAMES = 3  # Frames sans le geste avant qu'il puisse être redéclenché
+PAUSE_FPS = 10  # Images par seconde en pause (détection des mains jointes uniquement)
 SWIPE_THRESHOLD = 150  # Pixels pour détecter un swipe
+SWIPE_TIME_WINDOW = 0.4  # Secondes: durée maximale du mouvement d'un swipe
+SWIPE_MIN_VELOCITY = 600  # Pixels par seconde
+SWIPE_MAX_SLOPE = 0.5  # Déplacement vertical maximal / déplacement horizontal
+GESTURE_HISTORY_SIZE = 64  # Positions horodatées gardées par main
 HANDS_TOGETHER_THRESHOLD = 100  # Distance pour mains jointes
 
+# ==================== POSES APPRISES ====================
+ENABLE_POSE_MODEL = True  # Modèle appris (python train_poses.py) à la place des règles si présent
+POSE_MODEL_FILE = 'data/pose_model.npz'  # Prototypes k-NN
+POSE_RECORDINGS_DIR = 'data/poses'  # Landmarks étiquetés (<pose>.npy)
+POSE_KNN_NEIGHBORS = 5  # Voisins consultés
+POSE_PROTOTYPES_PER_CLASS = 64  # Prototypes gardés par pose (k-moyennes)
+POSE_MIN_CONFIDENCE = 0.6  # Part minimale des voix pour reconnaître une pose
+POSE_REJECT_MARGIN = 1.5  # Distance de rejet / distance typique des exemples
+
+# ==================== GESTES PERSONNALISÉS ====================
+ENABLE_GESTURE_TEMPLATES = True  # Tracés enregistrés par l'utilisateur (touche N)
+GESTURE_TEMPLATES_FILE = 'data/gesture_templates.json'  # Modèles et actions associées
+GESTURE_TEMPLATE_POINTS = 32  # Points de rééchantillonnage par main
+GESTURE_TEMPLATE_WINDOW = 1.5  # Secondes: durée maximale d'un tracé (≥ GESTURE_TEMPLATE_DURATIONS)
+GESTURE_TEMPLATE_HISTORY_SIZE = 128  # Positions gardées par main
+GESTURE_TEMPLATE_DURATIONS = (1.5, 1.0, 0.6)  # Secondes: durées des tracés récents comparés aux modèles
+GESTURE_TEMPLATE_MIN_PATH = 200  # Pixels parcourus pour tenter une reconnaissance
+GESTURE_TEMPLATE_THRESHOLD = 0.1  # Écart quadratique moyen maximal (forme normalisée)
+GESTURE_TEMPLATE_ROTATION_INVARIANT = False  # Reconnaître un tracé tourné
+GESTURE_TEMPLATE_COARSE_STEP = 4  # Un point sur N pour l'élagage des modèles
+GESTURE_TEMPLATE_DEFAULT_ACTION = None  # Action des nouveaux gestes (modifiable dans le fichier)
+
 # ==================== ZONES INTELLIGENTES DU CLAVIER ====================
 ENABLE_SMART_ZONES = False
 LEFT_ZONE_COLOR_TINT = (-10, -5, 15)  # Teinte bleutée
@@ -144,6 +238,44 @@ MAX_PREDICTIONS = 3  # Nombre de suggestions
 PREDICTION_MIN_CHARS = 2  # Caractères minimum avant suggestion
 WORDS_DICTIONARY_FR = 'data/words_fr.json'
 WORDS_DICTIONARY_EN = 'data/words_en.json'
+WORDS_DICTIONARY_ES = 'data/words_es.json'
+WORDS_DICTIONARIES = {
+    'FR': WORDS_DICTIONARY_FR,
+    'EN': WORDS_DICTIONARY_EN,
+    'ES': WORDS_DICTIONARY_ES
+}
+COMPILED_DICTIONARY_DIR = 'data/compiled'  # Dictionnaires binaires (python build_dictionary.py)
+
+# ==================== DÉCODAGE PROBABILISTE DES TOUCHES ====================
+ENABLE_KEY_DECODER = True  # Modèle de toucher + n-grammes au lieu des rectangles stricts
+KEY_DECODER_SIGMA_SCALE = 0.3  # Écart-type a priori (fraction de la taille de touche)
+KEY_DECODER_PRIOR_WEIGHT = 20  # Poids (en appuis) de l'a priori face aux données
+KEY_DECODER_MAX_DISTANCE = 40  # Distance max (pixels) hors d'une touche candidate
+KEY_DECODER_LM_WEIGHT = 1.0  # Poids du modèle de langue
+KEY_DECODER_NGRAM_ORDER = 3  # Trigrammes de caractères
+KEY_DECODER_NGRAM_INTERPOLATION = 0.7  # Poids du contexte le plus long
+KEY_DECODER_TRAINING_WORDS = 5000  # Mots du dictionnaire pour amorcer le modèle
+TOUCH_MODEL_FILE = 'data/touch_model.json'  # Modèle de toucher de l'utilisateur
+TOUCH_SESSIONS_FILE = 'data/touch_sessions.jsonl'  # Appuis enregistrés (évaluation)
+
+# ==================== AUTOCORRECTION ====================
+ENABLE_AUTOCORRECT = True  # Correction du mot à l'appui sur espace (backspace = annuler)
+AUTOCORRECT_VOCABULARY_SIZE = 30000  # Mots candidats indexés
+AUTOCORRECT_MIN_WORD_LENGTH = 2  # Longueur minimale d'un mot corrigé
+AUTOCORRECT_MAX_WORD_LENGTH = 20  # Longueur maximale indexée
+AUTOCORRECT_NEIGHBORHOOD = 4.0  # Écart de log-vraisemblance des touches voisines
+AUTOCORRECT_FREQUENCY_WEIGHT = 1.0  # Poids de la fréquence des mots
+AUTOCORRECT_MARGIN = 2.0  # Gain de score minimal pour remplacer le mot tapé
+
+# ==================== SAISIE GESTUELLE (SWIPE) ====================
+ENABLE_SWIPE_TYPING = False  # Tracer un mot en gardant le pincement (touche W)
+SWIPE_SAMPLE_POINTS = 32  # Points de rééchantillonnage des trajectoires
+SWIPE_VOCABULARY_SIZE = 20000  # Mots les plus fréquents gardés comme modèles
+SWIPE_MIN_PATH_LENGTH = 90  # Pixels parcourus pour distinguer swipe et appui
+SWIPE_KEY_RADIUS = 90  # Rayon (pixels) des touches candidates de début/fin
+SWIPE_LOCATION_SIGMA = 40.0  # Tolérance du canal position (pixels)
+SWIPE_SHAPE_SIGMA = 0.15  # Tolérance du canal forme (normalisé)
+SWIPE_FREQUENCY_WEIGHT = 0.5  # Poids de la fréquence des mots
 
 # ==================== MULTI-LANGUES ====================
 DEFAULT_LANGUAGE = 'FR'
@@ -176,16 +308,25 @@ TRAIL_FADE_SPEED = 0.1
 ENABLE_COMBO_SYSTEM = True
 COMBO_TIMEOUT = 2.0  # Secondes sans frappe pour réinitialiser combo
 COMBO_MULTIPLIER_THRESHOLD = 5  # Frappes pour activer multiplicateur
+COMBO_POSITION_Y = 100
+COMBO_FONT_SIZE = 60
 
 ENABLE_ENERGY_WAVES = True
 WAVE_EXPANSION_SPEED = 5  # Pixels par frame
 WAVE_MAX_RADIUS = 50
+EFFECT_ALPHA_BUCKETS = 16  # Niveaux d'alpha des sprites d'effets pré-rendus
 
 # ==================== OPTIMISATION VITESSE ====================
 FAST_MODE = False  # Mode rapide (réduit seuils)
 FAST_MODE_PINCH_THRESHOLD = 30  # Réduit de 35 à 30
-ENABLE_TAP_MODE = False  # Mode tap (proximité au lieu de pincement)
-TAP_PROXIMITY_THRESHOLD = 40  # Distance doigt-touche pour tap
+ENABLE_TAP_MODE = False  # Mode tap: appui vers l'avant au lieu du pincement (touche A)
+TAP_PROXIMITY_THRESHOLD = 40  # Rayon (pixels) d'immobilité pour l'appui par temporisation
+TAP_PRESS_DEPTH = 25  # Avancée de l'index (pixels) déclenchant l'appui
+TAP_RELEASE_DEPTH = 12  # Avancée sous laquelle l'appui est relâché (hystérésis)
+TAP_PRESS_VELOCITY = 150  # Vitesse d'avancée minimale (pixels/s) pour l'appui
+TAP_MOTION_VELOCITY = 60  # Vitesse marquant le début de la poussée (position figée)
+TAP_BASELINE_ADAPTATION = 0.05  # Suivi de la profondeur de repos (0-1 par frame)
+TAP_DWELL_TIME = 0.8  # Secondes d'immobilité pour un appui (0 = désactivé)
 
 # ==================== CALIBRATION ====================
 USER_PREFERENCES_FILE = 'data/user_preferences.json'
@@ -197,3 +338,25 @@ HISTORY_FILE = 'data/history.json'
 HISTORY_MAX_ENTRIES = 100
 SNIPPETS_FILE = 'data/snippets.json'
 ENABLE_AUTO_COPY = False  # Copie automatique vers presse-papier
+
+# ==================== MISE À L'ÉCHELLE ====================
+# Réglages exprimés en pixels de mise en page, convertis en pixels de rendu
+LAYOUT_SCALED_SETTINGS = (
+    'PINCH_THRESHOLD', 'FAST_MODE_PINCH_THRESHOLD',
+    'KEY_WIDTH', 'KEY_HEIGHT', 'KEY_SPACING', 'KEY_START_X', 'KEY_START_Y', 'KEY_GAP',
+    'SPACE_KEY_WIDTH', 'BACKSPACE_KEY_WIDTH', 'SHIFT_KEY_WIDTH', 'ENTER_KEY_WIDTH',
+    'FONT_SIZE_NORMAL', 'FONT_SIZE_BIG', 'FONT_SIZE_SMALL',
+    'KEY_BORDER_RADIUS', 'TEXT_BOX_BORDER_RADIUS',
+    'CURSOR_OUTER_RADIUS', 'CURSOR_LABEL_FONT_SIZE',
+    'TEXT_BOX_X', 'TEXT_BOX_Y', 'TEXT_BOX_WIDTH', 'TEXT_BOX_HEIGHT', 'TEXT_BOX_PADDING',
+    'TEXT_BOX_MULTILINE_FONT_SIZE', 'TEXT_BOX_LINE_PADDING',
+    'STATS_POSITION_X', 'STATS_POSITION_Y', 'STATS_FONT_SIZE', 'STATUS_BAR_HEIGHT',
+    'COMBO_POSITION_Y', 'COMBO_FONT_SIZE',
+    'SWIPE_THRESHOLD', 'SWIPE_MIN_VELOCITY', 'HANDS_TOGETHER_THRESHOLD',
+    'GESTURE_TEMPLATE_MIN_PATH',
+    'KEY_DECODER_MAX_DISTANCE',
+    'SWIPE_MIN_PATH_LENGTH', 'SWIPE_KEY_RADIUS', 'SWIPE_LOCATION_SIGMA',
+    'WAVE_EXPANSION_SPEED', 'WAVE_MAX_RADIUS',
+    'TAP_PROXIMITY_THRESHOLD', 'TAP_PRESS_DEPTH', 'TAP_RELEASE_DEPTH',
+    'TAP_PRESS_VELOCITY', 'TAP_MOTION_VELOCITY',
+)
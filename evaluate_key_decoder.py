@@ -0,0 +1,53 @@
+"""
+Évaluation du décodage probabiliste des touches
+Rejoue les appuis enregistrés (config.TOUCH_SESSIONS_FILE) et compare le
+décodage par rectangles stricts au décodage probabiliste. Chaque session est
+décodée avec des modèles appris sur les autres sessions uniquement.
+
+Usage:
+    python evaluate_key_decoder.py [sessions.jsonl] [--layout QWERTY] [--language FR]
+"""
+
+import argparse
+import json
+import os
+import sys
+
+import config
+from utils.dictionary import DictionaryManager
+from utils.keyboard import VirtualKeyboard
+from utils.key_decoder import evaluate_decoder
+
+
+def main():
+    """Point d'entrée de l'évaluation"""
+    parser = argparse.ArgumentParser(description="Évalue le décodage des touches")
+    parser.add_argument('sessions', nargs='?', default=config.TOUCH_SESSIONS_FILE,
+                        help="Fichier JSON lines des appuis enregistrés")
+    parser.add_argument('--layout', default=config.DEFAULT_LAYOUT, help="Layout du clavier")
+    parser.add_argument('--language', default=config.DEFAULT_LANGUAGE, help="Langue du dictionnaire")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.sessions):
+        print(f"Aucune session enregistrée: {args.sessions}")
+        return 1
+
+    with open(args.sessions, 'r', encoding='utf-8') as f:
+        sessions = [json.loads(line) for line in f if line.strip()]
+
+    dictionaries = DictionaryManager(args.language)
+    keyboard = VirtualKeyboard(args.layout)
+    results = evaluate_decoder(keyboard, sessions, dictionaries.current)
+    print(f"{len(sessions)} session(s) évaluée(s) (chacune avec les modèles appris sur les autres)")
+    for mode, metrics in results.items():
+        print(
+            f"  {mode:<14} appuis: {metrics['presses']:6d}  "
+            f"erreurs: {metrics['error_rate'] * 100:5.1f}%  WPM estimé: {metrics['wpm']:5.1f}"
+        )
+
+    dictionaries.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,8 +9,6 @@ GitHub: https://github.com/machideau/air-typing
 import cv2
 import pygame
 import numpy as np
-import time
-import os
 from datetime import datetime
 
 # Imports des modules personnalisés
@@ -24,9 +22,24 @@ from utils import (
     ParticleSystem,
     AudioManager,
     StatsTracker,
-    GestureRecognizer
+    GestureRecognizer,
+    DictionaryManager
 )
+from utils.swipe_decoder import SwipeDecoder, SwipeCapture
+from utils.key_decoder import ProbabilisticKeyDecoder
+from utils.autocorrect import WordCorrector
+from utils.key_analytics import KeyAnalytics
+from utils.journal import SessionJournal
+from utils.gesture_events import GestureEvent, SwipeEvent, TemplateEvent
+from utils.gesture_templates import GestureTemplateRecognizer
+from utils.persistence import TextPersistence
+from utils.fonts import get_font, clear_text_cache
+from utils.renderer import DirtyRectRenderer
+from utils.viewport import Viewport
+from utils.quality import QualityGovernor
+from themes import get_palette
 from utils.ui_components import (
+    EffectAtlas,
     StatsDisplay,
     TrailEffect,
     ComboIndicator,
@@ -43,13 +56,22 @@ class AirTypingApp:
         pygame.init()
         
         # Créer la fenêtre
-        self.screen = pygame.display.set_mode((config.WINDOW_WIDTH, config.WINDOW_HEIGHT))
+        if config.FULLSCREEN:
+            self.window = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+        else:
+            self.window = pygame.display.set_mode((config.WINDOW_WIDTH, config.WINDOW_HEIGHT))
         pygame.display.set_caption("Air-Typing - Clavier Virtuel par Gestes")
         
+        # Résolution interne: la mise en page est convertie en pixels de rendu
+        # avant la création des composants, puis agrandie dans la fenêtre
+        self.viewport = Viewport(self.window.get_size())
+        self.viewport.apply()
+        self.screen = self.viewport.create_render_surface(self.window)
+        
         # Charger les polices
-        self.font_normal = pygame.font.Font(None, config.FONT_SIZE_NORMAL)
-        self.font_big = pygame.font.Font(None, config.FONT_SIZE_BIG)
-        self.font_small = pygame.font.Font(None, config.FONT_SIZE_SMALL)
+        self.font_normal = get_font(config.FONT_SIZE_NORMAL)
+        self.font_big = get_font(config.FONT_SIZE_BIG)
+        self.font_small = get_font(config.FONT_SIZE_SMALL)
         
         # Initialiser les composants
         self.hand_detector = HandDetector()
@@ -57,16 +79,68 @@ class AirTypingApp:
         self.text_box = TextBox()
         self.status_bar = StatusBar()
         self.cursor = Cursor()
-        self.particle_system = ParticleSystem()
+        # Atlas de sprites partagé par les particules, traînées et ondes
+        self.effect_atlas = EffectAtlas()
+        self.particle_system = ParticleSystem(atlas=self.effect_atlas)
         self.audio_manager = AudioManager()
         
         # Nouveaux composants
         self.stats_tracker = StatsTracker()
         self.gesture_recognizer = GestureRecognizer()
         self.stats_display = StatsDisplay()
-        self.trail_effect = TrailEffect()
+        self.trail_effect = TrailEffect(self.effect_atlas)
         self.combo_indicator = ComboIndicator()
-        self.energy_waves = EnergyWaveSystem()
+        self.energy_waves = EnergyWaveSystem(self.effect_atlas)
+        
+        # Rendu par rectangles modifiés (caméra masquée)
+        self.renderer = DirtyRectRenderer(
+            self.screen, lambda rects: self.viewport.present(self.screen, self.window, rects)
+        )
+        self._background_key = None
+        
+        # Dictionnaires de prédiction (mappés en mémoire)
+        self.dictionaries = DictionaryManager()
+        
+        # Décodage probabiliste des appuis
+        self.keyboard.key_decoder = ProbabilisticKeyDecoder(self.keyboard, self.dictionaries.current)
+        
+        # Autocorrection par mot (utilise le modèle de toucher du décodeur)
+        self.keyboard.autocorrector = WordCorrector(self.keyboard.key_decoder, self.dictionaries.current)
+        
+        # Statistiques par touche et par bigramme (carte de chaleur)
+        if config.ENABLE_KEY_ANALYTICS:
+            self.keyboard.analytics = KeyAnalytics(self.keyboard)
+        
+        # Journal binaire de la session (écrit en arrière-plan)
+        self.journal = SessionJournal() if config.ENABLE_SESSION_JOURNAL else None
+        self.keyboard.journal = self.journal
+        
+        # Saisie gestuelle (swipe) - modèles construits seulement si le mode est actif
+        self.swipe_decoder = SwipeDecoder(
+            self.keyboard,
+            self.dictionaries.current if config.ENABLE_SWIPE_TYPING else None
+        )
+        self.swipe_capture = SwipeCapture()
+        
+        # Gestes personnalisés (tracés enregistrés) et actions qui peuvent leur être associées
+        self.gesture_templates = GestureTemplateRecognizer() if config.ENABLE_GESTURE_TEMPLATES else None
+        self.gesture_actions = {
+            'clear_text': self.keyboard.clear_text,
+            'save_text': self._save_text,
+            'cycle_theme': self._cycle_theme,
+            'toggle_sound': self._toggle_sound,
+            'toggle_camera': self._toggle_camera,
+            'change_layout': self._change_layout,
+        }
+        
+        # Gestes confirmés (maintenus puis relâchés) publiés par le reconnaisseur
+        events = self.gesture_recognizer.events
+        events.subscribe(GestureEvent, lambda event: self._journal_gesture(event.name))
+        events.subscribe('peace_sign', self._on_peace_sign)
+        events.subscribe('thumbs_up', self._on_thumbs_up)
+        events.subscribe(SwipeEvent, self._on_swipe)
+        events.subscribe('hands_together', lambda event: self._toggle_pause())
+        events.subscribe(TemplateEvent, self._on_template)
         
         # Initialiser la webcam
         self.cap = cv2.VideoCapture(config.CAMERA_INDEX)
@@ -76,48 +150,30 @@ class AirTypingApp:
         # État de l'application
         self.running = True
         self.current_theme_name = config.DEFAULT_THEME
-        self.current_theme = config.THEMES[self.current_theme_name]
+        self.current_theme = get_palette(self.current_theme_name)
         self.show_menu = False
+        # En pause, seules les mains jointes sont suivies (reprise)
+        self.paused = False
         
         # FPS
         self.clock = pygame.time.Clock()
-        self.fps = 0
         
-        # Sauvegarde automatique
-        self.last_save_time = time.time()
+        # Qualité adaptative et cadence de détection des mains
+        self.quality = QualityGovernor()
+        self.frame_index = 0
+        self._last_detection = None
+        self.fps = 0
         
-        # Charger le texte sauvegardé si existant
-        self._load_saved_text()
-    
-    def _load_saved_text(self):
-        """Charge le texte sauvegardé précédemment"""
-        if os.path.exists(config.SAVE_FILE):
-            try:
-                with open(config.SAVE_FILE, 'r', encoding='utf-8') as f:
-                    saved_text = f.read()
-                    self.keyboard.set_text(saved_text)
-                    print(f"Texte chargé depuis {config.SAVE_FILE}")
-            except Exception as e:
-                print(f"Erreur lors du chargement du texte: {e}")
+        # Sauvegarde: texte restauré (instantané + journal), puis chaque
+        # modification est journalisée par un thread d'arrière-plan
+        self.persistence = TextPersistence()
+        self.keyboard.set_text(self.persistence.recover())
+        self.keyboard.persistence = self.persistence
+        self.persistence.start()
     
     def _save_text(self):
-        """Sauvegarde le texte actuel"""
-        try:
-            with open(config.SAVE_FILE, 'w', encoding='utf-8') as f:
-                f.write(self.keyboard.get_text())
-            print(f"Texte sauvegardé dans {config.SAVE_FILE}")
-        except Exception as e:
-            print(f"Erreur lors de la sauvegarde du texte: {e}")
-    
-    def _auto_save(self):
-        """Sauvegarde automatique périodique"""
-        if not config.AUTO_SAVE:
-            return
-        
-        current_time = time.time()
-        if current_time - self.last_save_time >= config.SAVE_INTERVAL:
-            self._save_text()
-            self.last_save_time = current_time
+        """Demande une sauvegarde du texte actuel (écrite en arrière-plan)"""
+        self.persistence.request_snapshot()
     
     def _cycle_theme(self):
         """Passe au thème suivant"""
@@ -125,9 +181,50 @@ class AirTypingApp:
         current_index = theme_names.index(self.current_theme_name)
         next_index = (current_index + 1) % len(theme_names)
         self.current_theme_name = theme_names[next_index]
-        self.current_theme = config.THEMES[self.current_theme_name]
+        self.current_theme = get_palette(self.current_theme_name)
+        
+        # Les sprites et textes de l'ancien thème ne serviront plus
+        self.effect_atlas.clear()
+        self.particle_system.invalidate_sprites()
+        clear_text_cache()
+        self.renderer.invalidate()
         print(f"Thème changé: {self.current_theme['name']}")
     
+    def _toggle_sound(self):
+        """Active ou désactive le son"""
+        enabled = self.audio_manager.toggle()
+        print(f"Son: {'Activé' if enabled else 'Désactivé'}")
+    
+    def _toggle_camera(self):
+        """Affiche ou masque la caméra (fond statique + rendu partiel)"""
+        config.SHOW_CAMERA = not config.SHOW_CAMERA
+        self.renderer.invalidate()
+        print(f"Caméra: {'Affichée' if config.SHOW_CAMERA else 'Masquée'}")
+    
+    def _change_layout(self):
+        """Bascule entre QWERTY et AZERTY"""
+        current_layout = self.keyboard.layout_name
+        new_layout = 'AZERTY' if current_layout == 'QWERTY' else 'QWERTY'
+        self.keyboard.change_layout(new_layout)
+        if config.ENABLE_SWIPE_TYPING:
+            self.swipe_decoder.rebuild(self.keyboard, self.dictionaries.current, background=True)
+        print(f"Layout changé: {new_layout}")
+    
+    def _toggle_pause(self):
+        """Suspend ou reprend la saisie (détection des gestes et rendu)"""
+        self.paused = not self.paused
+        if self.paused:
+            # Dernière image assombrie, gardée telle quelle pendant la pause
+            overlay = pygame.Surface((config.RENDER_WIDTH, config.RENDER_HEIGHT), pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, 160))
+            self.screen.blit(overlay, (0, 0))
+            label = self.font_big.render("PAUSE", True, self.current_theme['text'])
+            self.screen.blit(label, label.get_rect(center=(config.RENDER_WIDTH // 2, config.RENDER_HEIGHT // 2)))
+            self.viewport.present(self.screen, self.window)
+        else:
+            self.renderer.invalidate()
+        print(f"Pause: {'Activée' if self.paused else 'Désactivée'}")
+    
     def _handle_events(self):
         """Gère les événements Pygame"""
         for event in pygame.event.get():
@@ -153,15 +250,45 @@ class AirTypingApp:
                 
                 elif event.key == pygame.K_m:
                     # Toggle son
-                    enabled = self.audio_manager.toggle()
-                    print(f"Son: {'Activé' if enabled else 'Désactivé'}")
+                    self._toggle_sound()
                 
                 elif event.key == pygame.K_l:
                     # Changer de layout
-                    current_layout = self.keyboard.layout_name
-                    new_layout = 'AZERTY' if current_layout == 'QWERTY' else 'QWERTY'
-                    self.keyboard.change_layout(new_layout)
-                    print(f"Layout changé: {new_layout}")
+                    self._change_layout()
+                
+                elif event.key == pygame.K_k:
+                    # Changer la langue du dictionnaire
+                    language = self.dictionaries.cycle_language()
+                    self.keyboard.key_decoder.retrain_language_model(self.dictionaries.current, background=True)
+                    self.keyboard.autocorrector.rebuild(self.dictionaries.current, background=True)
+                    if config.ENABLE_SWIPE_TYPING:
+                        self.swipe_decoder.rebuild(self.keyboard, self.dictionaries.current, background=True)
+                    print(f"Langue du dictionnaire: {language}")
+                
+                elif event.key == pygame.K_a:
+                    # Toggle mode tap (appui vers l'avant / temporisation)
+                    config.ENABLE_TAP_MODE = not config.ENABLE_TAP_MODE
+                    print(f"Mode tap: {'Activé' if config.ENABLE_TAP_MODE else 'Désactivé (pincement)'}")
+                
+                elif event.key == pygame.K_w:
+                    # Toggle saisie gestuelle
+                    config.ENABLE_SWIPE_TYPING = not config.ENABLE_SWIPE_TYPING
+                    if config.ENABLE_SWIPE_TYPING:
+                        self.swipe_decoder.rebuild(self.keyboard, self.dictionaries.current, background=True)
+                    print(f"Saisie gestuelle: {'Activée' if config.ENABLE_SWIPE_TYPING else 'Désactivée'}")
+                
+                elif event.key == pygame.K_v:
+                    # Afficher/masquer la caméra (fond statique + rendu partiel)
+                    self._toggle_camera()
+                
+                elif event.key == pygame.K_h:
+                    # Afficher/masquer la carte de chaleur des touches
+                    config.SHOW_KEY_HEATMAP = not config.SHOW_KEY_HEATMAP
+                    print(f"Carte de chaleur: {'Affichée' if config.SHOW_KEY_HEATMAP else 'Masquée'}")
+                
+                elif event.key == pygame.K_n and self.gesture_templates is not None:
+                    # Enregistrer un geste personnalisé (N pour commencer puis terminer)
+                    self._toggle_gesture_recording()
                 
                 elif event.key == pygame.K_r:
                     # Réinitialiser les stats
@@ -169,14 +296,18 @@ class AirTypingApp:
                     print("Statistiques réinitialisées")
                 
                 elif event.key == pygame.K_z:
-                    # Toggle zones intelligentes
-                    config.ENABLE_SMART_ZONES = not config.ENABLE_SMART_ZONES
-                    print(f"Zones intelligentes: {'Activées' if config.ENABLE_SMART_ZONES else 'Désactivées'}")
+                    # Toggle zones intelligentes (la qualité adaptative peut les suspendre)
+                    enabled = self.quality.toggle('ENABLE_SMART_ZONES')
+                    print(f"Zones intelligentes: {'Activées' if enabled else 'Désactivées'}")
                 
                 elif event.key == pygame.K_g:
                     # Toggle gestes avancés
                     config.ENABLE_ADVANCED_GESTURES = not config.ENABLE_ADVANCED_GESTURES
                     print(f"Gestes avancés: {'Activés' if config.ENABLE_ADVANCED_GESTURES else 'Désactivés'}")
+                
+                elif event.key == pygame.K_p:
+                    # Pause / reprise (aussi avec les mains jointes)
+                    self._toggle_pause()
     
     def _process_frame(self):
         """Traite une frame de la webcam"""
@@ -192,13 +323,18 @@ class AirTypingApp:
     
     def _draw_background(self, frame_rgb):
         """Dessine le fond (webcam)"""
+        # Ramener la frame à la résolution de rendu
+        if frame_rgb.shape[1] != config.RENDER_WIDTH or frame_rgb.shape[0] != config.RENDER_HEIGHT:
+            frame_rgb = cv2.resize(frame_rgb, (config.RENDER_WIDTH, config.RENDER_HEIGHT),
+                                   interpolation=cv2.INTER_AREA)
+        
         # Convertir la frame en surface Pygame
         frame_surface = pygame.surfarray.make_surface(cv2.transpose(frame_rgb))
         self.screen.blit(frame_surface, (0, 0))
         
         # Overlay semi-transparent pour améliorer la lisibilité
-        overlay = pygame.Surface((config.WINDOW_WIDTH, config.WINDOW_HEIGHT), pygame.SRCALPHA)
-        overlay.fill(self.current_theme['background'] + (50,))
+        overlay = pygame.Surface((config.RENDER_WIDTH, config.RENDER_HEIGHT), pygame.SRCALPHA)
+        overlay.fill(self.current_theme['background_overlay'])
         self.screen.blit(overlay, (0, 0))
     
     def run(self):
@@ -211,6 +347,13 @@ class AirTypingApp:
         print("  C: Effacer le texte")
         print("  M: Activer/Désactiver le son")
         print("  L: Changer de layout (QWERTY/AZERTY)")
+        print("  K: Changer la langue du dictionnaire")
+        print("  W: Activer/Désactiver la saisie gestuelle (swipe)")
+        print("  A: Basculer entre pincement et mode tap")
+        print("  V: Afficher/masquer la caméra")
+        print("  H: Afficher/masquer la carte de chaleur des touches")
+        print("  N: Enregistrer un geste personnalisé (début/fin)")
+        print("  P: Pause / reprise (ou mains jointes)")
         print("========================\n")
         
         while self.running:
@@ -222,23 +365,31 @@ class AirTypingApp:
             if frame_rgb is None:
                 break
             
-            # Détecter les deux mains
+            # Détecter les deux mains (une frame sur INFERENCE_FRAME_SKIP + 1)
             timestamp_ms = pygame.time.get_ticks()
-            left_hand, right_hand, landmarks = self.hand_detector.detect(frame_rgb, timestamp_ms)
-            
-            # Mettre à jour l'historique des gestes
-            if config.ENABLE_ADVANCED_GESTURES:
-                self.gesture_recognizer.update_history(left_hand, right_hand)
-                self._process_gestures(landmarks, left_hand, right_hand)
+            self.frame_index += 1
+            if self._last_detection is None or self.frame_index % (config.INFERENCE_FRAME_SKIP + 1) == 0:
+                self._last_detection = self.hand_detector.detect(frame_rgb, timestamp_ms)
+            left_hand, right_hand, landmarks = self._last_detection
             
-            # Dessiner le fond
-            self._draw_background(frame_rgb)
+            # Gestes avancés (en pause, seules les mains jointes sont suivies)
+            if config.ENABLE_ADVANCED_GESTURES or self.paused:
+                self.gesture_recognizer.process(landmarks, left_hand, right_hand, self.paused)
+            if self.paused:
+                # Ni saisie ni rendu: l'image de pause reste affichée
+                self.clock.tick(config.PAUSE_FPS)
+                continue
+            if self.gesture_templates is not None:
+                self._process_gesture_templates(left_hand, right_hand)
             
             # Mettre à jour le clavier avec les deux mains
-            typed_char = self.keyboard.update(
-                left_hand['pos'], left_hand['clicking'],
-                right_hand['pos'], right_hand['clicking']
-            )
+            if config.ENABLE_SWIPE_TYPING:
+                typed_char = self._update_swipe_typing(left_hand, right_hand)
+            else:
+                typed_char = self.keyboard.update(
+                    left_hand['pos'], left_hand['clicking'],
+                    right_hand['pos'], right_hand['clicking']
+                )
 
             # DEBUG: Log clicking state occasionally
             if left_hand['clicking'] or right_hand['clicking']:
@@ -251,7 +402,12 @@ class AirTypingApp:
             
             # Tracker les statistiques
             if typed_char:
-                self.stats_tracker.track_keystroke(typed_char)
+                if typed_char == "<-":
+                    self.stats_tracker.track_keystroke(typed_char)
+                else:
+                    # Un mot tracé compte pour tous ses caractères
+                    for char in typed_char:
+                        self.stats_tracker.track_keystroke(char)
             
             # Mettre à jour le combo
             self.combo_indicator.update(typed_char is not None)
@@ -285,124 +441,265 @@ class AirTypingApp:
                         self.current_theme['key_hover']
                     )
             
-            # Dessiner le clavier (avec zones intelligentes)
-            self.keyboard.draw(self.screen, self.current_theme, self.font_normal)
-            
-            
-            # Dessiner la zone de texte
-            current_text = self.keyboard.get_text()
-            if len(current_text) > 0 and timestamp_ms % 60 == 0:  # Log occasionally
-                print(f"DEBUG: Current text length: {len(current_text)}, last 20 chars: '{current_text[-20:]}'")
-            self.text_box.draw(
-                self.screen,
-                current_text,
-                self.current_theme,
-                self.font_big
-            )
-            
-            # Mettre à jour et dessiner les traînées
+            # Mettre à jour les animations et le HUD
             self.trail_effect.update(left_hand['pos'], right_hand['pos'])
-            self.trail_effect.draw(self.screen, self.current_theme)
-            
-            # Dessiner les deux curseurs
-            self.cursor.update()
-            if left_hand['detected'] and left_hand['pos']:
-                self.cursor.draw_left(self.screen, left_hand['pos'], self.current_theme, left_hand['clicking'])
-            if right_hand['detected'] and right_hand['pos']:
-                self.cursor.draw_right(self.screen, right_hand['pos'], self.current_theme, right_hand['clicking'])
-            
-            # Mettre à jour et dessiner les particules
             self.particle_system.update()
-            self.particle_system.draw(self.screen)
-            
-            # Mettre à jour et dessiner les ondes d'énergie
             self.energy_waves.update()
-            self.energy_waves.draw(self.screen)
-            
-            # Dessiner le combo
-            self.combo_indicator.draw(self.screen, self.current_theme)
+            self.cursor.update()
             
-            # Dessiner les statistiques
             stats = self.stats_tracker.get_stats_summary()
-            self.stats_display.draw(self.screen, stats, self.current_theme, self.font_small)
+            self.stats_display.update(stats, self.current_theme, self.font_small)
+            self.status_bar.update(
+                self.fps, self.current_theme['name'],
+                self.quality.tier_name if config.ENABLE_QUALITY_GOVERNOR else None
+            )
             
-            # Dessiner la barre d'état
-            self.status_bar.update(self.fps, self.current_theme['name'])
-            self.status_bar.draw(self.screen, self.current_theme, self.font_small)
+            current_text = self.keyboard.get_text()
+            if len(current_text) > 0 and timestamp_ms % 60 == 0:  # Log occasionally
+                print(f"DEBUG: Current text length: {len(current_text)}, last 20 chars: '{current_text[-20:]}'")
             
-            # Dessiner les landmarks si debug activé
-            if config.SHOW_HAND_LANDMARKS and landmarks:
-                self._draw_landmarks(landmarks)
+            # Dessiner la scène et mettre à jour l'affichage
+            widgets = self._scene_widgets(current_text)
+            draw_overlays = lambda screen: self._draw_overlays(screen, left_hand, right_hand, landmarks)
             
-            # Mettre à jour l'affichage
-            pygame.display.flip()
+            if config.SHOW_CAMERA:
+                self._draw_background(frame_rgb)
+                self._heatmap_version()
+                self.keyboard.draw_static(self.screen, self.current_theme)
+                for _, _, _, draw in widgets:
+                    draw(self.screen)
+                draw_overlays(self.screen)
+                self.viewport.present(self.screen, self.window)
+            else:
+                # Fond statique: seules les zones modifiées sont redessinées
+                background_key = (self.current_theme_name, self.keyboard.layout_name, config.ENABLE_SMART_ZONES,
+                                  self._heatmap_version())
+                if background_key != self._background_key:
+                    self.renderer.set_background(self._static_background())
+                    self._background_key = background_key
+                self.renderer.render(widgets, draw_overlays)
             
             # Contrôler le FPS
             self.clock.tick(config.TARGET_FPS)
             self.fps = self.clock.get_fps()
             
-            # Sauvegarde automatique
-            self._auto_save()
+            # Adapter la qualité au temps de calcul de la frame (hors attente)
+            if config.ENABLE_QUALITY_GOVERNOR and self.quality.update(self.clock.get_rawtime()):
+                self.renderer.invalidate()
+                print(f"Qualité: {self.quality.tier_name}")
         
         # Nettoyage
         self.cleanup()
     
-    def _draw_landmarks(self, landmarks_list):
-        """Dessine les landmarks des mains pour le debug"""
+    def _heatmap_version(self):
+        """Version de la carte de chaleur affichée (None si masquée)"""
+        if not config.SHOW_KEY_HEATMAP or self.keyboard.analytics is None:
+            return None
+        return self.keyboard.analytics.heatmap_version()
+    
+    def _static_background(self) -> pygame.Surface:
+        """Fond uni du thème (mode caméra masquée), zones intelligentes comprises"""
+        background = pygame.Surface((config.RENDER_WIDTH, config.RENDER_HEIGHT)).convert()
+        background.fill(self.current_theme['background'])
+        self.keyboard.draw_static(background, self.current_theme)
+        return background
+    
+    def _scene_widgets(self, current_text: str) -> list:
+        """
+        Construit la liste des widgets de la scène, dans l'ordre d'empilement
+        
+        Args:
+            current_text: Texte saisi
+        
+        Returns:
+            Liste de (identifiant, zone, état visuel, fonction de dessin)
+        """
+        theme = self.current_theme
+        widgets = [
+            (('key', i), key.bounds, key.render_state(),
+             lambda screen, key=key: key.draw(screen, theme, self.font_normal))
+            for i, key in enumerate(self.keyboard.keys)
+        ]
+        widgets.append((
+            'text_box', self.text_box.bounds, current_text,
+            lambda screen: self.text_box.draw(screen, current_text, theme, self.font_big)
+        ))
+        widgets.append((
+            'combo', self.combo_indicator.bounds, self.combo_indicator.render_state(),
+            lambda screen: self.combo_indicator.draw(screen, theme)
+        ))
+        widgets.append((
+            'stats', self.stats_display.bounds, self.stats_display.render_state(),
+            self.stats_display.draw_labels
+        ))
+        widgets.append((
+            'status_bar', self.status_bar.bounds, self.status_bar.render_state(),
+            lambda screen: self.status_bar.draw(screen, theme, self.font_small)
+        ))
+        return widgets
+    
+    def _draw_overlays(self, screen: pygame.Surface, left_hand: dict, right_hand: dict,
+                       landmarks) -> list:
+        """
+        Dessine les éléments animés au-dessus de la scène
+        
+        Args:
+            screen: Surface Pygame
+            left_hand: Données de la main gauche
+            right_hand: Données de la main droite
+            landmarks: Landmarks détectés (debug)
+        
+        Returns:
+            Zones modifiées
+        """
+        rects = []
+        
+        # Trajectoires de saisie gestuelle en cours
+        if config.ENABLE_SWIPE_TYPING:
+            rects.extend(self.swipe_capture.draw(screen, self.current_theme))
+        
+        # Traînées, particules et ondes en un seul appel à blits
+        effects = []
+        self.trail_effect.collect(effects, self.current_theme)
+        self.particle_system.collect(effects)
+        self.energy_waves.collect(effects)
+        if effects:
+            rects.extend(screen.blits(effects))
+        
+        # Les deux curseurs (au-dessus des effets)
+        if left_hand['detected'] and left_hand['pos']:
+            self.cursor.draw_left(screen, left_hand['pos'], self.current_theme,
+                                  left_hand['clicking'], left_hand['dwell'])
+            rects.append(Cursor.bounds(left_hand['pos']))
+        if right_hand['detected'] and right_hand['pos']:
+            self.cursor.draw_right(screen, right_hand['pos'], self.current_theme,
+                                   right_hand['clicking'], right_hand['dwell'])
+            rects.append(Cursor.bounds(right_hand['pos']))
+        
+        # Dessiner les landmarks si debug activé
+        if config.SHOW_HAND_LANDMARKS and landmarks:
+            rects.extend(self._draw_landmarks(landmarks))
+        
+        return rects
+    
+    def _update_swipe_typing(self, left_hand: dict, right_hand: dict):
+        """
+        Met à jour le clavier en mode saisie gestuelle
+        
+        Le pincement maintenu trace un mot; relâché sans déplacement, il
+        agit comme un appui classique sur la touche de départ.
+        
+        Args:
+            left_hand: Données main gauche
+            right_hand: Données main droite
+            
+        Returns:
+            Texte tapé ou None
+        """
+        # Survol uniquement: l'appui est décidé au relâchement
+        self.keyboard.update(left_hand['pos'], False, right_hand['pos'], False)
+        
+        typed = None
+        for hand_name, hand in (('left', left_hand), ('right', right_hand)):
+            path = self.swipe_capture.update(hand_name, hand['pos'], hand['clicking'])
+            if not path:
+                continue
+            
+            if SwipeCapture.is_swipe(path):
+                candidates = self.swipe_decoder.decode(path)
+                if candidates:
+                    typed = self.keyboard.type_word(candidates[0])
+                    print(f"Geste: Mot tracé '{candidates[0]}' (alternatives: {candidates[1:]})")
+            else:
+                typed = self.keyboard.press_at(path[0]) or typed
+        
+        return typed
+    
+    def _draw_landmarks(self, landmarks_list) -> list:
+        """Dessine les landmarks des mains pour le debug (retourne les zones dessinées)"""
+        rects = []
         for hand_landmarks in landmarks_list:
             for landmark in hand_landmarks:
-                x = int(landmark.x * config.WINDOW_WIDTH)
-                y = int(landmark.y * config.WINDOW_HEIGHT)
-                pygame.draw.circle(self.screen, (0, 255, 0), (x, y), 3)
+                x = int(landmark.x * config.RENDER_WIDTH)
+                y = int(landmark.y * config.RENDER_HEIGHT)
+                rects.append(pygame.draw.circle(self.screen, (0, 255, 0), (x, y), 3))
+        return rects
+    
+    def _on_peace_sign(self, event):
+        """Peace sign maintenu (index + majeur levés): effacer tout"""
+        self.keyboard.clear_text()
+        print("Geste: Peace sign (✌️) - Texte effacé")
     
-    def _process_gestures(self, landmarks_list, left_hand: dict, right_hand: dict):
+    def _on_thumbs_up(self, event):
+        """Pouce levé maintenu: sauvegarder"""
+        self._save_text()
+        print("Geste: Pouce levé - Texte sauvegardé")
+    
+    def _on_swipe(self, event: SwipeEvent):
+        """Swipe horizontal: changer de thème"""
+        self._cycle_theme()
+        print(f"Geste: Swipe {event.direction} - Thème changé")
+    
+    def _on_template(self, event: TemplateEvent):
+        """Geste personnalisé reconnu: action associée"""
+        handler = self.gesture_actions.get(event.action)
+        if handler is not None:
+            handler()
+        print(f"Geste personnalisé: {event.name}" + (f" -> {event.action}" if event.action else ""))
+    
+    def _process_gesture_templates(self, left_hand: dict, right_hand: dict):
         """
-        Traite les gestes avancés
+        Suit les tracés des mains et déclenche l'action d'un geste personnalisé
         
         Args:
-            landmarks_list: Liste des landmarks
             left_hand: Données main gauche
             right_hand: Données main droite
         """
-        if not landmarks_list:
+        match = self.gesture_templates.update(left_hand, right_hand, config.ENABLE_ADVANCED_GESTURES)
+        if match is None:
             return
-        
-        # Vérifier peace sign (index + majeur levés = effacer tout)
-        for hand_lms in landmarks_list:
-            if self.gesture_recognizer.detect_peace_sign(hand_lms):
-                if self.gesture_recognizer.can_trigger_gesture('peace_sign'):
-                    self.keyboard.clear_text()
-                    print("Geste: Peace sign (✌️) - Texte effacé")
-                    break
-            
-            # Vérifier pouce levé (sauvegarder)
-            if self.gesture_recognizer.detect_thumbs_up(hand_lms):
-                if self.gesture_recognizer.can_trigger_gesture('thumbs_up'):
-                    self._save_text()
-                    print("Geste: Pouce levé - Texte sauvegardé")
-                    break
-        
-        # Vérifier swipe (changer thème)
-        swipe = self.gesture_recognizer.detect_swipe_horizontal('right')
-        if swipe and self.gesture_recognizer.can_trigger_gesture('swipe'):
-            self._cycle_theme()
-            print(f"Geste: Swipe {swipe} - Thème changé")
-        
-        # Vérifier mains jointes (pause - pour l'instant juste un message)
-        if self.gesture_recognizer.detect_hands_together(left_hand, right_hand):
-            if self.gesture_recognizer.can_trigger_gesture('hands_together'):
-                print("Geste: Mains jointes - Mode pause")
+        name, action = match
+        # Tracé déjà terminé: publié sans maintien (cooldown du bus seulement)
+        self.gesture_recognizer.events.publish(TemplateEvent(name, action))
+    
+    def _toggle_gesture_recording(self):
+        """Commence ou termine l'enregistrement d'un geste personnalisé"""
+        if not self.gesture_templates.recording:
+            self.gesture_templates.start_recording()
+            print("Enregistrement du geste... (N pour terminer)")
+            return
+        template = self.gesture_templates.stop_recording()
+        if template is None:
+            print("Geste trop court, non enregistré")
+        else:
+            print(f"Geste enregistré: {template['name']} (action à associer dans {self.gesture_templates.path}: "
+                  f"{', '.join(self.gesture_actions)})")
+    
+    def _journal_gesture(self, name: str):
+        """Enregistre un geste déclenché dans le journal de session"""
+        if self.journal is not None:
+            self.journal.record_gesture(name)
     
     def cleanup(self):
         """Nettoie les ressources"""
         print("\n=== Fermeture de l'application ===")
         
-        # Sauvegarder le texte
-        self._save_text()
+        # Transitions les plus lentes de la session
+        if self.keyboard.analytics is not None:
+            for previous, current, interval, count, _ in self.keyboard.analytics.slowest_bigrams(5):
+                print(f"Transition lente: {previous!r} -> {current!r} {interval * 1000:.0f} ms ({count}x)")
         
         # Libérer les ressources
         self.cap.release()
         self.hand_detector.close()
+        self.keyboard.key_decoder.save()
+        # Dernier instantané du texte
+        self.persistence.close()
+        if self.journal is not None:
+            self.journal.close()
+            if self.journal.dropped:
+                print(f"Journal: {self.journal.dropped} événements perdus (tampon plein)")
+        self.dictionaries.close()
         pygame.quit()
         
         print("Application fermée proprement.")
@@ -7,9 +7,108 @@ Définit tous les thèmes visuels disponibles
 # Les thèmes sont déjà définis dans config.py
 # Ce fichier est fourni pour une extension future facile
 
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Dict, Tuple
+
+import config
 from config import THEMES, DEFAULT_THEME
 
-__all__ = ['THEMES', 'DEFAULT_THEME']
+__all__ = ['THEMES', 'DEFAULT_THEME', 'Palette', 'get_palette']
+
+
+# Décalages de teinte (R, G, B) des curseurs de chaque main
+CURSOR_LEFT_TINT = (-20, -10, 20)
+CURSOR_RIGHT_TINT = (20, 10, -20)
+
+
+def _tint(color: Tuple[int, ...], offset: Tuple[int, int, int]) -> Tuple[int, int, int]:
+    """Décale une couleur RGB en restant dans [0, 255]"""
+    return tuple(min(255, max(0, c + o)) for c, o in zip(color[:3], offset))
+
+
+def _with_alpha(color: Tuple[int, ...], alpha: int) -> Tuple[int, int, int, int]:
+    """Ajoute un alpha à une couleur RGB (une couleur RGBA est conservée)"""
+    return tuple(color) if len(color) == 4 else tuple(color[:3]) + (alpha,)
+
+
+class Palette(Mapping):
+    """
+    Thème compilé, immuable
+
+    Contient les couleurs du thème et toutes les couleurs dérivées (teintes
+    des curseurs, variantes avec alpha, halos), calculées une seule fois.
+    S'utilise comme le dictionnaire du thème: palette['text'].
+    """
+
+    __slots__ = ('_colors',)
+
+    def __init__(self, theme: dict):
+        """
+        Compile un thème
+
+        Args:
+            theme: Dictionnaire du thème (voir config.THEMES)
+        """
+        colors = dict(theme)
+
+        # Curseurs et zones intelligentes de chaque main
+        colors['cursor_left'] = _tint(theme['cursor'], CURSOR_LEFT_TINT)
+        colors['cursor_right'] = _tint(theme['cursor'], CURSOR_RIGHT_TINT)
+        zone_alpha = int(255 * config.ZONE_OPACITY)
+        colors['zone_left'] = _tint(theme['cursor'], config.LEFT_ZONE_COLOR_TINT) + (zone_alpha,)
+        colors['zone_right'] = _tint(theme['cursor'], config.RIGHT_ZONE_COLOR_TINT) + (zone_alpha,)
+
+        # Touches: fond verre (RGB, alpha selon l'animation) et halo
+        for state in ('key_normal', 'key_hover', 'key_pressed'):
+            colors[state + '_fill'] = tuple(int(c * 0.4) for c in theme[state][:3])
+            colors[state + '_glow'] = tuple(theme[state][:3]) + (50,)
+
+        # Fonds semi-transparents
+        colors['background_overlay'] = tuple(theme['background'][:3]) + (50,)
+        colors['text_box_bg_rgba'] = _with_alpha(theme['text_box_bg'], 220)
+        colors['text_box_glow'] = tuple(theme['text_box_border'][:3]) + (30,)
+        colors['status_bar_rgba'] = _with_alpha(theme['status_bar'], 150)
+
+        object.__setattr__(self, '_colors', MappingProxyType(colors))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Palette est immuable")
+
+    def __getitem__(self, key: str):
+        return self._colors[key]
+
+    def __iter__(self):
+        return iter(self._colors)
+
+    def __len__(self) -> int:
+        return len(self._colors)
+
+    def __repr__(self) -> str:
+        return f"Palette({self._colors.get('name')!r})"
+
+
+# Palettes compilées, par nom de thème
+_palettes: Dict[str, Palette] = {}
+
+
+def get_palette(theme_name: str) -> Palette:
+    """
+    Retourne la palette compilée d'un thème (compilée au premier appel)
+
+    Args:
+        theme_name: Nom du thème dans config.THEMES
+
+    Returns:
+        Palette du thème, ou du thème par défaut si non trouvé
+    """
+    if theme_name not in THEMES:
+        theme_name = DEFAULT_THEME
+    palette = _palettes.get(theme_name)
+    if palette is None:
+        palette = Palette(THEMES[theme_name])
+        _palettes[theme_name] = palette
+    return palette
 
 
 def get_theme(theme_name: str) -> dict:
@@ -35,7 +134,7 @@ def list_themes() -> list:
     return list(THEMES.keys())
 
 
-def create_custom_theme(name: str, colors: dict) -> dict:
+def create_custom_theme(name: str, colors: dict) -> Palette:
     """
     Crée un thème personnalisé
     
@@ -44,7 +143,7 @@ def create_custom_theme(name: str, colors: dict) -> dict:
         colors: Dictionnaire des couleurs
         
     Returns:
-        Thème créé
+        Palette compilée du thème
         
     Example:
         >>> custom = create_custom_theme('ocean', {
@@ -74,4 +173,4 @@ def create_custom_theme(name: str, colors: dict) -> dict:
     theme = colors.copy()
     theme['name'] = name
     
-    return theme
+    return Palette(theme)
@@ -0,0 +1,156 @@
+"""
+Apprentissage des poses statiques de la main
+Enregistre des landmarks étiquetés depuis la webcam puis construit le modèle
+k plus proches voisins utilisé à la place des règles de GestureRecognizer
+
+Usage:
+    python train_poses.py record peace_sign [--seconds 10]   # une étiquette par pose
+    python train_poses.py record none                        # mains au repos / en frappe
+    python train_poses.py train [--output data/pose_model.npz]
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+import numpy as np
+
+import config
+from utils.gesture_recognizer import landmarks_to_array
+from utils.pose_classifier import NO_POSE, PoseClassifier, train_pose_model
+
+
+def load_recordings(directory):
+    """
+    Lit les enregistrements étiquetés (un fichier <étiquette>.npy par pose)
+
+    Args:
+        directory: Dossier des enregistrements
+
+    Returns:
+        {étiquette: landmarks (n, 21, 3)}
+    """
+    recordings = {}
+    for path in sorted(glob.glob(os.path.join(directory, '*.npy'))):
+        label = os.path.splitext(os.path.basename(path))[0]
+        try:
+            samples = np.load(path)
+        except (OSError, ValueError) as e:
+            print(f"Enregistrement ignoré ({path}): {e}")
+            continue
+        if samples.ndim != 3 or samples.shape[1:] != (21, 3) or not len(samples):
+            print(f"Enregistrement ignoré ({path}): forme {samples.shape}")
+            continue
+        recordings[label] = samples
+    return recordings
+
+
+def record(args):
+    """Capture les landmarks de la webcam pour une étiquette"""
+    import cv2
+    from utils.hand_detector import HandDetector
+
+    detector = HandDetector()
+    cap = cv2.VideoCapture(config.CAMERA_INDEX)
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, config.WINDOW_WIDTH)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, config.WINDOW_HEIGHT)
+
+    print(f"Pose '{args.label}': enregistrement dans {args.delay:.0f} s pendant {args.seconds:.0f} s (ESC pour arrêter)")
+    samples = []
+    start = time.monotonic()
+    try:
+        while True:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            frame = cv2.flip(frame, 1)
+            elapsed = time.monotonic() - start
+            _, _, landmarks = detector.detect(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB), int(elapsed * 1000))
+
+            recording = elapsed >= args.delay
+            if recording and landmarks:
+                samples.extend(landmarks_to_array(landmarks))
+            status = f"{args.label}: {len(samples)}" if recording else f"Prêt dans {args.delay - elapsed:.1f} s"
+            cv2.putText(frame, status, (20, 40), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 255, 0), 2)
+            cv2.imshow("Air-Typing - enregistrement des poses", frame)
+            if cv2.waitKey(1) & 0xFF == 27 or elapsed >= args.delay + args.seconds:
+                break
+    finally:
+        cap.release()
+        detector.close()
+        cv2.destroyAllWindows()
+
+    if not samples:
+        print("Aucune main détectée, rien n'est enregistré")
+        return 1
+
+    os.makedirs(args.dir, exist_ok=True)
+    path = os.path.join(args.dir, f"{args.label}.npy")
+    samples = np.array(samples, dtype=np.float32)
+    if os.path.exists(path):
+        samples = np.concatenate([np.load(path), samples])
+    np.save(path, samples)
+    print(f"{path}: {len(samples)} poses")
+    return 0
+
+
+def train(args):
+    """Construit et évalue le modèle à partir des enregistrements"""
+    recordings = load_recordings(args.dir)
+    if len(recordings) < 2:
+        print(f"Au moins deux poses enregistrées sont nécessaires dans {args.dir} "
+              f"(dont '{NO_POSE}' pour les mains au repos)")
+        return 1
+
+    # Évaluation sur une partie des exemples tenue à l'écart
+    rng = np.random.default_rng(0)
+    train_set, test_set = {}, {}
+    for label, samples in recordings.items():
+        order = rng.permutation(len(samples))
+        split = max(1, int(len(samples) * args.holdout))
+        test_set[label], train_set[label] = samples[order[:split]], samples[order[split:]]
+    if all(len(samples) for samples in train_set.values()):
+        classifier = PoseClassifier(train_pose_model(train_set, args.prototypes), args.neighbors)
+        for label, samples in sorted(test_set.items()):
+            predicted = classifier.classify(samples)
+            expected = None if label == NO_POSE else label
+            accuracy = np.mean([p == expected for p in predicted])
+            print(f"  {label:<15} {len(samples):5d} exemples de test  justesse: {accuracy * 100:5.1f}%")
+
+    model = train_pose_model(recordings, args.prototypes)
+    directory = os.path.dirname(args.output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    np.savez_compressed(args.output, **model)
+    print(f"{args.output}: {len(model['classes'])} poses, {len(model['features'])} prototypes, "
+          f"distance de rejet {float(model['reject_distance']):.3f}")
+    return 0
+
+
+def main():
+    """Point d'entrée de l'apprentissage"""
+    parser = argparse.ArgumentParser(description="Enregistre et apprend les poses de la main")
+    parser.add_argument('--dir', default=config.POSE_RECORDINGS_DIR, help="Dossier des enregistrements")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    record_parser = commands.add_parser('record', help="Enregistre une pose depuis la webcam")
+    record_parser.add_argument('label', help=f"Nom de la pose (geste, ou '{NO_POSE}' pour les mains au repos)")
+    record_parser.add_argument('--seconds', type=float, default=10.0, help="Durée de l'enregistrement")
+    record_parser.add_argument('--delay', type=float, default=3.0, help="Délai avant l'enregistrement")
+
+    train_parser = commands.add_parser('train', help="Construit le modèle k-NN")
+    train_parser.add_argument('--output', default=config.POSE_MODEL_FILE, help="Fichier .npz du modèle")
+    train_parser.add_argument('--prototypes', type=int, default=config.POSE_PROTOTYPES_PER_CLASS,
+                              help="Prototypes gardés par pose")
+    train_parser.add_argument('--neighbors', type=int, default=config.POSE_KNN_NEIGHBORS,
+                              help="Voisins pour l'évaluation")
+    train_parser.add_argument('--holdout', type=float, default=0.2, help="Part des exemples gardée pour le test")
+    args = parser.parse_args()
+
+    return record(args) if args.command == 'record' else train(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
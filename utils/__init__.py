@@ -9,6 +9,7 @@ from .ui_components import TextBox, StatusBar, Cursor, ParticleSystem
 from .audio_manager import AudioManager
 from .stats_tracker import StatsTracker
 from .gesture_recognizer import GestureRecognizer
+from .dictionary import DictionaryManager, BinaryDictionary
 
 __all__ = [
     'HandDetector',
@@ -19,5 +20,7 @@ __all__ = [
     'ParticleSystem',
     'AudioManager',
     'StatsTracker',
-    'GestureRecognizer'
+    'GestureRecognizer',
+    'DictionaryManager',
+    'BinaryDictionary'
 ]
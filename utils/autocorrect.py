@@ -0,0 +1,180 @@
+"""
+Module d'autocorrection par mot
+Corrige le mot terminé par un espace à partir des positions réelles des
+appuis (modèle de toucher) et de la fréquence des mots
+"""
+
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+import config
+from .background import BackgroundCache
+from .dictionary import strip_accents
+
+
+class WordCorrector:
+    """Corrige un mot à partir des coordonnées de ses appuis"""
+
+    def __init__(self, key_decoder, dictionary=None):
+        """
+        Initialise le correcteur
+
+        Args:
+            key_decoder: ProbabilisticKeyDecoder (géométrie et modèle de toucher)
+            dictionary: BinaryDictionary source des candidats (optionnel)
+        """
+        self.key_decoder = key_decoder
+        self.dictionary = dictionary
+        # Par longueur: mots, séquences de touches (M, L) et log-fréquences (M,)
+        self.words: Dict[int, List[str]] = {}
+        self.sequences: Dict[int, np.ndarray] = {}
+        self.log_freqs: Dict[int, np.ndarray] = {}
+        # Index (longueur, première touche, dernière touche) -> indices des mots
+        self.buckets: Dict[Tuple[int, int, int], np.ndarray] = {}
+        # Index déjà construits, par (dictionnaire, touches du layout)
+        self._indexes = BackgroundCache('autocorrect-index')
+        self._key_index: Dict[str, int] = {}
+        self.rebuild(dictionary)
+
+    def rebuild(self, dictionary=None, background: bool = False):
+        """
+        Reconstruit l'index des candidats (changement de layout ou de langue)
+
+        En arrière-plan, l'index de la langue précédente reste utilisé jusqu'à
+        ce que le nouveau soit prêt (s'il correspond toujours au layout).
+
+        Args:
+            dictionary: BinaryDictionary ou None
+            background: Construire l'index sur un thread (touches L et K)
+        """
+        self.dictionary = dictionary
+        key_index = {}
+        for i, char in enumerate(self.key_decoder.chars):
+            if len(char) == 1 and char.isalpha():
+                key_index.setdefault(char.lower(), i)
+
+        if dictionary is None or key_index != self._key_index:
+            # Les séquences de l'ancien index désignent les touches d'un autre layout
+            self._set_index(({}, {}, {}, {}))
+        self._key_index = key_index
+        if dictionary is None:
+            return
+
+        key = (dictionary.path, tuple(key_index.items()))
+        index = self._indexes.request(key, lambda: self._build_index(dictionary, key_index), background)
+        if index is not None:
+            self._set_index(index)
+
+    def _set_index(self, index: tuple):
+        """Remplace l'index des candidats (mots, séquences, log-fréquences, groupes)"""
+        self.words, self.sequences, self.log_freqs, self.buckets = index
+
+    @staticmethod
+    def _build_index(dictionary, key_index: Dict[str, int]) -> tuple:
+        """
+        Construit l'index des candidats d'un dictionnaire pour un layout
+
+        Args:
+            dictionary: BinaryDictionary
+            key_index: Lettre -> index de la touche
+
+        Returns:
+            (mots, séquences, log-fréquences, groupes) par longueur
+        """
+        index_words, index_sequences, index_log_freqs, buckets = {}, {}, {}, {}
+        words = defaultdict(list)
+        sequences = defaultdict(list)
+        freqs = defaultdict(list)
+        indices = dictionary.top_indices(config.AUTOCORRECT_VOCABULARY_SIZE)
+        for word, freq in dictionary.iter_words(indices):
+            if len(word) > config.AUTOCORRECT_MAX_WORD_LENGTH:
+                continue
+            sequence = [key_index.get(char, key_index.get(strip_accents(char))) for char in word]
+            if None in sequence:
+                continue
+            words[len(word)].append(word)
+            sequences[len(word)].append(sequence)
+            freqs[len(word)].append(freq)
+
+        for length, group in words.items():
+            seqs = np.array(sequences[length], dtype=np.int32)
+            index_words[length] = group
+            index_sequences[length] = seqs
+            index_log_freqs[length] = np.log1p(np.array(freqs[length], dtype=np.float32))
+
+            # Regroupement par (première, dernière) touche
+            order = np.lexsort((seqs[:, -1], seqs[:, 0]))
+            pairs = seqs[order][:, [0, -1]]
+            boundaries = np.flatnonzero(np.any(np.diff(pairs, axis=0) != 0, axis=1)) + 1
+            for chunk in np.split(order, boundaries):
+                first, last = seqs[chunk[0], 0], seqs[chunk[0], -1]
+                buckets[(length, int(first), int(last))] = chunk
+        return index_words, index_sequences, index_log_freqs, buckets
+
+    def _neighborhood(self, table_row: np.ndarray) -> np.ndarray:
+        """Touches plausibles pour un appui (log-vraisemblance proche du maximum)"""
+        return np.flatnonzero(table_row >= table_row.max() - config.AUTOCORRECT_NEIGHBORHOOD)
+
+    def correct(self, word: str, presses: List[Tuple[float, float]]) -> Optional[str]:
+        """
+        Propose une correction pour un mot tapé
+
+        Args:
+            word: Mot tel que tapé
+            presses: Positions brutes des appuis, une par caractère
+
+        Returns:
+            Mot corrigé (casse d'origine conservée) ou None si aucune correction
+        """
+        index = self._indexes.take()
+        if index is not None:
+            self._set_index(index)
+
+        length = len(word)
+        if length < config.AUTOCORRECT_MIN_WORD_LENGTH or len(presses) != length:
+            return None
+        if length not in self.sequences or not word.isalpha():
+            return None
+        if self.dictionary is not None and word.lower() in self.dictionary:
+            return None
+        # Touches du mot tapé: sans elles, la marge de confiance ne peut pas être vérifiée
+        chars = self.key_decoder.chars
+        if any(c.upper() not in chars for c in word):
+            return None
+        typed_keys = [chars.index(c.upper()) for c in word]
+
+        # Log-vraisemblance de chaque appui pour chaque touche: (L, K)
+        table = np.stack([self.key_decoder.touch_log_likelihoods(pos) for pos in presses])
+
+        # Candidats: mots dont la première et la dernière touche sont plausibles
+        chunks = [
+            self.buckets[(length, int(first), int(last))]
+            for first in self._neighborhood(table[0])
+            for last in self._neighborhood(table[-1])
+            if (length, int(first), int(last)) in self.buckets
+        ]
+        if not chunks:
+            return None
+        candidates = np.concatenate(chunks)
+
+        seqs = self.sequences[length][candidates]
+        spatial = table[np.arange(length), seqs].sum(axis=1)
+        scores = spatial + config.AUTOCORRECT_FREQUENCY_WEIGHT * self.log_freqs[length][candidates]
+
+        best = int(np.argmax(scores))
+        # Score du mot tapé: mêmes appuis, fréquence nulle
+        typed_score = table[np.arange(length), typed_keys].sum()
+        if scores[best] - typed_score < config.AUTOCORRECT_MARGIN:
+            return None
+
+        corrected = self.words[length][int(candidates[best])]
+        if corrected == word.lower():
+            return None
+        # Conserver la casse du mot tapé
+        if word.isupper():
+            corrected = corrected.upper()
+        elif word[0].isupper():
+            corrected = corrected[0].upper() + corrected[1:]
+        return corrected
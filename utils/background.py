@@ -0,0 +1,88 @@
+"""
+Module de construction en arrière-plan
+Les index et modèles coûteux (autocorrection, modèle de langue, saisie
+gestuelle) sont construits une fois par clé (langue, layout) sur un thread,
+puis récupérés par le thread de rendu: changer de langue reste instantané
+"""
+
+import threading
+from typing import Callable, Dict, Hashable, Optional
+
+
+class BackgroundCache:
+    """Valeurs construites une fois par clé, hors du thread de rendu"""
+
+    def __init__(self, name: str):
+        """
+        Initialise le cache
+
+        Args:
+            name: Nom des threads de construction
+        """
+        self.name = name
+        self._values: Dict[Hashable, object] = {}
+        self._building = set()
+        self._wanted: Optional[Hashable] = None
+        self._ready = None
+        self._lock = threading.Lock()
+
+    def request(self, key: Hashable, build: Callable[[], object], background: bool = True):
+        """
+        Demande la valeur d'une clé
+
+        Args:
+            key: Clé de la valeur (ex: langue et layout)
+            build: Construction de la valeur (ne doit lire que des données figées)
+            background: Construire sur un thread plutôt qu'immédiatement
+
+        Returns:
+            La valeur si elle est disponible tout de suite, sinon None (voir take)
+        """
+        with self._lock:
+            self._wanted = key
+            self._ready = None
+            if key in self._values:
+                return self._values[key]
+            if background and key in self._building:
+                return None
+            if background:
+                self._building.add(key)
+
+        if not background:
+            value = build()
+            with self._lock:
+                self._values[key] = value
+            return value
+
+        threading.Thread(target=self._run, args=(key, build), name=self.name, daemon=True).start()
+        return None
+
+    def _run(self, key: Hashable, build: Callable[[], object]):
+        """Construit une valeur sur le thread d'arrière-plan"""
+        try:
+            value = build()
+        except (OSError, ValueError) as e:
+            print(f"Erreur lors de la construction en arrière-plan ({self.name}): {e}")
+            with self._lock:
+                self._building.discard(key)
+            return
+        with self._lock:
+            self._building.discard(key)
+            self._values[key] = value
+            if self._wanted == key:
+                self._ready = value
+
+    def take(self):
+        """
+        Récupère la dernière valeur demandée si elle vient d'être construite
+
+        À appeler depuis le thread de rendu, qui remplace alors son index.
+
+        Returns:
+            Valeur prête ou None
+        """
+        if self._ready is None:
+            return None
+        with self._lock:
+            value, self._ready = self._ready, None
+        return value
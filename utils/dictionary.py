@@ -0,0 +1,372 @@
+"""
+Module de dictionnaire compilé pour la prédiction de texte
+Compile les listes de mots JSON en un format binaire compact chargé par mmap
+"""
+
+import json
+import mmap
+import os
+import struct
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+import config
+
+
+# Format du fichier compilé (little-endian):
+#   en-tête  : magic (4s) | version (I) | nombre de mots (I) | taille des chaînes (I)
+#   offsets  : uint32[nombre de mots + 1]  (début de chaque mot dans la table)
+#   fréquences : uint32[nombre de mots]
+#   chaînes  : mots UTF-8 concaténés, triés par ordre d'octets
+DICTIONARY_MAGIC = b'ATD1'
+DICTIONARY_VERSION = 1
+_HEADER = struct.Struct('<4sIII')
+
+
+def strip_accents(text: str) -> str:
+    """
+    Retire les accents d'un texte (é -> e) pour le mapper sur les touches
+
+    Args:
+        text: Texte à normaliser
+
+    Returns:
+        Texte sans signes diacritiques
+    """
+    decomposed = unicodedata.normalize('NFD', text)
+    return ''.join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def _read_word_list(json_path: str) -> Dict[str, int]:
+    """
+    Lit une liste de mots JSON
+
+    Formats acceptés: liste de mots (fréquence décroissante implicite),
+    dictionnaire {mot: fréquence} ou liste de paires [mot, fréquence].
+
+    Args:
+        json_path: Chemin du fichier JSON
+
+    Returns:
+        Dictionnaire {mot en minuscules: fréquence}
+    """
+    with open(json_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    if isinstance(data, dict):
+        entries = data.items()
+    elif data and isinstance(data[0], (list, tuple)):
+        entries = ((item[0], item[1]) for item in data)
+    else:
+        # Liste simple: le rang sert de fréquence
+        entries = ((word, len(data) - rank) for rank, word in enumerate(data))
+
+    words: Dict[str, int] = {}
+    for word, freq in entries:
+        word = str(word).strip().lower()
+        if word:
+            words[word] = words.get(word, 0) + max(0, int(freq))
+    return words
+
+
+def compile_dictionary(json_path: str, output_path: str) -> int:
+    """
+    Compile une liste de mots JSON au format binaire
+
+    Args:
+        json_path: Fichier JSON source
+        output_path: Fichier binaire de sortie
+
+    Returns:
+        Nombre de mots compilés
+    """
+    words = _read_word_list(json_path)
+    encoded = sorted((word.encode('utf-8'), freq) for word, freq in words.items())
+
+    offsets = np.zeros(len(encoded) + 1, dtype='<u4')
+    freqs = np.zeros(len(encoded), dtype='<u4')
+    for i, (word, freq) in enumerate(encoded):
+        offsets[i + 1] = offsets[i] + len(word)
+        freqs[i] = min(freq, 0xFFFFFFFF)
+    blob = b''.join(word for word, _ in encoded)
+
+    directory = os.path.dirname(output_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    # Écriture atomique pour ne jamais laisser un fichier tronqué
+    tmp_path = output_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(DICTIONARY_MAGIC, DICTIONARY_VERSION, len(encoded), len(blob)))
+        f.write(offsets.tobytes())
+        f.write(freqs.tobytes())
+        f.write(blob)
+    os.replace(tmp_path, output_path)
+
+    return len(encoded)
+
+
+def compiled_path(json_path: str) -> str:
+    """
+    Retourne le chemin du fichier compilé associé à une liste JSON
+
+    Args:
+        json_path: Chemin de la liste de mots JSON
+
+    Returns:
+        Chemin du fichier binaire dans COMPILED_DICTIONARY_DIR
+    """
+    name = os.path.splitext(os.path.basename(json_path))[0]
+    return os.path.join(config.COMPILED_DICTIONARY_DIR, name + '.atd')
+
+
+class BinaryDictionary:
+    """Dictionnaire compilé, mappé en mémoire et interrogé sans objets Python"""
+
+    def __init__(self, path: str):
+        """
+        Ouvre un dictionnaire compilé
+
+        Args:
+            path: Chemin du fichier binaire
+        """
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Fichier vide: mmap refuse une taille nulle
+            self._file.close()
+            raise ValueError(f"Dictionnaire vide ou corrompu: {path}")
+
+        magic, version, count, blob_size = _HEADER.unpack_from(self._mm, 0)
+        if magic != DICTIONARY_MAGIC or version != DICTIONARY_VERSION:
+            self.close()
+            raise ValueError(f"Format de dictionnaire invalide: {path}")
+
+        self.count = count
+        # Vues zero-copy sur le fichier mappé
+        offset = _HEADER.size
+        self.offsets = np.frombuffer(self._mm, dtype='<u4', count=count + 1, offset=offset)
+        offset += (count + 1) * 4
+        self.frequencies = np.frombuffer(self._mm, dtype='<u4', count=count, offset=offset)
+        offset += count * 4
+        self._blob_start = offset
+        self._blob_size = blob_size
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _word_bytes(self, index: int) -> bytes:
+        """Retourne les octets UTF-8 du mot à l'index donné"""
+        start = self._blob_start + int(self.offsets[index])
+        end = self._blob_start + int(self.offsets[index + 1])
+        return self._mm[start:end]
+
+    def _lower_bound(self, key: bytes, lo: int = 0, hi: Optional[int] = None) -> int:
+        """Recherche dichotomique du premier mot >= key"""
+        if hi is None:
+            hi = self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._word_bytes(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def prefix_range(self, prefix: str) -> Tuple[int, int]:
+        """
+        Retourne l'intervalle [début, fin) des mots commençant par un préfixe
+
+        Args:
+            prefix: Préfixe recherché
+
+        Returns:
+            Tuple (début, fin) d'indices dans la table triée
+        """
+        key = prefix.lower().encode('utf-8')
+        lo = self._lower_bound(key)
+        # 0xFF n'apparaît jamais en UTF-8: borne supérieure de tous les mots préfixés
+        hi = self._lower_bound(key + b'\xff', lo)
+        return lo, hi
+
+    def predict(self, prefix: str, limit: int = None) -> List[str]:
+        """
+        Retourne les mots les plus fréquents commençant par un préfixe
+
+        Args:
+            prefix: Début du mot
+            limit: Nombre maximum de suggestions (config par défaut)
+
+        Returns:
+            Liste de mots triés par fréquence décroissante
+        """
+        limit = limit or config.MAX_PREDICTIONS
+        if len(prefix) < config.PREDICTION_MIN_CHARS:
+            return []
+
+        lo, hi = self.prefix_range(prefix)
+        if lo >= hi:
+            return []
+
+        freqs = self.frequencies[lo:hi]
+        if len(freqs) > limit:
+            best = np.argpartition(freqs, -limit)[-limit:]
+        else:
+            best = np.arange(len(freqs))
+        best = best[np.argsort(-freqs[best].astype(np.int64), kind='stable')]
+
+        return [self.word(lo + int(i)) for i in best]
+
+    def word(self, index: int) -> str:
+        """Retourne le mot à l'index donné"""
+        return self._word_bytes(index).decode('utf-8')
+
+    def frequency(self, word: str) -> int:
+        """
+        Retourne la fréquence d'un mot (0 si absent)
+
+        Args:
+            word: Mot recherché
+        """
+        key = word.lower().encode('utf-8')
+        index = self._lower_bound(key)
+        if index < self.count and self._word_bytes(index) == key:
+            return int(self.frequencies[index])
+        return 0
+
+    def __contains__(self, word: str) -> bool:
+        return self.frequency(word) > 0
+
+    def top_indices(self, limit: int) -> np.ndarray:
+        """
+        Retourne les indices des mots les plus fréquents
+
+        Args:
+            limit: Nombre de mots
+
+        Returns:
+            Indices triés par fréquence décroissante
+        """
+        limit = min(limit, self.count)
+        if limit <= 0:
+            return np.zeros(0, dtype=np.int64)
+        best = np.argpartition(self.frequencies, -limit)[-limit:]
+        return best[np.argsort(-self.frequencies[best].astype(np.int64), kind='stable')]
+
+    def iter_words(self, indices: Iterable[int]):
+        """
+        Itère sur (mot, fréquence) pour une sélection d'indices
+
+        Args:
+            indices: Indices des mots
+        """
+        for index in indices:
+            index = int(index)
+            yield self.word(index), int(self.frequencies[index])
+
+    def close(self):
+        """Libère le mapping mémoire"""
+        # Les vues numpy retiennent le buffer: les libérer avant de fermer le mmap
+        self.offsets = None
+        self.frequencies = None
+        try:
+            self._mm.close()
+        except (BufferError, ValueError):
+            pass
+        self._file.close()
+
+
+class DictionaryManager:
+    """Gère les dictionnaires compilés de chaque langue"""
+
+    def __init__(self, language: str = None):
+        """
+        Initialise le gestionnaire
+
+        Args:
+            language: Langue active (config.DEFAULT_LANGUAGE par défaut)
+        """
+        self._dictionaries: Dict[str, Optional[BinaryDictionary]] = {}
+        self.language = None
+        self.set_language(language or config.DEFAULT_LANGUAGE)
+
+    def _open(self, language: str) -> Optional[BinaryDictionary]:
+        """Ouvre (et compile si nécessaire) le dictionnaire d'une langue"""
+        json_path = config.WORDS_DICTIONARIES.get(language)
+        if not json_path:
+            return None
+
+        bin_path = compiled_path(json_path)
+        try:
+            # Recompiler si la liste source est plus récente que le binaire
+            if os.path.exists(json_path) and (
+                not os.path.exists(bin_path)
+                or os.path.getmtime(json_path) > os.path.getmtime(bin_path)
+            ):
+                count = compile_dictionary(json_path, bin_path)
+                print(f"Dictionnaire {language} compilé: {count} mots")
+
+            if os.path.exists(bin_path):
+                return BinaryDictionary(bin_path)
+        except (OSError, ValueError) as e:
+            print(f"Erreur lors du chargement du dictionnaire {language}: {e}")
+        return None
+
+    def set_language(self, language: str):
+        """
+        Change la langue active
+
+        Le fichier est seulement mappé en mémoire: le changement est instantané
+        et les pages ne sont chargées qu'à la lecture.
+
+        Args:
+            language: Code de langue (voir config.AVAILABLE_LANGUAGES)
+        """
+        if language not in config.AVAILABLE_LANGUAGES:
+            return
+        if language not in self._dictionaries:
+            self._dictionaries[language] = self._open(language)
+        self.language = language
+
+    def cycle_language(self) -> str:
+        """
+        Passe à la langue suivante
+
+        Returns:
+            Nouvelle langue active
+        """
+        languages = config.AVAILABLE_LANGUAGES
+        index = languages.index(self.language) if self.language in languages else -1
+        self.set_language(languages[(index + 1) % len(languages)])
+        return self.language
+
+    @property
+    def current(self) -> Optional[BinaryDictionary]:
+        """Dictionnaire de la langue active (None si indisponible)"""
+        return self._dictionaries.get(self.language)
+
+    def predict(self, prefix: str, limit: int = None) -> List[str]:
+        """
+        Suggestions pour un préfixe dans la langue active
+
+        Args:
+            prefix: Début du mot
+            limit: Nombre maximum de suggestions
+
+        Returns:
+            Liste de mots suggérés
+        """
+        if not config.ENABLE_TEXT_PREDICTION or self.current is None:
+            return []
+        return self.current.predict(prefix, limit)
+
+    def close(self):
+        """Ferme tous les dictionnaires ouverts"""
+        for dictionary in self._dictionaries.values():
+            if dictionary is not None:
+                dictionary.close()
+        self._dictionaries.clear()
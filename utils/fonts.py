@@ -0,0 +1,71 @@
+"""
+Module de gestion des polices
+Charge chaque police une seule fois et garde en cache les textes déjà rendus
+"""
+
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+import config
+
+
+# Polices chargées, par (fichier, taille) - None désigne la police par défaut
+_fonts: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+
+# Surfaces de texte rendues, par (texte, police, couleur, anticrénelage)
+_text_cache: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+
+
+def get_font(size: int, face: Optional[str] = None) -> pygame.font.Font:
+    """
+    Retourne une police (chargée au premier appel seulement)
+
+    Args:
+        size: Taille en points
+        face: Fichier de police (None pour la police par défaut)
+
+    Returns:
+        Police Pygame partagée
+    """
+    key = (face, size)
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.Font(face, size)
+        _fonts[key] = font
+    return font
+
+
+def render_text(text: str, font: pygame.font.Font, color: Tuple[int, ...],
+                antialias: bool = True) -> pygame.Surface:
+    """
+    Rend un texte en passant par le cache LRU
+
+    La surface retournée est partagée: ne pas la modifier.
+
+    Args:
+        text: Texte à rendre
+        font: Police (voir get_font)
+        color: Couleur du texte
+        antialias: Lissage des caractères
+
+    Returns:
+        Surface du texte
+    """
+    key = (text, font, tuple(color), antialias)
+    surface = _text_cache.get(key)
+    if surface is not None:
+        _text_cache.move_to_end(key)
+        return surface
+
+    surface = font.render(text, antialias, color)
+    _text_cache[key] = surface
+    if len(_text_cache) > config.TEXT_SURFACE_CACHE_SIZE:
+        _text_cache.popitem(last=False)
+    return surface
+
+
+def clear_text_cache():
+    """Vide le cache des textes rendus (changement de thème)"""
+    _text_cache.clear()
@@ -0,0 +1,205 @@
+"""
+Module des événements de gestes
+Confirme les gestes détectés (maintien sur plusieurs frames, relâchement avant
+réarmement, horloge monotone) puis publie les gestes confirmés aux abonnés
+"""
+
+import time
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Optional
+
+import config
+
+
+class GestureEvent:
+    """Geste confirmé (type de base: s'y abonner reçoit tous les gestes)"""
+
+    __slots__ = ('name', 'hand', 'time')
+
+    def __init__(self, name: str, hand: Optional[str] = None, timestamp: float = None):
+        """
+        Crée l'événement
+
+        Args:
+            name: Nom du geste
+            hand: 'left', 'right' ou None
+            timestamp: Instant de la détection (time.monotonic par défaut)
+        """
+        self.name = name
+        self.hand = hand
+        self.time = time.monotonic() if timestamp is None else timestamp
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name!r}, hand={self.hand!r})"
+
+
+class PoseEvent(GestureEvent):
+    """Pose statique maintenue (peace_sign, thumbs_up, poses apprises...)"""
+
+    __slots__ = ()
+
+
+class SwipeEvent(GestureEvent):
+    """Balayage horizontal"""
+
+    __slots__ = ('direction',)
+
+    def __init__(self, direction: str, hand: Optional[str] = None, timestamp: float = None):
+        """
+        Args:
+            direction: 'left' ou 'right'
+            hand: Main ayant balayé
+            timestamp: Instant de la détection
+        """
+        super().__init__('swipe', hand, timestamp)
+        self.direction = direction
+
+
+class HandsTogetherEvent(GestureEvent):
+    """Mains jointes maintenues"""
+
+    __slots__ = ()
+
+    def __init__(self, timestamp: float = None):
+        super().__init__('hands_together', None, timestamp)
+
+
+class TemplateEvent(GestureEvent):
+    """Geste personnalisé reconnu (voir gesture_templates)"""
+
+    __slots__ = ('action',)
+
+    def __init__(self, name: str, action: Optional[str] = None, timestamp: float = None):
+        """
+        Args:
+            name: Nom du modèle
+            action: Action associée au modèle
+            timestamp: Instant de la détection
+        """
+        super().__init__(name, None, timestamp)
+        self.action = action
+
+
+class GestureGate:
+    """Machine à états d'un geste maintenu: confirmation puis relâchement avant réarmement"""
+
+    IDLE = 'idle'
+    HOLDING = 'holding'
+    ACTIVE = 'active'
+
+    def __init__(self, hold_frames: int = None, hold_time: float = None, release_frames: int = None):
+        """
+        Initialise la machine à états
+
+        Args:
+            hold_frames: Frames consécutives avec le geste (config.GESTURE_CONFIRM_FRAMES)
+            hold_time: Durée de maintien en secondes (config.GESTURE_CONFIRM_TIME)
+            release_frames: Frames sans le geste pour le réarmer (config.GESTURE_RELEASE_FRAMES)
+        """
+        self.hold_frames = config.GESTURE_CONFIRM_FRAMES if hold_frames is None else hold_frames
+        self.hold_time = config.GESTURE_CONFIRM_TIME if hold_time is None else hold_time
+        self.release_frames = config.GESTURE_RELEASE_FRAMES if release_frames is None else release_frames
+        self.reset()
+
+    def reset(self):
+        """Revient à l'état de repos"""
+        self.state = self.IDLE
+        self.frames = 0
+        self.since = 0.0
+        self.released = 0
+
+    def update(self, detected: bool, now: float) -> bool:
+        """
+        Met à jour l'état avec la détection de la frame
+
+        Args:
+            detected: Geste présent dans la frame
+            now: Instant (time.monotonic)
+
+        Returns:
+            True à la frame où le geste est confirmé
+        """
+        if self.state == self.IDLE:
+            if not detected:
+                return False
+            self.state = self.HOLDING
+            self.frames = 0
+            self.since = now
+
+        if self.state == self.HOLDING:
+            if not detected:
+                # Une frame sans le geste annule la confirmation en cours
+                self.state = self.IDLE
+                return False
+            self.frames += 1
+            if self.frames >= self.hold_frames and now - self.since >= self.hold_time:
+                self.state = self.ACTIVE
+                self.released = 0
+                return True
+            return False
+
+        # Geste déclenché: il doit disparaître quelques frames avant d'être réarmé
+        if detected:
+            self.released = 0
+        else:
+            self.released += 1
+            if self.released >= self.release_frames:
+                self.state = self.IDLE
+        return False
+
+
+class GestureBus:
+    """Confirme les gestes et les publie aux abonnés"""
+
+    def __init__(self):
+        """Initialise le bus"""
+        self._subscribers: Dict[object, List[Callable[[GestureEvent], None]]] = defaultdict(list)
+        self._gates: Dict[str, GestureGate] = {}
+        self._last_fired: Dict[str, float] = {}
+
+    def subscribe(self, key, callback: Callable[[GestureEvent], None]):
+        """
+        Abonne une fonction aux gestes confirmés
+
+        Args:
+            key: Nom d'un geste ou type d'événement (GestureEvent = tous les gestes)
+            callback: Fonction appelée avec l'événement
+        """
+        self._subscribers[key].append(callback)
+
+    def observe(self, detected: Dict[str, GestureEvent], names: Iterable[str], now: float = None):
+        """
+        Fait avancer les gestes maintenus d'une frame et publie ceux qui sont confirmés
+
+        Args:
+            detected: Événements des gestes présents dans la frame, par nom
+            names: Gestes évalués dans la frame (les autres gardent leur état)
+            now: Instant (time.monotonic par défaut)
+        """
+        now = time.monotonic() if now is None else now
+        for name in names:
+            gate = self._gates.get(name)
+            if gate is None:
+                gate = self._gates[name] = GestureGate(hold_time=config.GESTURE_HOLD_TIMES.get(name))
+            if gate.update(name in detected, now):
+                self.publish(detected[name])
+
+    def publish(self, event: GestureEvent) -> bool:
+        """
+        Publie un geste (les gestes instantanés comme le swipe sont publiés directement)
+
+        Args:
+            event: Geste confirmé
+
+        Returns:
+            False si le geste est encore en cooldown
+        """
+        last = self._last_fired.get(event.name)
+        if last is not None and event.time - last < config.GESTURE_COOLDOWN:
+            return False
+        self._last_fired[event.name] = event.time
+
+        for key in (event.name,) + type(event).__mro__:
+            for callback in self._subscribers.get(key, ()):
+                callback(event)
+        return True
@@ -4,8 +4,130 @@ Détecte paume ouverte, pouce levé, swipe, mains jointes, etc.
 """
 
 import math
+import time
 from typing import Optional, Tuple, List
+
+import numpy as np
+
 import config
+from .gesture_events import GestureBus, HandsTogetherEvent, PoseEvent, SwipeEvent
+from .pose_classifier import NO_POSE, PoseClassifier
+
+
+# Bouts et articulations de base des doigts: pouce, index, majeur, annulaire, auriculaire
+FINGER_TIPS = np.array([4, 8, 12, 16, 20])
+FINGER_BASES = np.array([2, 5, 9, 13, 17])
+THUMB, INDEX, MIDDLE, RING, PINKY = range(5)
+
+# Poids de chaque doigt dans le code d'extension (bit i = doigt i étendu)
+_FINGER_BITS = 1 << np.arange(5)
+
+# Gestes statiques: condition sur les drapeaux d'extension (pouce ... auriculaire)
+STATIC_GESTURES = {
+    'open_palm': lambda f: sum(f) >= 4,
+    'thumbs_up': lambda f: f[THUMB] and sum(not e for e in f[INDEX:]) >= 3,
+    'fist': lambda f: sum(not e for e in f[INDEX:]) >= 3,
+    'peace_sign': lambda f: f[INDEX] and f[MIDDLE] and not f[RING] and not f[PINKY],
+}
+
+
+def _build_gesture_table() -> List[frozenset]:
+    """Gestes reconnus pour chacun des 32 codes d'extension des doigts"""
+    table = []
+    for code in range(1 << 5):
+        flags = tuple(bool(code & bit) for bit in _FINGER_BITS.tolist())
+        table.append(frozenset(name for name, rule in STATIC_GESTURES.items() if rule(flags)))
+    return table
+
+
+STATIC_GESTURE_TABLE = _build_gesture_table()
+
+
+def landmarks_to_array(landmarks_list) -> np.ndarray:
+    """
+    Convertit les landmarks MediaPipe en tableau
+
+    Args:
+        landmarks_list: Landmarks des mains (listes de 21 points)
+
+    Returns:
+        Tableau (mains, 21, 3) des coordonnées normalisées (x, y, z)
+    """
+    return np.array([[(lm.x, lm.y, lm.z) for lm in hand] for hand in landmarks_list], dtype=np.float32)
+
+
+def finger_codes(points: np.ndarray) -> np.ndarray:
+    """
+    Code d'extension des doigts de chaque main
+
+    Un doigt est étendu si son bout est au-dessus de son articulation de base.
+
+    Args:
+        points: Tableau (mains, 21, 3) de landmarks_to_array
+
+    Returns:
+        Codes 5 bits (mains,)
+    """
+    extended = points[:, FINGER_TIPS, 1] < points[:, FINGER_BASES, 1]
+    return extended @ _FINGER_BITS
+
+
+class MotionHistory:
+    """Historique horodaté des positions d'une main (tampon circulaire (t, x, y))"""
+    
+    def __init__(self, size: int = None, window: float = None):
+        """
+        Initialise l'historique
+        
+        Args:
+            size: Nombre d'échantillons conservés (config.GESTURE_HISTORY_SIZE par défaut)
+            window: Durée (s) de la fenêtre (config.SWIPE_TIME_WINDOW par défaut)
+        """
+        self.size = size or config.GESTURE_HISTORY_SIZE
+        self.duration = window
+        self.samples = np.zeros((self.size, 3), dtype=np.float64)
+        # Numéros d'échantillon (croissants): total écrit et début de la fenêtre
+        self.written = 0
+        self.start = 0
+    
+    def __len__(self) -> int:
+        """Nombre d'échantillons dans la fenêtre"""
+        return self.written - self.start
+    
+    def push(self, t: float, x: float, y: float):
+        """
+        Ajoute une position et fait glisser la fenêtre de temps
+        
+        Args:
+            t: Instant (time.monotonic)
+            x, y: Position (pixels de rendu)
+        """
+        self.samples[self.written % self.size] = (t, x, y)
+        self.written += 1
+        self.expire(t)
+    
+    def expire(self, now: float):
+        """Retire les échantillons sortis de la fenêtre de temps"""
+        self.start = max(self.start, self.written - self.size)
+        limit = now - (self.duration or config.SWIPE_TIME_WINDOW)
+        while self.start < self.written and self.samples[self.start % self.size, 0] < limit:
+            self.start += 1
+    
+    def first(self) -> np.ndarray:
+        """Plus ancien échantillon de la fenêtre (t, x, y)"""
+        return self.samples[self.start % self.size]
+    
+    def last(self) -> np.ndarray:
+        """Échantillon le plus récent (t, x, y)"""
+        return self.samples[(self.written - 1) % self.size]
+    
+    def window(self) -> np.ndarray:
+        """Échantillons de la fenêtre dans l'ordre chronologique (n, 3): t, x, y"""
+        return self.samples[np.arange(self.start, self.written) % self.size]
+    
+    def reset(self):
+        """Vide la fenêtre (le mouvement déjà reconnu n'est plus compté)"""
+        self.start = self.written
 
 
 class GestureRecognizer:
@@ -13,13 +135,52 @@ class GestureRecognizer:
     
     def __init__(self):
         """Initialise le reconnaisseur de gestes"""
-        self.left_hand_history = []  # Historique positions main gauche
-        self.right_hand_history = []  # Historique positions main droite
-        self.history_length = 10  # Nombre de frames à garder
+        # Historique horodaté des positions de chaque main
+        self.histories = {'left': MotionHistory(), 'right': MotionHistory()}
         
-        # Cooldowns pour éviter détections multiples
-        self.last_gesture_time = {}
-        self.gesture_cooldown = 1.0  # Secondes
+        # Poses apprises (train_poses.py), sinon règles sur l'extension des doigts
+        self.pose_classifier = PoseClassifier.load() if config.ENABLE_POSE_MODEL else None
+        
+        # Gestes confirmés publiés aux abonnés (maintien, relâchement, cooldown)
+        self.events = GestureBus()
+        
+    @property
+    def static_gestures(self) -> List[str]:
+        """Noms des gestes statiques reconnaissables (poses apprises ou règles)"""
+        if self.pose_classifier is not None:
+            return [name for name in self.pose_classifier.classes if name != NO_POSE]
+        return list(STATIC_GESTURES)
+    
+    def process(self, landmarks_list, left_hand: dict, right_hand: dict, paused: bool = False):
+        """
+        Détecte les gestes de la frame et publie ceux qui sont confirmés sur self.events
+        
+        Args:
+            landmarks_list: Landmarks des mains détectées
+            left_hand: Données main gauche
+            right_hand: Données main droite
+            paused: En pause, seules les mains jointes (reprise) sont suivies
+        """
+        now = time.monotonic()
+        detected = {}
+        names = ['hands_together']
+        
+        if not paused:
+            self.update_history(left_hand, right_hand)
+            names.extend(self.static_gestures)
+            for gestures in self.classify_static(landmarks_list):
+                for name in gestures:
+                    if name not in detected:
+                        detected[name] = PoseEvent(name, timestamp=now)
+            
+            # Le swipe est un mouvement déjà terminé: publié sans maintien
+            swipe = self.detect_swipe_horizontal('right')
+            if swipe:
+                self.events.publish(SwipeEvent(swipe, 'right', now))
+        
+        if self.detect_hands_together(left_hand, right_hand):
+            detected['hands_together'] = HandsTogetherEvent(now)
+        self.events.observe(detected, names, now)
         
     def update_history(self, left_hand: dict, right_hand: dict):
         """
@@ -29,46 +190,55 @@ class GestureRecognizer:
             left_hand: Données main gauche
             right_hand: Données main droite
         """
-        if left_hand['detected'] and left_hand['pos']:
-            self.left_hand_history.append(left_hand['pos'])
-            if len(self.left_hand_history) > self.history_length:
-                self.left_hand_history.pop(0)
-        
-        if right_hand['detected'] and right_hand['pos']:
-            self.right_hand_history.append(right_hand['pos'])
-            if len(self.right_hand_history) > self.history_length:
-                self.right_hand_history.pop(0)
+        now = time.monotonic()
+        for hand, data in (('left', left_hand), ('right', right_hand)):
+            if data['detected'] and data['pos']:
+                self.histories[hand].push(now, data['pos'][0], data['pos'][1])
+            else:
+                self.histories[hand].expire(now)
     
-    def detect_open_palm(self, hand_landmarks) -> bool:
+    def classify_static(self, landmarks_list) -> List[frozenset]:
         """
-        Détecte une paume ouverte (tous les doigts étendus)
+        Reconnaît les gestes statiques de toutes les mains en une seule passe
+        
+        Avec un modèle appris, la pose de chaque main est reconnue par k plus
+        proches voisins après normalisation (rotation comprise). Sinon, les
+        drapeaux d'extension des 5 doigts de toutes les mains sont calculés
+        par une seule opération NumPy puis combinés en un code 5 bits; les gestes
+        correspondants sont lus dans une table précalculée (un nouveau geste
+        ne coûte rien de plus par frame).
         
         Args:
-            hand_landmarks: Landmarks de la main
+            landmarks_list: Landmarks des mains détectées
             
         Returns:
-            True si paume ouverte détectée
+            Ensemble des noms de gestes reconnus, par main
         """
+        if not landmarks_list:
+            return []
+        points = landmarks_to_array(landmarks_list)
+        if self.pose_classifier is not None:
+            return [frozenset((pose,)) if pose else frozenset() for pose in self.pose_classifier.classify(points)]
+        codes = finger_codes(points)
+        return [STATIC_GESTURE_TABLE[code] for code in codes.tolist()]
+    
+    def _detect_static(self, hand_landmarks, gesture_name: str) -> bool:
+        """Vérifie un geste statique sur une seule main"""
         if not hand_landmarks:
             return False
+        return gesture_name in self.classify_static([hand_landmarks])[0]
+    
+    def detect_open_palm(self, hand_landmarks) -> bool:
+        """
+        Détecte une paume ouverte (au moins 4 doigts étendus)
         
-        # Indices des bouts de doigts
-        finger_tips = [4, 8, 12, 16, 20]  # Pouce, Index, Majeur, Annulaire, Auriculaire
-        # Indices des articulations de base
-        finger_bases = [2, 5, 9, 13, 17]
-        
-        # Vérifier que tous les doigts sont étendus
-        extended_count = 0
-        for tip, base in zip(finger_tips, finger_bases):
-            tip_y = hand_landmarks[tip].y
-            base_y = hand_landmarks[base].y
+        Args:
+            hand_landmarks: Landmarks de la main
             
-            # Doigt étendu si le bout est au-dessus de la base
-            if tip_y < base_y:
-                extended_count += 1
-        
-        # Paume ouverte si au moins 4 doigts étendus
-        return extended_count >= 4
+        Returns:
+            True si paume ouverte détectée
+        """
+        return self._detect_static(hand_landmarks, 'open_palm')
     
     def detect_thumbs_up(self, hand_landmarks) -> bool:
         """
@@ -80,57 +250,37 @@ class GestureRecognizer:
         Returns:
             True si pouce levé détecté
         """
-        if not hand_landmarks:
-            return False
-        
-        # Pouce étendu
-        thumb_tip = hand_landmarks[4]
-        thumb_base = hand_landmarks[2]
-        
-        # Autres doigts repliés
-        finger_tips = [8, 12, 16, 20]
-        finger_bases = [5, 9, 13, 17]
-        
-        # Pouce vers le haut
-        thumb_extended = thumb_tip.y < thumb_base.y
-        
-        # Autres doigts repliés
-        fingers_closed = 0
-        for tip, base in zip(finger_tips, finger_bases):
-            if hand_landmarks[tip].y > hand_landmarks[base].y:
-                fingers_closed += 1
-        
-        return thumb_extended and fingers_closed >= 3
+        return self._detect_static(hand_landmarks, 'thumbs_up')
     
     def detect_swipe_horizontal(self, hand_type: str = 'right') -> Optional[str]:
         """
         Détecte un swipe horizontal (gauche ou droite)
         
+        Le mouvement doit couvrir SWIPE_THRESHOLD pixels en moins de
+        SWIPE_TIME_WINDOW secondes, à au moins SWIPE_MIN_VELOCITY pixels/s,
+        et rester surtout horizontal: le résultat ne dépend pas du nombre d'images par seconde.
+        
         Args:
             hand_type: 'left' ou 'right'
             
         Returns:
             'left', 'right' ou None
         """
-        history = self.right_hand_history if hand_type == 'right' else self.left_hand_history
-        
-        if len(history) < 5:
+        history = self.histories[hand_type]
+        if len(history) < 2:
             return None
         
-        # Calculer le déplacement horizontal
-        start_x = history[0][0]
-        end_x = history[-1][0]
-        displacement = end_x - start_x
-        
-        # Seuil de swipe (pixels)
-        swipe_threshold = 150
-        
-        if displacement > swipe_threshold:
-            return 'right'
-        elif displacement < -swipe_threshold:
-            return 'left'
+        t0, x0, y0 = history.first()
+        t1, x1, y1 = history.last()
+        dx, dy, duration = x1 - x0, y1 - y0, t1 - t0
+        if duration <= 0 or abs(dx) < config.SWIPE_THRESHOLD or abs(dy) > abs(dx) * config.SWIPE_MAX_SLOPE:
+            return None
+        if abs(dx) / duration < config.SWIPE_MIN_VELOCITY:
+            return None
         
-        return None
+        # Le même mouvement ne déclenche qu'une fois
+        history.reset()
+        return 'right' if dx > 0 else 'left'
     
     def detect_hands_together(self, left_hand: dict, right_hand: dict) -> bool:
         """
@@ -155,10 +305,7 @@ class GestureRecognizer:
             left_hand['pos'][1] - right_hand['pos'][1]
         )
         
-        # Seuil de proximité (pixels)
-        proximity_threshold = 100
-        
-        return distance < proximity_threshold
+        return distance < config.HANDS_TOGETHER_THRESHOLD
     
     def detect_fist(self, hand_landmarks) -> bool:
         """
@@ -170,19 +317,7 @@ class GestureRecognizer:
         Returns:
             True si poing fermé
         """
-        if not hand_landmarks:
-            return False
-        
-        # Tous les doigts repliés
-        finger_tips = [8, 12, 16, 20]  # Sans le pouce
-        finger_bases = [5, 9, 13, 17]
-        
-        closed_count = 0
-        for tip, base in zip(finger_tips, finger_bases):
-            if hand_landmarks[tip].y > hand_landmarks[base].y:
-                closed_count += 1
-        
-        return closed_count >= 3
+        return self._detect_static(hand_landmarks, 'fist')
     
     def detect_peace_sign(self, hand_landmarks) -> bool:
         """
@@ -194,39 +329,4 @@ class GestureRecognizer:
         Returns:
             True si peace sign détecté
         """
-        if not hand_landmarks:
-            return False
-        
-        # Index et majeur étendus
-        index_extended = hand_landmarks[8].y < hand_landmarks[5].y
-        middle_extended = hand_landmarks[12].y < hand_landmarks[9].y
-        
-        # Autres doigts repliés
-        ring_closed = hand_landmarks[16].y > hand_landmarks[13].y
-        pinky_closed = hand_landmarks[20].y > hand_landmarks[17].y
-        
-        return index_extended and middle_extended and ring_closed and pinky_closed
-    
-    def can_trigger_gesture(self, gesture_name: str) -> bool:
-        """
-        Vérifie si un geste peut être déclenché (cooldown)
-        
-        Args:
-            gesture_name: Nom du geste
-            
-        Returns:
-            True si le geste peut être déclenché
-        """
-        import time
-        current_time = time.time()
-        
-        if gesture_name not in self.last_gesture_time:
-            self.last_gesture_time[gesture_name] = current_time
-            return True
-        
-        elapsed = current_time - self.last_gesture_time[gesture_name]
-        if elapsed >= self.gesture_cooldown:
-            self.last_gesture_time[gesture_name] = current_time
-            return True
-        
-        return False
+        return self._detect_static(hand_landmarks, 'peace_sign')
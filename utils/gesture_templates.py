@@ -0,0 +1,372 @@
+"""
+Module des gestes personnalisés
+Reconnaît des tracés enregistrés par l'utilisateur (cercle, Z, gestes à deux
+mains) sur l'historique des positions des mains, par comparaison avec des
+modèles rééchantillonnés et normalisés au chargement (méthode $1 / Protractor)
+"""
+
+import json
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+import config
+from .gesture_recognizer import MotionHistory
+from .swipe_decoder import resample_polylines
+
+
+TEMPLATES_VERSION = 1
+
+# Types de tracés: une main ou les deux (gauche puis droite)
+TEMPLATE_HANDS = {'left': ('left',), 'right': ('right',), 'both': ('left', 'right')}
+
+# Positions minimales dans la fenêtre pour tenter une reconnaissance
+_MIN_SAMPLES = 8
+
+
+def path_length(points: np.ndarray) -> float:
+    """Longueur parcourue par une suite de positions (n, 2)"""
+    if len(points) < 2:
+        return 0.0
+    return float(np.linalg.norm(np.diff(points, axis=0), axis=1).sum())
+
+
+def normalize_strokes(paths: Dict[str, List[np.ndarray]], n_points: int) -> np.ndarray:
+    """
+    Prépare des tracés pour la comparaison
+
+    Chaque main est rééchantillonnée à pas constant; les mains sont mises
+    bout à bout (gauche puis droite) puis centrées et mises à l'échelle
+    ensemble: la position relative des deux mains fait partie de la forme.
+
+    Args:
+        paths: {'left' / 'right': liste de W suites de positions (k, 2)}
+        n_points: Points par main
+
+    Returns:
+        Tableau (W, n_points * mains, 2)
+    """
+    resampled = []
+    for hand in ('left', 'right'):
+        if hand not in paths:
+            continue
+        lines = [np.asarray(points, dtype=np.float32).reshape(-1, 2) for points in paths[hand]]
+        # Lignes complétées par répétition du dernier point (segments de longueur nulle)
+        length = max(len(line) for line in lines)
+        padded = np.stack([np.concatenate([line, np.repeat(line[-1:], length - len(line), axis=0)])
+                           for line in lines])
+        resampled.append(resample_polylines(padded, n_points))
+    strokes = np.concatenate(resampled, axis=1)
+    strokes -= strokes.mean(axis=1, keepdims=True)
+    extent = np.ptp(strokes, axis=1).max(axis=1)
+    extent = np.where(extent > 0, extent, 1.0)
+    return strokes / extent[:, None, None]
+
+
+def _squared_distances(shapes: np.ndarray, norms: np.ndarray, candidates: np.ndarray,
+                       rotation: bool) -> np.ndarray:
+    """
+    Somme des carrés des écarts point à point entre chaque modèle et chaque tracé
+
+    Avec rotation, la meilleure rotation est obtenue en forme close
+    (Protractor): un seul produit matriciel pour tous les modèles.
+
+    Args:
+        shapes: Modèles aplatis (T, 2M)
+        norms: Carrés des normes des modèles (T,)
+        candidates: Tracés (W, M, 2)
+        rotation: Comparer à la rotation près
+
+    Returns:
+        Distances au carré (T, W)
+    """
+    flat = candidates.reshape(len(candidates), -1)
+    similarity = shapes @ flat.T
+    if rotation:
+        perpendicular = np.stack([candidates[:, :, 1], -candidates[:, :, 0]], axis=2)
+        similarity = np.hypot(similarity, shapes @ perpendicular.reshape(len(candidates), -1).T)
+    return np.maximum(norms[:, None] + (flat * flat).sum(axis=1)[None, :] - 2.0 * similarity, 0.0)
+
+
+class TemplateGroup:
+    """Modèles d'un même type de tracé, empilés pour un score vectorisé"""
+
+    def __init__(self, templates: List[dict], shapes: List[np.ndarray]):
+        """
+        Empile les modèles
+
+        Args:
+            templates: Entrées de la bibliothèque (nom, action)
+            shapes: Tracés normalisés correspondants (M, 2)
+        """
+        self.names = [template['name'] for template in templates]
+        self.actions = [template.get('action') for template in templates]
+        self.points = shapes[0].shape[0]
+
+        stacked = np.stack(shapes).astype(np.float32)                        # (T, M, 2)
+        self.shapes = stacked.reshape(len(shapes), -1)
+        self.norms = (self.shapes * self.shapes).sum(axis=1)
+        # Sous-échantillon pour l'élagage: sa distance minore la distance complète
+        self.step = max(1, config.GESTURE_TEMPLATE_COARSE_STEP)
+        self.coarse = stacked[:, ::self.step].reshape(len(shapes), -1)
+        self.coarse_norms = (self.coarse * self.coarse).sum(axis=1)
+
+    def match(self, candidates: np.ndarray, threshold: float, rotation: bool) -> Optional[Tuple[int, float]]:
+        """
+        Modèle le plus proche d'un des tracés
+
+        Les paires (modèle, tracé) sont d'abord comparées sur un point sur
+        GESTURE_TEMPLATE_COARSE_STEP; seules celles dont cette borne inférieure
+        reste sous le seuil et sous la meilleure distance complète trouvée sont
+        comparées sur tous les points.
+
+        Args:
+            candidates: Tracés normalisés (W, M, 2)
+            threshold: Écart quadratique moyen maximal (unités normalisées)
+            rotation: Comparer à la rotation près
+
+        Returns:
+            (index du modèle, écart quadratique moyen) ou None
+        """
+        limit = threshold * threshold * self.points
+        lower = _squared_distances(self.coarse, self.coarse_norms, candidates[:, ::self.step], rotation)
+        order = np.argsort(lower, axis=None)
+        if lower.flat[order[0]] > limit:
+            return None
+
+        templates, strokes = np.unravel_index(order, lower.shape)
+        best, best_distance = templates[0], self._full_distances(templates[:1], strokes[:1], candidates, rotation)[0]
+        rest = lower.flat[order[1:]] < min(limit, best_distance)
+        if rest.any():
+            distances = self._full_distances(templates[1:][rest], strokes[1:][rest], candidates, rotation)
+            closest = int(np.argmin(distances))
+            if distances[closest] < best_distance:
+                best, best_distance = templates[1:][rest][closest], distances[closest]
+
+        if best_distance > limit:
+            return None
+        return int(best), float(np.sqrt(best_distance / self.points))
+
+    def _full_distances(self, templates: np.ndarray, strokes: np.ndarray, candidates: np.ndarray,
+                        rotation: bool) -> np.ndarray:
+        """Distances complètes de paires (modèle, tracé)"""
+        flat = candidates.reshape(len(candidates), -1)[strokes]
+        shapes = self.shapes[templates]
+        similarity = np.einsum('ij,ij->i', shapes, flat)
+        if rotation:
+            perpendicular = np.stack([candidates[:, :, 1], -candidates[:, :, 0]], axis=2)
+            cross = np.einsum('ij,ij->i', shapes, perpendicular.reshape(len(candidates), -1)[strokes])
+            similarity = np.hypot(similarity, cross)
+        return np.maximum(self.norms[templates] + (flat * flat).sum(axis=1) - 2.0 * similarity, 0.0)
+
+
+class GestureTemplateRecognizer:
+    """Bibliothèque de gestes personnalisés et reconnaissance sur le flux des positions"""
+
+    def __init__(self, path: str = None):
+        """
+        Charge la bibliothèque de modèles
+
+        Args:
+            path: Fichier JSON des modèles (config.GESTURE_TEMPLATES_FILE par défaut)
+        """
+        self.path = path or config.GESTURE_TEMPLATES_FILE
+        self.n_points = config.GESTURE_TEMPLATE_POINTS
+        self.templates: List[dict] = []
+        self.groups: Dict[str, TemplateGroup] = {}
+
+        # Fenêtre glissante des positions de chaque main (pixels de rendu)
+        self.histories = {
+            hand: MotionHistory(config.GESTURE_TEMPLATE_HISTORY_SIZE, config.GESTURE_TEMPLATE_WINDOW)
+            for hand in ('left', 'right')
+        }
+        self._recording: Optional[Dict[str, list]] = None
+
+        self.load()
+
+    @property
+    def recording(self) -> bool:
+        """Un geste est en cours d'enregistrement"""
+        return self._recording is not None
+
+    def load(self):
+        """Charge, rééchantillonne et normalise les modèles du fichier"""
+        self.templates = []
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.templates = json.load(f).get('templates', [])
+            except (OSError, ValueError, AttributeError) as e:
+                print(f"Erreur lors du chargement des gestes personnalisés: {e}")
+        self._rebuild()
+
+    def save(self):
+        """Écrit la bibliothèque de modèles (positions en unités de mise en page)"""
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump({'version': TEMPLATES_VERSION, 'templates': self.templates}, f)
+        except OSError as e:
+            print(f"Erreur lors de la sauvegarde des gestes personnalisés: {e}")
+
+    def _rebuild(self):
+        """Regroupe les modèles par type de tracé"""
+        grouped: Dict[str, Tuple[list, list]] = {hands: ([], []) for hands in TEMPLATE_HANDS}
+        for template in self.templates:
+            try:
+                paths = template['paths']
+                hands = 'both' if len(paths) > 1 else next(iter(paths))
+                shape = normalize_strokes({hand: [paths[hand]] for hand in TEMPLATE_HANDS[hands]}, self.n_points)[0]
+            except (KeyError, TypeError, ValueError, IndexError, StopIteration) as e:
+                print(f"Geste personnalisé ignoré ({template.get('name', '?')}): {e!r}")
+                continue
+            grouped[hands][0].append(template)
+            grouped[hands][1].append(shape)
+        self.groups = {
+            hands: TemplateGroup(templates, shapes)
+            for hands, (templates, shapes) in grouped.items() if templates
+        }
+
+    def add_template(self, name: str, paths: Dict[str, np.ndarray], action: str = None) -> dict:
+        """
+        Ajoute un modèle à la bibliothèque et l'enregistre
+
+        Args:
+            name: Nom du geste
+            paths: {'left' / 'right': positions (k, 2) en pixels de rendu}
+            action: Action associée (voir AirTypingApp.gesture_actions)
+
+        Returns:
+            Entrée ajoutée
+        """
+        template = {
+            'name': name,
+            'action': action,
+            'paths': {
+                hand: (np.asarray(points, dtype=np.float64) / config.LAYOUT_SCALE).round(1).tolist()
+                for hand, points in paths.items()
+            },
+        }
+        self.templates = [t for t in self.templates if t.get('name') != name] + [template]
+        self._rebuild()
+        self.save()
+        return template
+
+    def start_recording(self):
+        """Commence l'enregistrement d'un nouveau geste"""
+        self._recording = {'left': [], 'right': []}
+
+    def stop_recording(self, name: str = None, action: str = None) -> Optional[dict]:
+        """
+        Termine l'enregistrement et ajoute le geste (mains ayant assez bougé)
+
+        Args:
+            name: Nom du geste (geste_<n> par défaut)
+            action: Action associée (config.GESTURE_TEMPLATE_DEFAULT_ACTION par défaut)
+
+        Returns:
+            Entrée ajoutée ou None si le tracé est trop court
+        """
+        recording, self._recording = self._recording, None
+        if recording is None:
+            return None
+        paths = {
+            hand: np.array(points, dtype=np.float32)
+            for hand, points in recording.items()
+            if path_length(np.array(points, dtype=np.float32).reshape(-1, 2)) >= config.GESTURE_TEMPLATE_MIN_PATH
+        }
+        if not paths:
+            return None
+
+        if name is None:
+            names = {t.get('name') for t in self.templates}
+            index = len(self.templates) + 1
+            while f"geste_{index}" in names:
+                index += 1
+            name = f"geste_{index}"
+        return self.add_template(name, paths, action or config.GESTURE_TEMPLATE_DEFAULT_ACTION)
+
+    def update(self, left_hand: dict, right_hand: dict, match: bool = True) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        Ajoute les positions de la frame et cherche un geste personnalisé
+
+        Un pincement (frappe) ou une main perdue interrompt le tracé en cours.
+
+        Args:
+            left_hand: Données main gauche
+            right_hand: Données main droite
+            match: Chercher un geste (sinon seulement suivre les mains)
+
+        Returns:
+            (nom, action) du geste reconnu ou None
+        """
+        now = time.monotonic()
+        for hand, data in (('left', left_hand), ('right', right_hand)):
+            history = self.histories[hand]
+            if data['detected'] and data['pos'] and not data['clicking']:
+                history.push(now, data['pos'][0], data['pos'][1])
+                if self._recording is not None:
+                    self._recording[hand].append(data['pos'])
+            else:
+                history.reset()
+
+        if not match or self._recording is not None or not self.groups:
+            return None
+        return self.match()
+
+    def _suffixes(self, hand: str, now: float) -> Dict[float, np.ndarray]:
+        """Dernières positions d'une main sur chaque durée assez longue pour être un geste"""
+        history = self.histories[hand]
+        if len(history) < _MIN_SAMPLES:
+            return {}
+        samples = history.window()
+        # Distance parcourue depuis le début de la fenêtre à chaque échantillon
+        travelled = np.concatenate([[0.0], np.cumsum(np.linalg.norm(np.diff(samples[:, 1:], axis=0), axis=1))])
+        durations = config.GESTURE_TEMPLATE_DURATIONS
+        starts = np.searchsorted(samples[:, 0], now - np.asarray(durations))
+        suffixes = {}
+        for duration, start in zip(durations, starts.tolist()):
+            if len(samples) - start >= _MIN_SAMPLES and travelled[-1] - travelled[start] >= config.GESTURE_TEMPLATE_MIN_PATH:
+                suffixes[duration] = samples[start:, 1:]
+        return suffixes
+
+    def match(self) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        Compare les tracés récents aux modèles
+
+        Le geste peut suivre un autre mouvement dans la fenêtre: les dernières
+        positions sur chacune des GESTURE_TEMPLATE_DURATIONS sont comparées
+        en un seul lot (mêmes instants pour les deux mains).
+
+        Returns:
+            (nom, action) du modèle le plus proche sous GESTURE_TEMPLATE_THRESHOLD ou None
+        """
+        now = time.monotonic()
+        suffixes = {hand: self._suffixes(hand, now) for hand in self.histories}
+
+        best = None
+        for hands, group in self.groups.items():
+            required = TEMPLATE_HANDS[hands]
+            durations = [d for d in config.GESTURE_TEMPLATE_DURATIONS
+                         if all(d in suffixes[hand] for hand in required)]
+            if not durations:
+                continue
+            candidates = normalize_strokes(
+                {hand: [suffixes[hand][d] for d in durations] for hand in required}, self.n_points
+            )
+            result = group.match(candidates, config.GESTURE_TEMPLATE_THRESHOLD,
+                                 config.GESTURE_TEMPLATE_ROTATION_INVARIANT)
+            if result is not None and (best is None or result[1] < best[2]):
+                best = (group, result[0], result[1], required)
+        if best is None:
+            return None
+
+        group, index, _, required = best
+        # Le tracé reconnu ne doit pas déclencher une seconde fois
+        for hand in required:
+            self.histories[hand].reset()
+        return group.names[index], group.actions[index]
@@ -11,6 +11,106 @@ import config
 import numpy as np
 
 
+class TapDetector:
+    """Détecte un appui vers l'avant de l'index (profondeur + vitesse) ou par temporisation"""
+    
+    IDLE = 'idle'
+    PRESSED = 'pressed'
+    REARM = 'rearm'
+    
+    def __init__(self):
+        """Initialise la machine à états"""
+        self.reset()
+    
+    def reset(self):
+        """Réinitialise l'état (main perdue)"""
+        self.state = self.IDLE
+        self.baseline = None  # Profondeur de repos (moyenne glissante)
+        self.prev_depth = None
+        self.prev_time = None
+        self.velocity = 0.0
+        self.anchor = None  # Position figée pendant l'appui
+        self.motion_start = None  # Position au début du mouvement vers l'avant
+        self.dwell_anchor = None
+        self.dwell_start = None
+        self.dwell_press = False
+    
+    def update(self, t: float, pos: Tuple[int, int], depth: float) -> Tuple[bool, Tuple[int, int], float]:
+        """
+        Met à jour le détecteur
+        
+        Args:
+            t: Temps en secondes
+            pos: Position du bout de l'index (pixels)
+            depth: Avancée du bout de l'index vers la caméra (pixels, relatif au poignet)
+            
+        Returns:
+            Tuple (appui en cours, position à utiliser, progression de la temporisation 0-1)
+        """
+        if self.baseline is None:
+            self.baseline = depth
+            self.prev_depth = depth
+            self.prev_time = t
+            self.dwell_anchor = pos
+            self.dwell_start = t
+        
+        dt = max(t - self.prev_time, 1e-3)
+        raw_velocity = (depth - self.prev_depth) / dt
+        self.velocity = 0.5 * self.velocity + 0.5 * raw_velocity
+        self.prev_depth = depth
+        self.prev_time = t
+        press_depth = depth - self.baseline
+        
+        # Position au début de la poussée: le doigt dérive pendant l'appui
+        if self.velocity > config.TAP_MOTION_VELOCITY:
+            if self.motion_start is None:
+                self.motion_start = pos
+        else:
+            self.motion_start = None
+        
+        moved = math.hypot(pos[0] - self.dwell_anchor[0], pos[1] - self.dwell_anchor[1])
+        dwell_progress = 0.0
+        
+        if self.state == self.IDLE:
+            # La profondeur de repos suit lentement la main
+            self.baseline += config.TAP_BASELINE_ADAPTATION * (depth - self.baseline)
+            
+            if press_depth > config.TAP_PRESS_DEPTH and self.velocity > config.TAP_PRESS_VELOCITY:
+                self.state = self.PRESSED
+                self.dwell_press = False
+                self.anchor = self.motion_start or pos
+            elif config.TAP_DWELL_TIME > 0:
+                if moved > config.TAP_PROXIMITY_THRESHOLD:
+                    self.dwell_anchor = pos
+                    self.dwell_start = t
+                else:
+                    dwell_progress = min(1.0, (t - self.dwell_start) / config.TAP_DWELL_TIME)
+                    if dwell_progress >= 1.0:
+                        self.state = self.PRESSED
+                        self.dwell_press = True
+                        self.anchor = self.dwell_anchor
+        
+        elif self.state == self.PRESSED:
+            if self.dwell_press:
+                # Appui par temporisation: une seule impulsion
+                self.state = self.REARM
+            elif press_depth < config.TAP_RELEASE_DEPTH:
+                # Hystérésis: relâchement sous un seuil plus bas que l'appui
+                self.state = self.IDLE
+                self.dwell_anchor = pos
+                self.dwell_start = t
+        
+        elif self.state == self.REARM:
+            # Quitter la zone de temporisation avant un nouvel appui
+            if moved > config.TAP_PROXIMITY_THRESHOLD:
+                self.state = self.IDLE
+                self.dwell_anchor = pos
+                self.dwell_start = t
+        
+        tapping = self.state == self.PRESSED
+        return tapping, (self.anchor if tapping else pos), dwell_progress
+
+
 class HandDetector:
     """Détecteur de mains utilisant MediaPipe"""
     
@@ -39,6 +139,9 @@ class HandDetector:
         self.prev_right_pos = None
         self.smoothing = config.HOVER_SMOOTHING
         
+        # Mode tap: une machine à états par main
+        self.tap_detectors = {'left': TapDetector(), 'right': TapDetector()}
+        
     def detect(self, frame: np.ndarray, timestamp_ms: int) -> Tuple[dict, dict, List]:
         """
         Détecte les mains dans une frame
@@ -49,8 +152,11 @@ class HandDetector:
             
         Returns:
             Tuple contenant:
-            - Données main gauche: {'pos': (x,y), 'clicking': bool, 'detected': bool}
-            - Données main droite: {'pos': (x,y), 'clicking': bool, 'detected': bool}
+            - Données main gauche: {'pos': (x,y), 'clicking': bool, 'detected': bool, 'dwell': float}
+            - Données main droite: {'pos': (x,y), 'clicking': bool, 'detected': bool, 'dwell': float}
+            
+            En mode tap (config.ENABLE_TAP_MODE), 'clicking' reflète l'appui vers
+            l'avant ou la temporisation au lieu du pincement.
             - Liste des landmarks pour le debug
         """
         # Convert to MediaPipe Image
@@ -60,8 +166,8 @@ class HandDetector:
         results = self.landmarker.detect_for_video(mp_image, timestamp_ms)
         
         # Initialiser les données des mains
-        left_hand = {'pos': None, 'clicking': False, 'detected': False}
-        right_hand = {'pos': None, 'clicking': False, 'detected': False}
+        left_hand = {'pos': None, 'clicking': False, 'detected': False, 'dwell': 0.0}
+        right_hand = {'pos': None, 'clicking': False, 'detected': False, 'dwell': 0.0}
         all_landmarks = []
         
         if results.hand_landmarks:
@@ -72,18 +178,22 @@ class HandDetector:
                 all_landmarks.append(hand_lms)
                 
                 # Index 8 = Index Finger Tip, 4 = Thumb Tip
-                idx_x = int(hand_lms[8].x * config.WINDOW_WIDTH)
-                idx_y = int(hand_lms[8].y * config.WINDOW_HEIGHT)
+                idx_x = int(hand_lms[8].x * config.RENDER_WIDTH)
+                idx_y = int(hand_lms[8].y * config.RENDER_HEIGHT)
                 
                 # Détecter le pincement
-                thumb_x = int(hand_lms[4].x * config.WINDOW_WIDTH)
-                thumb_y = int(hand_lms[4].y * config.WINDOW_HEIGHT)
+                thumb_x = int(hand_lms[4].x * config.RENDER_WIDTH)
+                thumb_y = int(hand_lms[4].y * config.RENDER_HEIGHT)
                 distance = math.hypot(idx_x - thumb_x, idx_y - thumb_y)
                 clicking = distance < config.PINCH_THRESHOLD
                 
+                # Avancée de l'index vers la caméra (z plus petit = plus proche)
+                depth = (hand_lms[0].z - hand_lms[8].z) * config.RENDER_WIDTH
+                
                 hands_data.append({
                     'pos': (idx_x, idx_y),
                     'clicking': clicking,
+                    'depth': depth,
                     'center_x': idx_x  # Pour déterminer gauche/droite
                 })
             
@@ -105,8 +215,10 @@ class HandDetector:
                             int(self.smoothing * self.prev_right_pos[1] + (1 - self.smoothing) * pos[1])
                         )
                     right_hand = {'pos': pos, 'clicking': hand_data['clicking'], 'detected': True}
+                    right_hand = self._apply_tap_mode('right', right_hand, hand_data['depth'], timestamp_ms)
                     self.prev_right_pos = pos
                     self.prev_left_pos = None
+                    self.tap_detectors['left'].reset()
                 else:
                     # Deux mains détectées
                     # Main gauche (index 0)
@@ -118,6 +230,7 @@ class HandDetector:
                             int(self.smoothing * self.prev_left_pos[1] + (1 - self.smoothing) * left_pos[1])
                         )
                     left_hand = {'pos': left_pos, 'clicking': left_data['clicking'], 'detected': True}
+                    left_hand = self._apply_tap_mode('left', left_hand, left_data['depth'], timestamp_ms)
                     self.prev_left_pos = left_pos
                     
                     # Main droite (index 1)
@@ -129,14 +242,42 @@ class HandDetector:
                             int(self.smoothing * self.prev_right_pos[1] + (1 - self.smoothing) * right_pos[1])
                         )
                     right_hand = {'pos': right_pos, 'clicking': right_data['clicking'], 'detected': True}
+                    right_hand = self._apply_tap_mode('right', right_hand, right_data['depth'], timestamp_ms)
                     self.prev_right_pos = right_pos
         else:
             # Réinitialiser le lissage si aucune main détectée
             self.prev_left_pos = None
             self.prev_right_pos = None
+            for detector in self.tap_detectors.values():
+                detector.reset()
         
         return left_hand, right_hand, all_landmarks
     
+    def _apply_tap_mode(self, side: str, hand: dict, depth: float, timestamp_ms: int) -> dict:
+        """
+        Remplace le pincement par l'appui vers l'avant en mode tap
+        
+        Args:
+            side: 'left' ou 'right'
+            hand: Données de la main
+            depth: Avancée de l'index vers la caméra
+            timestamp_ms: Timestamp en millisecondes
+            
+        Returns:
+            Données de la main mises à jour
+        """
+        hand['dwell'] = 0.0
+        if not config.ENABLE_TAP_MODE:
+            # Repartir de zéro quand le mode sera réactivé (pas de temporisation périmée)
+            self.tap_detectors[side].reset()
+            return hand
+        
+        tapping, pos, dwell = self.tap_detectors[side].update(timestamp_ms / 1000.0, hand['pos'], depth)
+        hand['clicking'] = tapping
+        hand['pos'] = pos
+        hand['dwell'] = dwell
+        return hand
+    
     def get_finger_position(self, hand_landmarks, finger_tip_index: int) -> Tuple[int, int]:
         """
         Obtient la position d'un doigt spécifique
@@ -148,8 +289,8 @@ class HandDetector:
         Returns:
             Position (x, y) en pixels
         """
-        x = int(hand_landmarks[finger_tip_index].x * config.WINDOW_WIDTH)
-        y = int(hand_landmarks[finger_tip_index].y * config.WINDOW_HEIGHT)
+        x = int(hand_landmarks[finger_tip_index].x * config.RENDER_WIDTH)
+        y = int(hand_landmarks[finger_tip_index].y * config.RENDER_HEIGHT)
         return (x, y)
     
     def calculate_distance(self, pos1: Tuple[int, int], pos2: Tuple[int, int]) -> float:
@@ -0,0 +1,113 @@
+"""
+Module des widgets du HUD (mode retenu)
+Chaque widget garde sa dernière valeur et sa surface, et ne refait le rendu
+que lorsque la valeur change
+"""
+
+import time
+from typing import Optional, Tuple
+
+import pygame
+
+import config
+from .fonts import render_text
+
+
+class HudText:
+    """Texte du HUD rendu uniquement lorsqu'il change"""
+
+    def __init__(self, font: pygame.font.Font = None):
+        """
+        Initialise le widget
+
+        Args:
+            font: Police du texte (peut être fournie au premier set)
+        """
+        self.font = font
+        self.text: Optional[str] = None
+        self.color: Optional[Tuple[int, ...]] = None
+        self.surface: Optional[pygame.Surface] = None
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.dirty = True
+
+    def set(self, text: str, color: Tuple[int, ...], font: pygame.font.Font = None) -> bool:
+        """
+        Change le texte affiché
+
+        Args:
+            text: Nouveau texte
+            color: Couleur du texte
+            font: Nouvelle police (optionnel)
+
+        Returns:
+            True si le rendu a changé
+        """
+        font = font or self.font
+        if text == self.text and color == self.color and font is self.font:
+            return False
+        self.text, self.color, self.font = text, color, font
+        self.surface = render_text(text, font, color)
+        self.dirty = True
+        return True
+
+    def place(self, pos: Tuple[int, int], anchor: str = 'topleft') -> pygame.Rect:
+        """
+        Positionne le texte sans le dessiner
+
+        Args:
+            pos: Position du point d'ancrage
+            anchor: Attribut de pygame.Rect utilisé comme ancrage
+
+        Returns:
+            Zone occupée par le texte
+        """
+        if self.surface is not None:
+            self.rect = self.surface.get_rect(**{anchor: pos})
+        return self.rect
+
+    def draw(self, screen: pygame.Surface, pos: Tuple[int, int] = None, anchor: str = 'topleft'):
+        """
+        Dessine le texte
+
+        Args:
+            screen: Surface Pygame
+            pos: Position du point d'ancrage (dernière position si None)
+            anchor: Attribut de pygame.Rect utilisé comme ancrage
+        """
+        if self.surface is None:
+            return
+        if pos is not None:
+            self.place(pos, anchor)
+        screen.blit(self.surface, self.rect)
+        self.dirty = False
+
+
+class RefreshLimiter:
+    """Limite la fréquence de mise à jour d'une valeur affichée"""
+
+    def __init__(self, rate: float = None):
+        """
+        Initialise le limiteur
+
+        Args:
+            rate: Mises à jour par seconde (config.HUD_REFRESH_RATE par défaut)
+        """
+        self.interval = 1.0 / (rate or config.HUD_REFRESH_RATE)
+        self.last_refresh = float('-inf')
+
+    def ready(self) -> bool:
+        """
+        Indique si la valeur peut être rafraîchie (et réarme le délai)
+
+        Returns:
+            True si l'intervalle minimal est écoulé
+        """
+        now = time.monotonic()
+        if now - self.last_refresh < self.interval:
+            return False
+        self.last_refresh = now
+        return True
+
+    def force(self):
+        """Autorise le prochain rafraîchissement immédiatement"""
+        self.last_refresh = float('-inf')
@@ -0,0 +1,280 @@
+"""
+Module du journal de session
+Enregistre chaque frappe, pincement et geste dans des fichiers binaires
+segmentés, écrits par lots par un thread d'arrière-plan et lisibles avec
+numpy.memmap pour l'analyse hors ligne
+"""
+
+import getpass
+import glob
+import os
+import struct
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+import config
+
+
+# Format d'un segment (little-endian):
+#   en-tête     : magic (4s) | version (H) | taille d'un enregistrement (H)
+#                 | début de session, epoch (d) | utilisateur UTF-8 (32s) | réservé (16x)
+#   enregistrements : RECORD_DTYPE[...] jusqu'à la fin du fichier
+JOURNAL_MAGIC = b'ATJ1'
+JOURNAL_VERSION = 1
+JOURNAL_EXTENSION = '.atj'
+_HEADER = struct.Struct('<4sHHd32s16x')
+HEADER_SIZE = _HEADER.size
+
+RECORD_DTYPE = np.dtype([
+    ('t', '<f8'),         # Secondes depuis le début de la session
+    ('key', '<i4'),       # Code de la touche (voir key_code) ou index du geste
+    ('x', '<f4'),         # Position du curseur (pixels de mise en page, NaN si absente)
+    ('y', '<f4'),
+    ('latency', '<f4'),   # Début du pincement -> appui (s), NaN si inconnue
+    ('event', 'u1'),      # EVENT_*
+    ('hand', 'u1'),       # HAND_*
+    ('flags', '<u2'),     # Réservé
+])
+
+# Types d'événements
+EVENT_KEY = 0
+EVENT_PINCH_START = 1
+EVENT_PINCH_END = 2
+EVENT_GESTURE = 3
+
+# Mains
+HAND_NONE = 0
+HAND_LEFT = 1
+HAND_RIGHT = 2
+HANDS = {'left': HAND_LEFT, 'right': HAND_RIGHT}
+
+# Gestes enregistrés (index = champ key des événements EVENT_GESTURE)
+GESTURE_NAMES = ('peace_sign', 'thumbs_up', 'swipe', 'hands_together')
+
+# Touches de plusieurs caractères: codes de contrôle ASCII
+SPECIAL_KEYS = {"<-": 8, "ENTER": 10, "SHIFT": 14}
+_SPECIAL_CODES = {code: char for char, code in SPECIAL_KEYS.items()}
+
+
+def key_code(char: Optional[str]) -> int:
+    """
+    Code entier stable d'une touche
+
+    Args:
+        char: Caractère ou libellé de touche
+
+    Returns:
+        Point de code Unicode, code de contrôle pour les touches spéciales, -1 sinon
+    """
+    if char in SPECIAL_KEYS:
+        return SPECIAL_KEYS[char]
+    if char and len(char) == 1:
+        return ord(char)
+    return -1
+
+
+def key_char(code: int) -> str:
+    """
+    Touche correspondant à un code (inverse de key_code)
+
+    Args:
+        code: Code enregistré
+    """
+    if code in _SPECIAL_CODES:
+        return _SPECIAL_CODES[code]
+    return chr(code) if code >= 0 else ''
+
+
+def read_header(path: str) -> Dict:
+    """
+    Lit l'en-tête d'un segment
+
+    Args:
+        path: Fichier du journal
+
+    Returns:
+        Dictionnaire (version, record_size, session_start, user)
+
+    Raises:
+        ValueError: Fichier qui n'est pas un journal compatible
+    """
+    with open(path, 'rb') as f:
+        data = f.read(HEADER_SIZE)
+    if len(data) < HEADER_SIZE:
+        raise ValueError(f"Journal tronqué: {path}")
+    magic, version, record_size, session_start, user = _HEADER.unpack(data)
+    if magic != JOURNAL_MAGIC or version != JOURNAL_VERSION or record_size != RECORD_DTYPE.itemsize:
+        raise ValueError(f"Format de journal non reconnu: {path}")
+    return {
+        'version': version,
+        'record_size': record_size,
+        'session_start': session_start,
+        'user': user.rstrip(b'\0').decode('utf-8', errors='replace'),
+    }
+
+
+def load_journal(path: str) -> Tuple[Dict, np.ndarray]:
+    """
+    Ouvre un segment en lecture par numpy.memmap
+
+    Un enregistrement incomplet en fin de fichier (arrêt brutal) est ignoré.
+
+    Args:
+        path: Fichier du journal
+
+    Returns:
+        (en-tête, enregistrements RECORD_DTYPE mappés en mémoire)
+    """
+    header = read_header(path)
+    count = (os.path.getsize(path) - HEADER_SIZE) // RECORD_DTYPE.itemsize
+    if count == 0:
+        return header, np.zeros(0, dtype=RECORD_DTYPE)
+    records = np.memmap(path, dtype=RECORD_DTYPE, mode='r', offset=HEADER_SIZE, shape=(count,))
+    return header, records
+
+
+class SessionJournal:
+    """Journal binaire de la session, écrit par un thread d'arrière-plan"""
+
+    def __init__(self, directory: str = None, user: str = None):
+        """
+        Démarre une session et son thread d'écriture
+
+        Args:
+            directory: Dossier des segments (config.JOURNAL_DIR par défaut)
+            user: Nom de l'utilisateur (config.JOURNAL_USER ou utilisateur du système)
+        """
+        self.directory = directory or config.JOURNAL_DIR
+        self.user = user or config.JOURNAL_USER or getpass.getuser()
+        self.session_start = time.time()
+        self._clock_start = time.monotonic()
+
+        # Tampon borné: les événements les plus anciens sont perdus si le disque ne suit pas
+        self._pending = deque(maxlen=config.JOURNAL_BUFFER_SIZE)
+        self.recorded = 0
+        self.written = 0
+
+        self._segment = None
+        self._segment_index = 0
+        self._segment_records = 0
+
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='journal-writer', daemon=True)
+        self._thread.start()
+
+    @property
+    def dropped(self) -> int:
+        """Événements perdus faute de place dans le tampon"""
+        return self.recorded - self.written - len(self._pending)
+
+    def record(self, event: int, hand: str = None, char: str = None,
+               pos: Optional[Tuple[float, float]] = None, latency: float = None, key: int = None):
+        """
+        Ajoute un événement (ne bloque jamais)
+
+        Args:
+            event: Type d'événement (EVENT_*)
+            hand: 'left', 'right' ou None
+            char: Touche tapée (convertie par key_code)
+            pos: Position du curseur en pixels de rendu
+            latency: Début du pincement -> appui (s)
+            key: Code brut (index de geste) si char n'est pas fourni
+        """
+        x, y = (pos[0] / config.LAYOUT_SCALE, pos[1] / config.LAYOUT_SCALE) if pos else (np.nan, np.nan)
+        self._pending.append((
+            time.monotonic() - self._clock_start,
+            key_code(char) if char is not None else (-1 if key is None else key),
+            x, y,
+            np.nan if latency is None else latency,
+            event, HANDS.get(hand, HAND_NONE), 0,
+        ))
+        self.recorded += 1
+        if len(self._pending) >= config.JOURNAL_BATCH_SIZE:
+            self._wake.set()
+
+    def record_gesture(self, name: str):
+        """
+        Ajoute un geste déclenché
+
+        Args:
+            name: Nom du geste (voir GESTURE_NAMES)
+        """
+        if name in GESTURE_NAMES:
+            self.record(EVENT_GESTURE, key=GESTURE_NAMES.index(name))
+
+    def close(self):
+        """Écrit les événements restants et arrête le thread"""
+        self._stop.set()
+        self._wake.set()
+        self._thread.join()
+
+    def _run(self):
+        """Boucle du thread: écrit les événements par lots"""
+        try:
+            while not self._stop.is_set():
+                self._wake.wait(config.JOURNAL_FLUSH_INTERVAL)
+                self._wake.clear()
+                self._flush()
+            self._flush()
+        except OSError as e:
+            print(f"Erreur d'écriture du journal: {e}")
+        finally:
+            if self._segment is not None:
+                self._segment.close()
+                self._segment = None
+
+    def _flush(self):
+        """Vide le tampon dans les segments"""
+        batch = []
+        pending = self._pending
+        while pending:
+            try:
+                batch.append(pending.popleft())
+            except IndexError:
+                break
+        if not batch:
+            return
+
+        records = np.array(batch, dtype=RECORD_DTYPE)
+        start = 0
+        while start < len(records):
+            if self._segment is None or self._segment_records >= config.JOURNAL_SEGMENT_RECORDS:
+                self._open_segment()
+            count = min(len(records) - start, config.JOURNAL_SEGMENT_RECORDS - self._segment_records)
+            self._segment.write(records[start:start + count].tobytes())
+            self._segment_records += count
+            start += count
+        self._segment.flush()
+        self.written += len(records)
+
+    def _open_segment(self):
+        """Ferme le segment courant et en commence un nouveau"""
+        if self._segment is not None:
+            self._segment.close()
+        os.makedirs(self.directory, exist_ok=True)
+
+        stamp = datetime.fromtimestamp(self.session_start).strftime('%Y%m%d-%H%M%S')
+        name = f"{stamp}_{self.user}_{self._segment_index:04d}{JOURNAL_EXTENSION}"
+        self._segment = open(os.path.join(self.directory, name), 'wb')
+        self._segment.write(_HEADER.pack(
+            JOURNAL_MAGIC, JOURNAL_VERSION, RECORD_DTYPE.itemsize,
+            self.session_start, self.user.encode('utf-8')[:32]
+        ))
+        self._segment_index += 1
+        self._segment_records = 0
+        self._rotate()
+
+    def _rotate(self):
+        """Supprime les segments les plus anciens au-delà de JOURNAL_MAX_SEGMENTS"""
+        segments = sorted(glob.glob(os.path.join(self.directory, '*' + JOURNAL_EXTENSION)), key=lambda path: (os.path.getmtime(path), path))
+        for path in segments[:max(0, len(segments) - config.JOURNAL_MAX_SEGMENTS)]:
+            try:
+                os.remove(path)
+            except OSError as e:
+                print(f"Impossible de supprimer le segment {path}: {e}")
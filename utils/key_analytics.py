@@ -0,0 +1,256 @@
+"""
+Module d'analyse de la frappe par touche et par bigramme
+Agrège en continu, dans des matrices NumPy de taille fixe, les temps d'appui,
+de survol, les corrections et les intervalles entre touches successives
+"""
+
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pygame
+
+import config
+from .hud import RefreshLimiter
+
+
+# Lignes des tableaux de statistiques: nombre, somme, somme des carrés
+COUNT, TOTAL, SQUARES = 0, 1, 2
+
+# Mesures disponibles pour la carte de chaleur
+HEATMAP_METRICS = ('presses', 'hover_time', 'latency', 'error_rate')
+
+# Couleurs froide et chaude de la carte de chaleur
+HEATMAP_COLD = np.array((0, 120, 255), dtype=np.float32)
+HEATMAP_HOT = np.array((255, 40, 0), dtype=np.float32)
+
+
+def _accumulate(stats: np.ndarray, index, value: float):
+    """Ajoute une mesure à un tableau (nombre, somme, somme des carrés)"""
+    stats[(COUNT,) + index] += 1
+    stats[(TOTAL,) + index] += value
+    stats[(SQUARES,) + index] += value * value
+
+
+def _mean(stats: np.ndarray) -> np.ndarray:
+    """Moyenne de chaque case (NaN sans mesure)"""
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return stats[TOTAL] / stats[COUNT]
+
+
+def _std(stats: np.ndarray) -> np.ndarray:
+    """Écart-type de chaque case (NaN sans mesure)"""
+    mean = _mean(stats)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        variance = stats[SQUARES] / stats[COUNT] - mean * mean
+    return np.sqrt(np.maximum(variance, 0.0))
+
+
+class KeyAnalytics:
+    """Statistiques de frappe par touche et par transition entre touches"""
+
+    def __init__(self, keyboard):
+        """
+        Initialise l'analyse pour un clavier
+
+        Args:
+            keyboard: Clavier virtuel (VirtualKeyboard)
+        """
+        self._limiter = RefreshLimiter(config.HEATMAP_REFRESH_RATE)
+        self.rebuild(keyboard)
+
+    def rebuild(self, keyboard):
+        """
+        Réinitialise les matrices pour les touches du clavier (changement de layout)
+
+        Args:
+            keyboard: Clavier virtuel (VirtualKeyboard)
+        """
+        keys = keyboard.keys
+        n = len(keys)
+        self.chars = [key.char for key in keys]
+        self.rects = [pygame.Rect(key.x, key.y, key.w, key.h) for key in keys]
+        self.centers = np.array([(key.x + key.w / 2, key.y + key.h / 2) for key in keys], dtype=np.float32)
+        self.backspace = self.chars.index("<-") if "<-" in self.chars else None
+        # Distance entre les centres de chaque paire de touches (pixels de rendu)
+        self.distances = np.linalg.norm(self.centers[:, None, :] - self.centers[None, :, :], axis=2)
+
+        # Agrégats: (nombre, somme, somme des carrés) par touche ou par paire
+        self.presses = np.zeros(n, dtype=np.int64)
+        self.latency = np.zeros((3, n), dtype=np.float64)       # Début du pincement -> appui
+        self.hover_time = np.zeros((3, n), dtype=np.float64)    # Entrée sur la touche -> appui
+        self.corrections = np.zeros(n, dtype=np.int64)          # Backspace juste après la touche
+        self.bigrams = np.zeros((3, n, n), dtype=np.float64)    # Intervalle touche précédente -> touche
+
+        # Par main: (touche survolée, instant d'entrée) et instant du début du pincement
+        self._hover: Dict[str, Tuple[Optional[int], float]] = {'left': (None, 0.0), 'right': (None, 0.0)}
+        self._pinch_start: Dict[str, Optional[float]] = {'left': None, 'right': None}
+        self._last_press: Optional[Tuple[int, float]] = None
+
+        # Carte de chaleur: version des données affichées et surface en cache
+        self._changed = False
+        self._version = 0
+        self._heatmap = None
+        self._heatmap_key = None
+
+    def observe(self, hand: str, index: Optional[int], clicking: bool, now: float = None):
+        """
+        Suit le survol et le pincement d'une main (appelé à chaque frame)
+
+        Args:
+            hand: 'left' ou 'right'
+            index: Touche sous le curseur ou None
+            clicking: État du clic
+            now: Instant (time.monotonic par défaut)
+        """
+        now = time.monotonic() if now is None else now
+        if index != self._hover[hand][0]:
+            self._hover[hand] = (index, now)
+        if not clicking:
+            self._pinch_start[hand] = None
+        elif self._pinch_start[hand] is None:
+            self._pinch_start[hand] = now
+
+    def register_press(self, index: int, hand: str, now: float = None):
+        """
+        Enregistre l'appui d'une touche
+
+        Args:
+            index: Touche pressée
+            hand: Main ayant tapé
+            now: Instant (time.monotonic par défaut)
+        """
+        now = time.monotonic() if now is None else now
+        self.presses[index] += 1
+
+        pinch_start = self._pinch_start[hand]
+        if pinch_start is not None:
+            _accumulate(self.latency, (index,), now - pinch_start)
+
+        hovered, hover_start = self._hover[hand]
+        _accumulate(self.hover_time, (index,), now - hover_start if hovered == index else 0.0)
+
+        if self._last_press is not None:
+            previous, previous_time = self._last_press
+            # Un backspace annule la touche précédente
+            if index == self.backspace and previous != self.backspace:
+                self.corrections[previous] += 1
+            interval = now - previous_time
+            if interval <= config.ANALYTICS_BIGRAM_MAX_GAP:
+                _accumulate(self.bigrams, (previous, index), interval)
+
+        self._last_press = (index, now)
+        self._changed = True
+
+    def error_rates(self) -> np.ndarray:
+        """
+        Taux de correction de chaque touche (NaN si jamais pressée)
+
+        Returns:
+            Tableau (n,) des backspaces suivant la touche / appuis
+        """
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return self.corrections / self.presses
+
+    def key_summary(self) -> List[Dict]:
+        """
+        Résumé par touche pressée au moins une fois
+
+        Returns:
+            Liste de dictionnaires (touche, appuis, temps moyens en secondes, taux de correction)
+        """
+        latency = _mean(self.latency)
+        latency_std = _std(self.latency)
+        hover_time = _mean(self.hover_time)
+        errors = self.error_rates()
+        return [
+            {
+                'key': self.chars[i],
+                'presses': int(self.presses[i]),
+                'latency': float(latency[i]),
+                'latency_std': float(latency_std[i]),
+                'hover_time': float(hover_time[i]),
+                'error_rate': float(errors[i]),
+            }
+            for i in np.flatnonzero(self.presses)
+        ]
+
+    def slowest_bigrams(self, count: int = 10) -> List[Tuple[str, str, float, int, float]]:
+        """
+        Transitions les plus lentes (au moins ANALYTICS_MIN_SAMPLES mesures)
+
+        Args:
+            count: Nombre de transitions retournées
+
+        Returns:
+            Liste de (touche précédente, touche, intervalle moyen, mesures, distance)
+        """
+        counts = self.bigrams[COUNT]
+        means = np.where(counts >= config.ANALYTICS_MIN_SAMPLES, _mean(self.bigrams), -np.inf)
+        flat = np.argsort(means, axis=None)[::-1][:count]
+        result = []
+        for previous, current in zip(*np.unravel_index(flat, means.shape)):
+            if means[previous, current] == -np.inf:
+                break
+            result.append((self.chars[previous], self.chars[current],
+                           float(means[previous, current]), int(counts[previous, current]),
+                           float(self.distances[previous, current])))
+        return result
+
+    def metric(self, name: str) -> np.ndarray:
+        """
+        Valeur d'une mesure pour chaque touche (NaN sans donnée)
+
+        Args:
+            name: Une des HEATMAP_METRICS
+        """
+        if name == 'presses':
+            return np.where(self.presses > 0, self.presses, np.nan).astype(np.float64)
+        if name == 'hover_time':
+            return _mean(self.hover_time)
+        if name == 'latency':
+            return _mean(self.latency)
+        return self.error_rates()
+
+    def heatmap_version(self) -> int:
+        """
+        Version de la carte de chaleur, avancée au plus HEATMAP_REFRESH_RATE fois
+        par seconde quand de nouveaux appuis ont été enregistrés
+
+        Returns:
+            Numéro de version (change quand la carte doit être redessinée)
+        """
+        if self._changed and self._limiter.ready():
+            self._version += 1
+            self._changed = False
+        return self._version
+
+    def draw_heatmap(self, screen: pygame.Surface):
+        """
+        Dessine la carte de chaleur des touches (surface mise en cache par version)
+
+        Args:
+            screen: Surface Pygame
+        """
+        key = (self._version, config.HEATMAP_METRIC, screen.get_size())
+        if self._heatmap is None or self._heatmap_key != key:
+            self._heatmap = self._render_heatmap(screen.get_size())
+            self._heatmap_key = key
+        screen.blit(self._heatmap, (0, 0))
+
+    def _render_heatmap(self, size: Tuple[int, int]) -> pygame.Surface:
+        """Rend la carte de chaleur: chaque touche mesurée est teintée du froid au chaud"""
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        values = self.metric(config.HEATMAP_METRIC)
+        measured = np.flatnonzero(~np.isnan(values))
+        if len(measured) == 0:
+            return surface
+
+        low, high = values[measured].min(), values[measured].max()
+        ratio = (values[measured] - low) / (high - low) if high > low else np.ones(len(measured))
+        colors = HEATMAP_COLD + ratio[:, None] * (HEATMAP_HOT - HEATMAP_COLD)
+        alpha = int(255 * config.HEATMAP_OPACITY)
+        for i, color in zip(measured.tolist(), colors.astype(np.int32).tolist()):
+            pygame.draw.rect(surface, tuple(color) + (alpha,), self.rects[i],
+                             border_radius=config.KEY_BORDER_RADIUS)
+        return surface
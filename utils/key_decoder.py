@@ -0,0 +1,514 @@
+"""
+Module de décodage probabiliste des touches
+Combine un modèle de toucher gaussien appris par utilisateur et un modèle
+de langue par n-grammes de caractères pour choisir la touche voulue
+"""
+
+import copy
+import json
+import math
+import os
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+import config
+from .background import BackgroundCache
+
+
+def key_symbol(char: str) -> Optional[str]:
+    """
+    Retourne le symbole d'une touche pour le modèle de langue
+
+    Args:
+        char: Caractère de la touche (ex: 'A', ' ', 'ENTER')
+
+    Returns:
+        Symbole en minuscules, ou None pour les touches sans caractère
+    """
+    if char == "ENTER":
+        return "\n"
+    if char in ("<-", "SHIFT"):
+        return None
+    return char.lower()
+
+
+class TouchModel:
+    """Modèle gaussien des appuis de l'utilisateur autour de chaque touche"""
+
+    def __init__(self):
+        """Initialise un modèle vide (seul l'a priori s'applique)"""
+        # Par touche: [n, moyenne dx, moyenne dy, M2 x, M2 y] (algorithme de Welford)
+        self.stats: Dict[str, List[float]] = {}
+
+    def observe(self, char: str, dx: float, dy: float):
+        """
+        Ajoute un appui observé
+
+        Args:
+            char: Touche visée
+            dx, dy: Décalage de l'appui par rapport au centre de la touche
+        """
+        n, mx, my, m2x, m2y = self.stats.get(char, [0, 0.0, 0.0, 0.0, 0.0])
+        n += 1
+        ddx, ddy = dx - mx, dy - my
+        mx += ddx / n
+        my += ddy / n
+        m2x += ddx * (dx - mx)
+        m2y += ddy * (dy - my)
+        self.stats[char] = [n, mx, my, m2x, m2y]
+
+    def parameters(self, chars: List[str], prior_sigma: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Paramètres gaussiens par touche, lissés vers l'a priori
+
+        Args:
+            chars: Caractères des touches
+            prior_sigma: Écarts-types a priori (K, 2)
+
+        Returns:
+            Tuple (moyennes (K, 2), écarts-types (K, 2))
+        """
+        weight = config.KEY_DECODER_PRIOR_WEIGHT
+        means = np.zeros((len(chars), 2), dtype=np.float32)
+        sigmas = prior_sigma.astype(np.float32).copy()
+        for i, char in enumerate(chars):
+            stats = self.stats.get(char)
+            if not stats:
+                continue
+            n, mx, my, m2x, m2y = stats
+            # Moyenne et variance a posteriori (a priori centré, poids fixe)
+            means[i] = (n * mx / (n + weight), n * my / (n + weight))
+            prior_var = prior_sigma[i] ** 2
+            var_x = (weight * prior_var[0] + m2x) / (weight + n)
+            var_y = (weight * prior_var[1] + m2y) / (weight + n)
+            sigmas[i] = (math.sqrt(var_x), math.sqrt(var_y))
+        return means, sigmas
+
+    @staticmethod
+    def _rescale(stats: List[float], factor: float) -> List[float]:
+        """Change l'unité des statistiques d'une touche (moyennes x f, M2 x f²)"""
+        n, mx, my, m2x, m2y = stats
+        return [n, mx * factor, my * factor, m2x * factor ** 2, m2y * factor ** 2]
+
+    def load(self, path: str):
+        """Charge le modèle depuis un fichier JSON (unités de mise en page)"""
+        if not os.path.exists(path):
+            return
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self.stats = {
+                    char: self._rescale(list(values), config.LAYOUT_SCALE)
+                    for char, values in json.load(f).items()
+                }
+        except (OSError, ValueError) as e:
+            print(f"Erreur lors du chargement du modèle de toucher: {e}")
+
+    def save(self, path: str):
+        """Sauvegarde le modèle dans un fichier JSON (unités de mise en page)"""
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            stats = {char: self._rescale(values, 1.0 / config.LAYOUT_SCALE) for char, values in self.stats.items()}
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(stats, f)
+        except OSError as e:
+            print(f"Erreur lors de la sauvegarde du modèle de toucher: {e}")
+
+
+class CharNgramModel:
+    """Modèle de langue par n-grammes de caractères (interpolation simple)"""
+
+    def __init__(self, order: int = None):
+        """
+        Initialise le modèle
+
+        Args:
+            order: Ordre des n-grammes (config par défaut)
+        """
+        self.order = order or config.KEY_DECODER_NGRAM_ORDER
+        # counts[contexte][caractère] pour chaque longueur de contexte 0..order-1
+        self.counts: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        self.totals: Dict[str, float] = defaultdict(float)
+        self.vocabulary = set()
+
+    def learn(self, context: str, char: str, weight: float = 1.0):
+        """
+        Apprend l'occurrence d'un caractère après un contexte
+
+        Args:
+            context: Texte précédent
+            char: Caractère suivant
+            weight: Poids de l'occurrence
+        """
+        self.vocabulary.add(char)
+        for n in range(self.order):
+            ctx = context[-n:] if n else ""
+            if n and len(ctx) < n:
+                break
+            self.counts[ctx][char] += weight
+            self.totals[ctx] += weight
+
+    def train_from_dictionary(self, dictionary, limit: int = None):
+        """
+        Entraîne le modèle sur les mots les plus fréquents d'un dictionnaire
+
+        Args:
+            dictionary: BinaryDictionary
+            limit: Nombre de mots utilisés
+        """
+        limit = limit or config.KEY_DECODER_TRAINING_WORDS
+        indices = dictionary.top_indices(limit)
+        for word, freq in dictionary.iter_words(indices):
+            weight = math.log1p(freq)
+            text = " " + word + " "
+            for i in range(1, len(text)):
+                self.learn(text[max(0, i - self.order + 1):i], text[i], weight)
+
+    def log_probabilities(self, context: str, symbols: List[Optional[str]]) -> np.ndarray:
+        """
+        Log-probabilités des symboles après un contexte
+
+        Args:
+            context: Texte précédent (en minuscules)
+            symbols: Symboles candidats (None = touche sans caractère)
+
+        Returns:
+            Tableau des log-probabilités
+        """
+        floor = 1.0 / max(len(self.vocabulary), 1)
+        probs = np.empty(len(symbols), dtype=np.float32)
+        lam = config.KEY_DECODER_NGRAM_INTERPOLATION
+        for i, symbol in enumerate(symbols):
+            if symbol is None:
+                probs[i] = floor
+                continue
+            # Interpolation du contexte le plus court au plus long
+            p = floor
+            for n in range(self.order):
+                ctx = context[-n:] if n else ""
+                if n and len(ctx) < n:
+                    break
+                total = self.totals.get(ctx)
+                if total:
+                    p = lam * (self.counts[ctx].get(symbol, 0.0) / total) + (1 - lam) * p
+            probs[i] = max(p, 1e-6)
+        return np.log(probs)
+
+
+class ProbabilisticKeyDecoder:
+    """Choisit la touche la plus probable pour un appui"""
+
+    def __init__(self, keyboard, dictionary=None, touch_model: TouchModel = None):
+        """
+        Initialise le décodeur
+
+        Args:
+            keyboard: VirtualKeyboard
+            dictionary: BinaryDictionary pour amorcer le modèle de langue (optionnel)
+            touch_model: Modèle de toucher (par défaut celui de config.TOUCH_MODEL_FILE)
+        """
+        if touch_model is None:
+            touch_model = TouchModel()
+            touch_model.load(config.TOUCH_MODEL_FILE)
+        self.touch_model = touch_model
+        # Modèles de langue déjà entraînés, par dictionnaire (ils continuent d'apprendre)
+        self._language_models = BackgroundCache('language-model')
+        self.language_model = CharNgramModel()
+        self.retrain_language_model(dictionary)
+
+        # Appui en attente de validation (annulé si suivi d'un backspace)
+        self._pending: Optional[Tuple[str, float, float, str]] = None
+        # Appuis de la session pour l'évaluation hors ligne
+        self.session_presses: List[dict] = []
+
+        self.rebuild(keyboard)
+
+    def retrain_language_model(self, dictionary=None, background: bool = False):
+        """
+        Change de modèle de langue (changement de langue)
+
+        Chaque langue est entraînée une seule fois; en arrière-plan, le modèle
+        précédent reste utilisé jusqu'à ce que le nouveau soit prêt.
+
+        Args:
+            dictionary: BinaryDictionary ou None (modèle uniforme)
+            background: Entraîner sur un thread (touche K)
+        """
+        if dictionary is None:
+            self.language_model = self._language_models.request(None, CharNgramModel, background=False)
+            return
+
+        def train():
+            model = CharNgramModel()
+            model.train_from_dictionary(dictionary)
+            return model
+
+        model = self._language_models.request(dictionary.path, train, background)
+        if model is not None:
+            self.language_model = model
+
+    def _swap_language_model(self):
+        """Adopte le modèle de langue entraîné en arrière-plan s'il est prêt"""
+        model = self._language_models.take()
+        if model is not None:
+            self.language_model = model
+
+    def rebuild(self, keyboard):
+        """
+        Recalcule la géométrie des touches (changement de layout)
+
+        Args:
+            keyboard: VirtualKeyboard
+        """
+        self.keys = list(keyboard.keys)
+        self.chars = [key.char for key in self.keys]
+        self.symbols = [key_symbol(char) for char in self.chars]
+        self.centers = np.array(
+            [(key.x + key.w / 2, key.y + key.h / 2) for key in self.keys], dtype=np.float32
+        ).reshape(-1, 2)
+        sizes = np.array([(key.w, key.h) for key in self.keys], dtype=np.float32).reshape(-1, 2)
+        # Demi-longueur du segment central des touches allongées (espace, shift...)
+        self.half_extent = np.maximum(sizes - sizes.min(axis=1, keepdims=True), 0) / 2
+        self.prior_sigma = np.repeat(
+            sizes.min(axis=1, keepdims=True) * config.KEY_DECODER_SIGMA_SCALE, 2, axis=1
+        )
+        self.half_size = sizes / 2
+        self.refresh_touch_model()
+
+    def refresh_touch_model(self):
+        """Recalcule les paramètres gaussiens après apprentissage"""
+        self.means, self.sigmas = self.touch_model.parameters(self.chars, self.prior_sigma)
+
+    def _offsets(self, pos: Tuple[float, float]) -> np.ndarray:
+        """Décalages (K, 2) d'une position par rapport à l'axe central des touches"""
+        delta = np.asarray(pos, dtype=np.float32) - self.centers
+        return np.sign(delta) * np.maximum(np.abs(delta) - self.half_extent, 0)
+
+    def touch_log_likelihoods(self, pos: Tuple[float, float]) -> np.ndarray:
+        """
+        Log-vraisemblance gaussienne d'un appui pour chaque touche
+
+        Args:
+            pos: Position de l'appui
+
+        Returns:
+            Tableau (K,)
+        """
+        z = (self._offsets(pos) - self.means) / self.sigmas
+        return -0.5 * (z ** 2).sum(axis=1) - np.log(self.sigmas).sum(axis=1)
+
+    def decode(self, pos: Tuple[float, float], context: str = "") -> Optional[int]:
+        """
+        Retourne l'index de la touche la plus probable
+
+        Args:
+            pos: Position de l'appui
+            context: Texte précédant l'appui
+
+        Returns:
+            Index dans keyboard.keys, ou None si l'appui est hors du clavier
+        """
+        if not self.keys:
+            return None
+        self._swap_language_model()
+
+        # Seules les touches proches sont candidates
+        outside = np.maximum(
+            np.abs(np.asarray(pos, dtype=np.float32) - self.centers) - self.half_size, 0
+        )
+        candidates = np.flatnonzero(np.hypot(outside[:, 0], outside[:, 1]) <= config.KEY_DECODER_MAX_DISTANCE)
+        if len(candidates) == 0:
+            return None
+        if len(candidates) == 1:
+            return int(candidates[0])
+
+        scores = self.touch_log_likelihoods(pos)[candidates]
+        context = context[-(self.language_model.order - 1):].lower() if self.language_model.order > 1 else ""
+        scores = scores + config.KEY_DECODER_LM_WEIGHT * self.language_model.log_probabilities(
+            context, [self.symbols[i] for i in candidates]
+        )
+        return int(candidates[int(np.argmax(scores))])
+
+    def register_press(self, key_index: int, pos: Tuple[float, float], context: str):
+        """
+        Enregistre un appui décodé pour l'adaptation au toucher de l'utilisateur
+
+        L'appui précédent n'est appris que s'il n'a pas été corrigé par un
+        backspace: on évite ainsi d'apprendre les erreurs.
+
+        Args:
+            key_index: Index de la touche retenue
+            pos: Position brute de l'appui
+            context: Texte précédant l'appui
+        """
+        char = self.chars[key_index]
+        # Journal en unités de mise en page: rejouable quelle que soit la résolution
+        self.session_presses.append({
+            't': time.time(),
+            'x': float(pos[0]) / config.LAYOUT_SCALE,
+            'y': float(pos[1]) / config.LAYOUT_SCALE,
+            'char': char
+        })
+
+        if char == "<-":
+            self._pending = None
+            return
+
+        self._commit_pending()
+        dx, dy = self._offsets(pos)[key_index]
+        self._pending = (char, float(dx), float(dy), context)
+
+    def _commit_pending(self):
+        """Apprend l'appui en attente"""
+        if self._pending is None:
+            return
+        char, dx, dy, context = self._pending
+        self.touch_model.observe(char, dx, dy)
+        symbol = key_symbol(char)
+        if symbol is not None:
+            self.language_model.learn(context[-(self.language_model.order - 1):].lower(), symbol)
+        self._pending = None
+        self.refresh_touch_model()
+
+    def save(self):
+        """Sauvegarde le modèle de toucher et le journal des appuis de la session"""
+        self._commit_pending()
+        self.touch_model.save(config.TOUCH_MODEL_FILE)
+        if not self.session_presses:
+            return
+        try:
+            directory = os.path.dirname(config.TOUCH_SESSIONS_FILE)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(config.TOUCH_SESSIONS_FILE, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(self.session_presses) + "\n")
+            self.session_presses = []
+        except OSError as e:
+            print(f"Erreur lors de l'enregistrement des appuis: {e}")
+
+
+def label_presses(presses: List[dict]) -> List[dict]:
+    """
+    Déduit la touche voulue pour chaque appui d'une session enregistrée
+
+    Un appui suivi d'un backspace était une erreur: la touche voulue est
+    celle tapée juste après la correction.
+
+    Args:
+        presses: Appuis {'t', 'x', 'y', 'char'} dans l'ordre chronologique
+
+    Returns:
+        Appuis non-backspace complétés d'une clé 'intended'
+    """
+    labeled = []
+    stack = []  # Appuis encore présents dans le texte
+    erased = []  # Appuis effacés, du plus récent au plus ancien
+    for press in presses:
+        if press['char'] == "<-":
+            if stack:
+                entry = stack.pop()
+                entry['erased'] = True
+                erased.append(entry)
+            continue
+        if erased:
+            # La frappe suivante réécrit la position effacée la plus ancienne
+            erased.pop()['intended'] = press['char']
+        entry = dict(press, intended=press['char'], erased=False)
+        stack.append(entry)
+        labeled.append(entry)
+    return labeled
+
+
+def fit_sessions(decoder: ProbabilisticKeyDecoder, sessions: List[List[dict]]):
+    """
+    Apprend les appuis de sessions enregistrées (comme en cours de frappe)
+
+    Seuls les appuis non effacés par un backspace sont appris.
+
+    Args:
+        decoder: Décodeur dont les modèles sont complétés
+        sessions: Sessions enregistrées (listes d'appuis)
+    """
+    order = decoder.language_model.order
+    for session in sessions:
+        context = ""
+        for press in label_presses(session):
+            if press['erased'] or press['char'] not in decoder.chars:
+                continue
+            index = decoder.chars.index(press['char'])
+            dx, dy = decoder._offsets((press['x'], press['y']))[index]
+            decoder.touch_model.observe(press['char'], float(dx), float(dy))
+            symbol = key_symbol(press['char'])
+            if symbol is not None:
+                decoder.language_model.learn(context[-(order - 1):] if order > 1 else "", symbol)
+                context = (context + symbol)[-8:]
+    decoder.refresh_touch_model()
+
+
+def evaluate_decoder(keyboard, sessions: List[List[dict]], dictionary=None) -> Dict[str, dict]:
+    """
+    Compare le décodage par rectangles et le décodage probabiliste
+
+    Chaque session est décodée par des modèles appris sur les autres sessions
+    seulement (validation croisée « une session exclue »): le modèle de
+    toucher enregistré, qui a déjà vu ces appuis, n'est pas utilisé.
+
+    Args:
+        keyboard: VirtualKeyboard (géométrie des touches)
+        sessions: Sessions enregistrées (listes d'appuis)
+        dictionary: BinaryDictionary pour amorcer le modèle de langue (optionnel)
+
+    Returns:
+        {'rectangle': {...}, 'probabilistic': {...}} avec taux d'erreur et WPM estimé
+    """
+    decoder = ProbabilisticKeyDecoder(keyboard, dictionary, touch_model=TouchModel())
+    base_language_model = decoder.language_model
+
+    counts = {mode: {'presses': 0, 'errors': 0, 'chars': 0, 'duration': 0.0}
+              for mode in ('rectangle', 'probabilistic')}
+    for held_out, session in enumerate(sessions):
+        labeled = label_presses(session)
+        if len(labeled) < 2:
+            continue
+
+        # Modèles appris sans la session évaluée
+        decoder.touch_model = TouchModel()
+        decoder.language_model = copy.deepcopy(base_language_model)
+        fit_sessions(decoder, sessions[:held_out] + sessions[held_out + 1:])
+
+        for mode, metrics in counts.items():
+            metrics['duration'] += max(labeled[-1]['t'] - labeled[0]['t'], 0.0)
+            context = ""
+            for press in labeled:
+                pos = (press['x'], press['y'])
+                if mode == 'rectangle':
+                    hits = [i for i, key in enumerate(decoder.keys)
+                            if key.x < pos[0] < key.x + key.w and key.y < pos[1] < key.y + key.h]
+                    index = hits[0] if hits else None
+                else:
+                    index = decoder.decode(pos, context)
+                predicted = decoder.chars[index] if index is not None else None
+                metrics['presses'] += 1
+                if predicted != press['intended']:
+                    metrics['errors'] += 1
+                if not press['erased']:
+                    metrics['chars'] += 1
+                symbol = key_symbol(press['intended'])
+                if symbol is not None:
+                    context = (context + symbol)[-8:]
+
+    results = {}
+    for mode, metrics in counts.items():
+        presses, errors, chars = metrics['presses'], metrics['errors'], metrics['chars']
+        error_rate = errors / presses if presses else 0.0
+        # Chaque erreur coûte l'appui fautif et un backspace
+        keystrokes = chars + 2 * errors
+        seconds_per_key = metrics['duration'] / presses if presses else 0.0
+        minutes = keystrokes * seconds_per_key / 60
+        wpm = (chars / 5) / minutes if minutes > 0 else 0.0
+        results[mode] = {'presses': presses, 'errors': errors, 'error_rate': error_rate, 'wpm': wpm}
+    return results
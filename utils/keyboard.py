@@ -3,9 +3,12 @@ Module du clavier virtuel
 Gère l'affichage, les interactions et la logique du clavier
 """
 
+import time
 import pygame
 from typing import List, Optional, Tuple
 import config
+from .fonts import render_text
+from .journal import EVENT_KEY, EVENT_PINCH_START, EVENT_PINCH_END
 
 
 class Key:
@@ -72,6 +75,15 @@ class Key:
             print(f"DEBUG Key '{self.char}': TRIGGERED!")
         return result
     
+    @property
+    def bounds(self) -> pygame.Rect:
+        """Zone couverte par le dessin de la touche (halo et ombre compris)"""
+        return pygame.Rect(self.x - 5, self.y - 5, self.w + 10, self.h + 10)
+    
+    def render_state(self) -> tuple:
+        """État visuel de la touche: la redessiner seulement s'il change"""
+        return (self.is_hovered, self.is_pressed, self.press_animation)
+    
     def draw(self, screen: pygame.Surface, theme: dict, font: pygame.font.Font):
         """
         Dessine la touche avec effet glassmorphism
@@ -83,14 +95,15 @@ class Key:
         """
         # Déterminer la couleur et l'épaisseur
         if self.is_pressed:
-            color = theme['key_pressed']
+            state = 'key_pressed'
             thickness = config.KEY_BORDER_THICKNESS_PRESSED
         elif self.is_hovered:
-            color = theme['key_hover']
+            state = 'key_hover'
             thickness = config.KEY_BORDER_THICKNESS_HOVER
         else:
-            color = theme['key_normal']
+            state = 'key_normal'
             thickness = config.KEY_BORDER_THICKNESS_NORMAL
+        color = theme[state]
         
         # Effet de pression (légère réduction de taille)
         offset = int(self.press_animation * 4)
@@ -123,9 +136,7 @@ class Key:
         # Fond glassmorphism (semi-transparent)
         if self.press_animation > 0 or self.is_hovered:
             alpha = int(100 + (self.press_animation * 100))
-            # Handle RGBA colors by taking only the first 3 components (RGB)
-            rgb = color[:3]
-            fill_color = tuple(int(c * 0.4) for c in rgb) + (alpha,)
+            fill_color = theme[state + '_fill'] + (alpha,)
             glass_surface = pygame.Surface((draw_rect[2], draw_rect[3]), pygame.SRCALPHA)
             pygame.draw.rect(
                 glass_surface,
@@ -136,11 +147,10 @@ class Key:
             screen.blit(glass_surface, (draw_rect[0], draw_rect[1]))
         
         # Dessiner le contour avec glow si survolé
-        if self.is_hovered:
+        if self.is_hovered and config.ENABLE_KEY_GLOW:
             # Glow externe
             glow_surface = pygame.Surface((draw_rect[2] + 10, draw_rect[3] + 10), pygame.SRCALPHA)
-            # Handle RGBA by taking RGB parts and adding fixed alpha
-            glow_color = color[:3] + (50,)
+            glow_color = theme[state + '_glow']
             pygame.draw.rect(
                 glow_surface,
                 glow_color,
@@ -162,14 +172,14 @@ class Key:
         label = self._get_label()
         
         # Ombre du texte
-        text_shadow = font.render(label, True, (0, 0, 0))
+        text_shadow = render_text(label, font, (0, 0, 0))
         shadow_rect = text_shadow.get_rect(
             center=(self.x + self.w // 2 + 2, self.y + self.h // 2 + 2)
         )
         screen.blit(text_shadow, shadow_rect)
         
         # Texte principal
-        text_surface = font.render(label, True, color)
+        text_surface = render_text(label, font, color)
         text_rect = text_surface.get_rect(
             center=(self.x + self.w // 2, self.y + self.h // 2)
         )
@@ -208,6 +218,25 @@ class VirtualKeyboard:
         # État du Shift
         self.shift_active = False
         
+        # Décodage probabiliste des appuis (optionnel, voir key_decoder.py)
+        self.key_decoder = None
+        # Statistiques par touche et par bigramme (optionnelles, voir key_analytics.py)
+        self.analytics = None
+        # Journal binaire de la session (optionnel, voir journal.py)
+        self.journal = None
+        # Journal des modifications du texte (optionnel, voir persistence.py)
+        self.persistence = None
+        # Position de l'appui retenue pendant le pincement, par main
+        self._press_latch = {'left': None, 'right': None}
+        self._press_origin = {'left': None, 'right': None}
+        self._press_time = {'left': None, 'right': None}
+        
+        # Autocorrection par mot (optionnelle, voir autocorrect.py)
+        self.autocorrector = None
+        self.word_presses: List[Tuple[int, int]] = []  # Positions des appuis du mot en cours
+        self.last_correction = None  # (mot tapé, mot corrigé, appuis) annulable par backspace
+        self._skip_correction = None  # Mot restauré à ne pas recorriger
+        
         # Créer les touches
         self._create_keys()
         
@@ -240,7 +269,7 @@ class VirtualKeyboard:
                 
                 # Incrémenter X pour la prochaine touche
                 # Ajouter la largeur de la touche actuelle + un petit espacement
-                current_x += w + 10  # 10 pixels d'espacement entre les touches
+                current_x += w + config.KEY_GAP
     
     def update(self, cursor_pos_left: Optional[Tuple[int, int]], clicking_left: bool,
                cursor_pos_right: Optional[Tuple[int, int]], clicking_right: bool) -> Optional[str]:
@@ -258,14 +287,25 @@ class VirtualKeyboard:
         """
         typed_chars = []
         
+        # Survol et pincement bruts de chaque main pour les statistiques
+        if self.analytics is not None:
+            self._observe('left', cursor_pos_left, clicking_left)
+            self._observe('right', cursor_pos_right, clicking_right)
+        
+        # Décodage probabiliste: l'appui est attribué à la touche la plus probable
+        cursor_pos_left = self._decode_press('left', cursor_pos_left, clicking_left)
+        cursor_pos_right = self._decode_press('right', cursor_pos_right, clicking_right)
+        
         # Traiter chaque main séparément
         for key in self.keys:
             # Main gauche
             if key.update(cursor_pos_left, clicking_left):
                 if key.char != self.last_clicked_char_left or not clicking_left:
-                    char = self._process_key_press(key)
+                    context = self.typed_text
+                    char = self._process_key_press(key, self._press_origin['left'] or cursor_pos_left)
                     if char:
                         typed_chars.append(char)
+                    self._record_press(key, 'left', context)
                     self.last_clicked_char_left = key.char
             
             # Main droite (réinitialiser l'état hover/pressed pour la deuxième vérification)
@@ -278,9 +318,11 @@ class VirtualKeyboard:
                 if key.char != self.last_clicked_char_right or not clicking_right:
                     # Éviter de taper deux fois si les deux mains sont sur la même touche
                     if key.char != self.last_clicked_char_left or not clicking_left:
-                        char = self._process_key_press(key)
+                        context = self.typed_text
+                        char = self._process_key_press(key, self._press_origin['right'] or cursor_pos_right)
                         if char:
                             typed_chars.append(char)
+                        self._record_press(key, 'right', context)
                     self.last_clicked_char_right = key.char
             
             # Combiner les états hover/pressed des deux mains pour l'affichage
@@ -296,12 +338,83 @@ class VirtualKeyboard:
         # Retourner le premier caractère tapé (ou None)
         return typed_chars[0] if typed_chars else None
     
-    def _process_key_press(self, key: Key) -> Optional[str]:
+    def _decode_press(self, hand: str, pos: Optional[Tuple[int, int]], clicking: bool) -> Optional[Tuple[int, int]]:
+        """
+        Remplace la position d'un appui par le centre de la touche décodée
+        
+        La touche est choisie au début du pincement puis verrouillée tant
+        qu'il est maintenu: une oscillation sur une bordure ne change plus
+        la touche.
+        
+        Args:
+            hand: 'left' ou 'right'
+            pos: Position brute du curseur
+            clicking: État du clic
+            
+        Returns:
+            Position à utiliser pour la détection des touches
+        """
+        if not clicking or not pos:
+            if self.journal is not None and self._press_origin[hand] is not None:
+                self.journal.record(EVENT_PINCH_END, hand, pos=pos)
+            self._press_latch[hand] = None
+            self._press_origin[hand] = None
+            self._press_time[hand] = None
+            return pos
+        
+        if self._press_origin[hand] is None:
+            # Début du pincement: mémoriser la position brute de l'appui
+            self._press_origin[hand] = pos
+            self._press_time[hand] = time.monotonic()
+            if self.journal is not None:
+                self.journal.record(EVENT_PINCH_START, hand, pos=pos)
+            if self.key_decoder is not None and config.ENABLE_KEY_DECODER:
+                index = self.key_decoder.decode(pos, self.typed_text[-8:])
+                if index is not None:
+                    key = self.keys[index]
+                    self._press_latch[hand] = (key.x + key.w // 2, key.y + key.h // 2)
+        
+        return self._press_latch[hand] or pos
+    
+    def _observe(self, hand: str, pos: Optional[Tuple[int, int]], clicking: bool):
+        """
+        Transmet la touche survolée par une main aux statistiques
+        
+        Args:
+            hand: 'left' ou 'right'
+            pos: Position brute du curseur
+            clicking: État du clic
+        """
+        key = self.key_at(pos)
+        self.analytics.observe(hand, self.keys.index(key) if key is not None else None, clicking)
+    
+    def _record_press(self, key: Key, hand: str, context: str):
+        """
+        Transmet un appui au décodeur pour l'adaptation au toucher, aux
+        statistiques et au journal
+        
+        Args:
+            key: Touche pressée
+            hand: Main ayant tapé
+            context: Texte avant l'appui
+        """
+        if self.analytics is not None:
+            self.analytics.register_press(self.keys.index(key), hand)
+        if self.journal is not None:
+            press_time = self._press_time[hand]
+            latency = time.monotonic() - press_time if press_time is not None else None
+            self.journal.record(EVENT_KEY, hand, key.char, self._press_origin[hand], latency)
+        origin = self._press_origin[hand]
+        if self.key_decoder is not None and config.ENABLE_KEY_DECODER and origin is not None:
+            self.key_decoder.register_press(self.keys.index(key), origin, context[-8:])
+    
+    def _process_key_press(self, key: Key, pos: Optional[Tuple[int, int]] = None) -> Optional[str]:
         """
         Traite l'appui sur une touche
         
         Args:
             key: Touche pressée
+            pos: Position réelle de l'appui (pour l'autocorrection)
             
         Returns:
             Caractère tapé ou None
@@ -313,12 +426,19 @@ class VirtualKeyboard:
             return None
         elif key.char == "ENTER":
             # Nouvelle ligne
-            self.typed_text += "\n"
+            self._edit(len(self.typed_text), "\n")
+            self.word_presses = []
+            self.last_correction = None
             return "\n"
         elif key.char == "<-":
+            # Backspace juste après une correction: l'annuler
+            if self._undo_correction():
+                return "<-"
             # Backspace
             if self.typed_text:
-                self.typed_text = self.typed_text[:-1]
+                self._edit(len(self.typed_text) - 1)
+                if self.word_presses:
+                    self.word_presses.pop()
                 return "<-"
         else:
             # Caractère normal - appliquer shift si actif
@@ -328,10 +448,75 @@ class VirtualKeyboard:
                 # Désactiver shift après utilisation (comportement standard)
                 self.shift_active = False
             
-            self.typed_text += char
+            self.last_correction = None
+            if char == " ":
+                self._autocorrect_current_word()
+                self.word_presses = []
+            elif char.isalpha():
+                self.word_presses.append(pos or (key.x + key.w // 2, key.y + key.h // 2))
+            else:
+                self.word_presses = []
+            
+            self._edit(len(self.typed_text), char)
             return char
         return None
     
+    def _edit(self, keep: int, inserted: str = ""):
+        """
+        Modifie la fin du texte: garde les keep premiers caractères puis ajoute inserted
+        
+        Toutes les modifications du texte passent par ici pour être journalisées.
+        
+        Args:
+            keep: Nombre de caractères conservés
+            inserted: Texte ajouté après
+        """
+        self.typed_text = self.typed_text[:keep] + inserted
+        if self.persistence is not None:
+            self.persistence.record_edit(keep, inserted)
+    
+    def _current_word(self) -> str:
+        """Retourne le mot en cours de saisie (lettres finales du texte)"""
+        start = len(self.typed_text)
+        while start > 0 and self.typed_text[start - 1].isalpha():
+            start -= 1
+        return self.typed_text[start:]
+    
+    def _autocorrect_current_word(self):
+        """Corrige le mot en cours à partir des positions de ses appuis"""
+        word = self._current_word()
+        if self.autocorrector is None or not config.ENABLE_AUTOCORRECT or not word:
+            return
+        if word == self._skip_correction:
+            self._skip_correction = None
+            return
+        
+        corrected = self.autocorrector.correct(word, self.word_presses)
+        if corrected:
+            self._edit(len(self.typed_text) - len(word), corrected)
+            self.last_correction = (word, corrected, list(self.word_presses))
+            print(f"Autocorrection: '{word}' -> '{corrected}'")
+    
+    def _undo_correction(self) -> bool:
+        """
+        Annule la dernière autocorrection si rien n'a été tapé depuis
+        
+        Returns:
+            True si une correction a été annulée
+        """
+        if self.last_correction is None:
+            return False
+        word, corrected, presses = self.last_correction
+        self.last_correction = None
+        if not self.typed_text.endswith(corrected + " "):
+            return False
+        
+        # Restaure le mot tapé (sans l'espace) et empêche sa recorrection
+        self._edit(len(self.typed_text) - (len(corrected) + 1), word)
+        self.word_presses = presses
+        self._skip_correction = word
+        return True
+    
     def _apply_shift(self, char: str) -> str:
         """
         Applique la transformation Shift à un caractère
@@ -368,13 +553,25 @@ class VirtualKeyboard:
             theme: Thème de couleurs
             font: Police pour les touches
         """
-        # Dessiner les zones intelligentes si activées
-        if config.ENABLE_SMART_ZONES:
-            self._draw_smart_zones(screen, theme)
+        self.draw_static(screen, theme)
         
         for key in self.keys:
             key.draw(screen, theme, font)
     
+    def draw_static(self, screen: pygame.Surface, theme: dict):
+        """
+        Dessine les éléments fixes du clavier (zones intelligentes et carte de
+        chaleur si activées)
+        
+        Args:
+            screen: Surface Pygame
+            theme: Thème de couleurs
+        """
+        if config.ENABLE_SMART_ZONES:
+            self._draw_smart_zones(screen, theme)
+        if config.SHOW_KEY_HEATMAP and self.analytics is not None:
+            self.analytics.draw_heatmap(screen)
+    
     def _draw_smart_zones(self, screen: pygame.Surface, theme: dict):
         """
         Dessine les zones intelligentes (gauche/droite)
@@ -400,13 +597,7 @@ class VirtualKeyboard:
         left_zone_height = max_y - min_y
         
         left_surface = pygame.Surface((left_zone_width, left_zone_height), pygame.SRCALPHA)
-        left_color = theme['cursor']
-        # Ensure we only use RGB for tint calculation if cursor becomes RGBA
-        left_color_rgb = left_color[:3]
-        left_tint = tuple(min(255, max(0, c + offset)) 
-                         for c, offset in zip(left_color_rgb, config.LEFT_ZONE_COLOR_TINT))
-        left_tint_alpha = left_tint + (int(255 * config.ZONE_OPACITY),)
-        left_surface.fill(left_tint_alpha)
+        left_surface.fill(theme['zone_left'])
         screen.blit(left_surface, (min_x, min_y))
         
         # Zone droite (orangée)
@@ -414,26 +605,78 @@ class VirtualKeyboard:
         right_zone_height = max_y - min_y
         
         right_surface = pygame.Surface((right_zone_width, right_zone_height), pygame.SRCALPHA)
-        right_color = theme['cursor']
-        # Ensure we only use RGB for tint calculation
-        right_color_rgb = right_color[:3]
-        right_tint = tuple(min(255, max(0, c + offset)) 
-                          for c, offset in zip(right_color_rgb, config.RIGHT_ZONE_COLOR_TINT))
-        right_tint_alpha = right_tint + (int(255 * config.ZONE_OPACITY),)
-        right_surface.fill(right_tint_alpha)
+        right_surface.fill(theme['zone_right'])
         screen.blit(right_surface, (mid_x, min_y))
     
+    def key_at(self, pos: Optional[Tuple[int, int]]) -> Optional[Key]:
+        """
+        Retourne la touche située sous une position
+        
+        Args:
+            pos: Position (x, y) ou None
+            
+        Returns:
+            Touche trouvée ou None
+        """
+        if not pos:
+            return None
+        for key in self.keys:
+            if key.x < pos[0] < key.x + key.w and key.y < pos[1] < key.y + key.h:
+                return key
+        return None
+    
+    def press_at(self, pos: Optional[Tuple[int, int]]) -> Optional[str]:
+        """
+        Appuie sur la touche située sous une position
+        
+        Args:
+            pos: Position (x, y) ou None
+            
+        Returns:
+            Caractère tapé ou None
+        """
+        key = self.key_at(pos)
+        if key is None:
+            return None
+        return self._process_key_press(key, pos)
+    
+    def type_word(self, word: str) -> str:
+        """
+        Insère un mot complet (saisie gestuelle), précédé d'un espace si besoin
+        
+        Args:
+            word: Mot à insérer
+            
+        Returns:
+            Texte réellement inséré
+        """
+        if self.shift_active:
+            word = word[:1].upper() + word[1:]
+            self.shift_active = False
+        
+        inserted = word
+        if self.typed_text and not self.typed_text[-1].isspace():
+            inserted = " " + word
+        self._edit(len(self.typed_text), inserted)
+        self.word_presses = []
+        self.last_correction = None
+        return inserted
+    
     def get_text(self) -> str:
         """Retourne le texte tapé"""
         return self.typed_text
     
     def set_text(self, text: str):
         """Définit le texte tapé"""
-        self.typed_text = text
+        self._edit(0, text)
+        self.word_presses = []
+        self.last_correction = None
     
     def clear_text(self):
         """Efface tout le texte"""
-        self.typed_text = ""
+        self._edit(0)
+        self.word_presses = []
+        self.last_correction = None
     
     def change_layout(self, layout_name: str):
         """
@@ -446,3 +689,9 @@ class VirtualKeyboard:
             self.layout_name = layout_name
             self.keys.clear()
             self._create_keys()
+            if self.key_decoder is not None:
+                self.key_decoder.rebuild(self)
+            if self.analytics is not None:
+                self.analytics.rebuild(self)
+            if self.autocorrector is not None:
+                self.autocorrector.rebuild(self.autocorrector.dictionary, background=True)
@@ -0,0 +1,226 @@
+"""
+Module de sauvegarde du texte
+Chaque modification est ajoutée à un journal (write-ahead log) par un thread
+d'arrière-plan; des instantanés atomiques remplacent périodiquement
+config.SAVE_FILE puis le journal est vidé. Au démarrage, le journal est rejoué
+sur le dernier instantané.
+"""
+
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+from typing import Optional
+
+import config
+
+
+# Enregistrement du journal (little-endian):
+#   crc32 (I) | caractères conservés (I) | taille du texte ajouté (I) | texte UTF-8
+# Le crc couvre les deux champs suivants et le texte: un enregistrement
+# incomplet (arrêt brutal pendant l'écriture) termine la relecture.
+_RECORD = struct.Struct('<III')
+
+# Messages du thread d'écriture (en plus des modifications (keep, inserted))
+_SNAPSHOT = 'snapshot'
+_STOP = 'stop'
+
+
+def _encode_edit(keep: int, inserted: str) -> bytes:
+    """Encode une modification pour le journal"""
+    payload = inserted.encode('utf-8')
+    body = struct.pack('<II', keep, len(payload)) + payload
+    return struct.pack('<I', zlib.crc32(body)) + body
+
+
+def replay_log(text: str, data: bytes) -> tuple:
+    """
+    Applique les modifications d'un journal à un texte
+
+    Une modification remplace la fin du texte (text[:keep] + inserted): rejouer
+    un journal sur un instantané qui contient déjà ses modifications redonne
+    le même texte, la relecture est donc sûre même si le journal n'a pas été
+    vidé après le dernier instantané.
+
+    Args:
+        text: Texte de l'instantané
+        data: Contenu du journal
+
+    Returns:
+        (texte obtenu, nombre de modifications appliquées, octets valides)
+    """
+    offset = 0
+    count = 0
+    while offset + _RECORD.size <= len(data):
+        crc, keep, length = _RECORD.unpack_from(data, offset)
+        end = offset + _RECORD.size + length
+        if end > len(data) or zlib.crc32(data[offset + 4:end]) != crc:
+            break
+        text = text[:keep] + data[offset + _RECORD.size:end].decode('utf-8')
+        offset = end
+        count += 1
+    return text, count, offset
+
+
+class TextPersistence:
+    """Sauvegarde non bloquante du texte tapé (journal + instantanés atomiques)"""
+
+    def __init__(self, path: str = None):
+        """
+        Initialise la sauvegarde (le thread démarre avec start)
+
+        Args:
+            path: Fichier de l'instantané (config.SAVE_FILE par défaut)
+        """
+        self.path = path or config.SAVE_FILE
+        self.log_path = self.path + '.wal'
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._log = None
+
+        # Copie du texte tenue par le thread d'écriture
+        self._text = ""
+        self._dirty = False
+        self._last_snapshot = time.monotonic()
+
+    def recover(self) -> str:
+        """
+        Relit le dernier instantané et rejoue le journal (au démarrage)
+
+        Returns:
+            Texte restauré
+        """
+        text = ""
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    text = f.read()
+                print(f"Texte chargé depuis {self.path}")
+            if os.path.exists(self.log_path):
+                with open(self.log_path, 'r+b') as f:
+                    text, count, valid = replay_log(text, f.read())
+                    # Retirer un enregistrement incomplet pour que la suite reste lisible
+                    f.truncate(valid)
+                if count:
+                    self._dirty = True
+                    print(f"{count} modification(s) récupérée(s) depuis {self.log_path}")
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"Erreur lors du chargement du texte: {e}")
+        self._text = text
+        return text
+
+    def start(self):
+        """Démarre le thread d'écriture"""
+        self._thread = threading.Thread(target=self._run, name='text-persistence', daemon=True)
+        self._thread.start()
+
+    def record_edit(self, keep: int, inserted: str = ""):
+        """
+        Ajoute une modification du texte (ne bloque jamais)
+
+        Args:
+            keep: Nombre de caractères conservés
+            inserted: Texte ajouté après
+        """
+        self._queue.put((keep, inserted))
+
+    def request_snapshot(self):
+        """Demande un instantané dès que possible (sauvegarde manuelle)"""
+        self._queue.put(_SNAPSHOT)
+
+    def close(self):
+        """Écrit un dernier instantané et arrête le thread"""
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        """Boucle du thread: journalise les modifications, prend les instantanés"""
+        try:
+            directory = os.path.dirname(self.log_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._log = open(self.log_path, 'ab')
+        except OSError as e:
+            print(f"Journal de sauvegarde indisponible: {e}")
+
+        running = True
+        while running:
+            timeout = max(0.0, self._last_snapshot + config.SAVE_INTERVAL - time.monotonic())
+            try:
+                messages = [self._queue.get(timeout=timeout if config.AUTO_SAVE else None)]
+            except queue.Empty:
+                messages = []
+            # Regrouper tout ce qui est en attente en une seule écriture
+            while True:
+                try:
+                    messages.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            edits = []
+            snapshot = False
+            for message in messages:
+                if message == _STOP:
+                    running = False
+                    snapshot = True
+                elif message == _SNAPSHOT:
+                    snapshot = True
+                else:
+                    keep, inserted = message
+                    self._text = self._text[:keep] + inserted
+                    edits.append(_encode_edit(keep, inserted))
+            if edits:
+                self._dirty = True
+                self._append_log(b''.join(edits))
+
+            due = config.AUTO_SAVE and time.monotonic() - self._last_snapshot >= config.SAVE_INTERVAL
+            if snapshot or (due and self._dirty):
+                self._snapshot()
+            elif due:
+                self._last_snapshot = time.monotonic()
+
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+    def _append_log(self, data: bytes):
+        """Ajoute des modifications au journal (inutile sans sauvegarde automatique)"""
+        if self._log is None or not config.AUTO_SAVE:
+            return
+        try:
+            self._log.write(data)
+            self._log.flush()
+            if config.SAVE_FSYNC:
+                os.fsync(self._log.fileno())
+        except OSError as e:
+            print(f"Erreur d'écriture du journal de sauvegarde: {e}")
+
+    def _snapshot(self):
+        """Écrit l'instantané (fichier temporaire puis renommage) et vide le journal"""
+        tmp_path = self.path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(self._text)
+                f.flush()
+                if config.SAVE_FSYNC:
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+            print(f"Texte sauvegardé dans {self.path}")
+        except OSError as e:
+            print(f"Erreur lors de la sauvegarde du texte: {e}")
+            return
+
+        # Compaction: l'instantané contient toutes les modifications journalisées
+        if self._log is not None:
+            try:
+                self._log.seek(0)
+                self._log.truncate()
+            except OSError as e:
+                print(f"Erreur lors de la compaction du journal de sauvegarde: {e}")
+        self._dirty = False
+        self._last_snapshot = time.monotonic()
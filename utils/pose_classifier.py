@@ -0,0 +1,212 @@
+"""
+Module de classification apprise des poses de la main
+Normalise les landmarks (translation, échelle, rotation) et reconnaît la pose
+par k plus proches voisins parmi des prototypes appris (python train_poses.py)
+"""
+
+import os
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+import config
+
+
+# Landmarks de référence: poignet et base du majeur (axe de la main)
+WRIST = 0
+MIDDLE_BASE = 9
+
+# Étiquette des poses neutres (main au repos, frappe): aucun geste
+NO_POSE = 'none'
+
+MODEL_VERSION = 1
+
+
+def normalize_poses(points: np.ndarray, aspect: float = None) -> np.ndarray:
+    """
+    Descripteurs des poses indépendants de la position, de la taille et de l'inclinaison
+
+    Le poignet est ramené à l'origine, l'axe poignet -> base du majeur est
+    tourné vers le haut (dans le plan de l'image) et sa longueur vaut 1.
+
+    Args:
+        points: Landmarks (mains, 21, 3) en coordonnées normalisées de l'image
+        aspect: Largeur / hauteur de l'image (config.WINDOW_WIDTH / WINDOW_HEIGHT par défaut)
+
+    Returns:
+        Descripteurs (mains, 60) float32 (le poignet, toujours nul, est retiré)
+    """
+    aspect = aspect or config.WINDOW_WIDTH / config.WINDOW_HEIGHT
+    points = np.asarray(points, dtype=np.float32)
+    centered = points[:, 1:] - points[:, WRIST:WRIST + 1]                   # (H, 20, 3)
+
+    # Axe de la main (poignet -> base du majeur), x ramené à l'échelle de y
+    ax = centered[:, MIDDLE_BASE - 1, 0] * aspect
+    ay = centered[:, MIDDLE_BASE - 1, 1]
+    length = np.maximum(np.hypot(ax, ay), 1e-6)
+    a, b = ax / (length * length), ay / (length * length)
+
+    # Changement de repère en un produit: mise à l'échelle de x et z, rotation
+    # qui envoie l'axe sur (0, -1), division par la longueur de l'axe
+    transform = np.zeros((len(points), 3, 3), dtype=np.float32)
+    transform[:, 0, 0] = -b * aspect
+    transform[:, 0, 1] = -a * aspect
+    transform[:, 1, 0] = a
+    transform[:, 1, 1] = -b
+    transform[:, 2, 2] = aspect / length
+    return (centered @ transform).reshape(len(points), -1)
+
+
+def mirror_poses(features: np.ndarray) -> np.ndarray:
+    """
+    Descripteurs de l'autre main (symétrie gauche/droite)
+
+    Args:
+        features: Descripteurs de normalize_poses (mains, 60)
+    """
+    mirrored = features.reshape(len(features), -1, 3).copy()
+    mirrored[:, :, 0] *= -1
+    return mirrored.reshape(len(features), -1)
+
+
+def _prototypes(samples: np.ndarray, count: int, iterations: int = 10, seed: int = 0) -> np.ndarray:
+    """Résume les exemples d'une classe par count centres (k-moyennes)"""
+    if len(samples) <= count:
+        return samples
+    rng = np.random.default_rng(seed)
+    centers = samples[rng.choice(len(samples), count, replace=False)]
+    for _ in range(iterations):
+        distances = (samples * samples).sum(axis=1)[:, None] - 2.0 * samples @ centers.T \
+            + (centers * centers).sum(axis=1)[None, :]
+        assignment = distances.argmin(axis=1)
+        sums = np.zeros_like(centers)
+        np.add.at(sums, assignment, samples)
+        counts = np.bincount(assignment, minlength=count)
+        filled = counts > 0
+        centers[filled] = sums[filled] / counts[filled, None]
+    return centers
+
+
+def train_pose_model(recordings: Dict[str, np.ndarray], prototypes: int = None,
+                     reject_margin: float = None) -> Dict[str, np.ndarray]:
+    """
+    Construit le modèle k-NN à partir de landmarks étiquetés
+
+    Chaque pose est aussi apprise en miroir pour reconnaître les deux mains.
+
+    Args:
+        recordings: {étiquette: landmarks (n, 21, 3)}
+        prototypes: Prototypes gardés par classe (config.POSE_PROTOTYPES_PER_CLASS par défaut)
+        reject_margin: Multiplicateur de la distance de rejet (config.POSE_REJECT_MARGIN par défaut)
+
+    Returns:
+        Tableaux du modèle (voir PoseClassifier)
+    """
+    prototypes = prototypes or config.POSE_PROTOTYPES_PER_CLASS
+    reject_margin = reject_margin or config.POSE_REJECT_MARGIN
+    classes = sorted(recordings)
+
+    features, labels, spreads = [], [], []
+    for index, label in enumerate(classes):
+        samples = normalize_poses(recordings[label])
+        samples = np.concatenate([samples, mirror_poses(samples)])
+        centers = _prototypes(samples, prototypes, seed=index)
+        features.append(centers)
+        labels.append(np.full(len(centers), index, dtype=np.int32))
+        # Distance typique d'un exemple à son prototype le plus proche
+        nearest = np.sqrt(np.maximum(
+            (samples * samples).sum(axis=1)[:, None] - 2.0 * samples @ centers.T
+            + (centers * centers).sum(axis=1)[None, :], 0.0
+        ).min(axis=1))
+        spreads.append(np.percentile(nearest, 95))
+
+    return {
+        'version': np.array(MODEL_VERSION),
+        'classes': np.array(classes),
+        'features': np.concatenate(features).astype(np.float32),
+        'labels': np.concatenate(labels),
+        'reject_distance': np.array(reject_margin * max(spreads), dtype=np.float32),
+    }
+
+
+class PoseClassifier:
+    """Classifieur k plus proches voisins des poses de la main"""
+
+    def __init__(self, model: Dict[str, np.ndarray], neighbors: int = None):
+        """
+        Initialise le classifieur
+
+        Args:
+            model: Tableaux de train_pose_model (classes, features, labels, reject_distance)
+            neighbors: Nombre de voisins (config.POSE_KNN_NEIGHBORS par défaut)
+        """
+        self.classes = [str(label) for label in model['classes']]
+        self.features = np.asarray(model['features'], dtype=np.float32)
+        self.labels = np.asarray(model['labels'], dtype=np.int64)
+        self.reject_distance = float(model['reject_distance'])
+        self.neighbors = min(neighbors or config.POSE_KNN_NEIGHBORS, len(self.features))
+        self._half_norms = 0.5 * (self.features * self.features).sum(axis=1)
+        self._class_range = np.arange(len(self.classes))
+
+    @classmethod
+    def load(cls, path: str = None) -> Optional['PoseClassifier']:
+        """
+        Charge un modèle entraîné
+
+        Args:
+            path: Fichier .npz (config.POSE_MODEL_FILE par défaut)
+
+        Returns:
+            Classifieur ou None si aucun modèle n'est disponible
+        """
+        path = path or config.POSE_MODEL_FILE
+        if not os.path.exists(path):
+            return None
+        try:
+            with np.load(path) as data:
+                if int(data['version']) != MODEL_VERSION:
+                    raise ValueError(f"version {int(data['version'])} non supportée")
+                return cls({name: data[name] for name in data.files})
+        except (OSError, KeyError, ValueError) as e:
+            print(f"Erreur lors du chargement du modèle de poses: {e}")
+            return None
+
+    def predict(self, features: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vote des k plus proches prototypes
+
+        Args:
+            features: Descripteurs (mains, 60)
+
+        Returns:
+            (indice de classe ou -1 si rejeté, part des voix) par main
+        """
+        # Plus proches = plus grands f.p - |p|²/2 (|f|² est commun à toute la ligne)
+        scores = features @ self.features.T - self._half_norms                # (H, P)
+        nearest = np.argpartition(scores, -self.neighbors, axis=1)[:, -self.neighbors:]
+
+        votes = (self.labels[nearest][:, :, None] == self._class_range).sum(axis=1)  # (H, C)
+        best = votes.argmax(axis=1)
+        confidence = votes.max(axis=1) / self.neighbors
+
+        closest = np.sqrt(np.maximum((features * features).sum(axis=1) - 2.0 * scores.max(axis=1), 0.0))
+        rejected = (closest > self.reject_distance) | (confidence < config.POSE_MIN_CONFIDENCE)
+        return np.where(rejected, -1, best), confidence
+
+    def classify(self, points: np.ndarray) -> List[Optional[str]]:
+        """
+        Pose de chaque main
+
+        Args:
+            points: Landmarks (mains, 21, 3)
+
+        Returns:
+            Étiquette par main (None si pose neutre ou inconnue)
+        """
+        if len(points) == 0:
+            return []
+        indices, _ = self.predict(normalize_poses(points))
+        return [
+            None if index < 0 or self.classes[index] == NO_POSE else self.classes[index]
+            for index in indices.tolist()
+        ]
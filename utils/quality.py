@@ -0,0 +1,111 @@
+"""
+Module de qualité adaptative
+Surveille le temps de frame et désactive les effets visuels par paliers quand
+le budget (TARGET_FPS) est dépassé, pour privilégier la réactivité de la saisie
+"""
+
+from typing import Dict
+
+import config
+
+
+class QualityGovernor:
+    """Choisit le palier de qualité selon le temps de frame mesuré"""
+
+    def __init__(self):
+        """Initialise le gouverneur au palier le plus haut"""
+        self.tier = 0
+        self.frame_time = None  # Temps de frame lissé (ms)
+        self._slow_frames = 0
+        self._fast_frames = 0
+        # Réglages voulus par l'utilisateur (config n'en contient que la version dégradée)
+        names = {name for _, overrides in config.QUALITY_TIERS for name in overrides}
+        self._user_settings: Dict[str, object] = {name: getattr(config, name) for name in names}
+
+    @property
+    def tier_name(self) -> str:
+        """Nom du palier actif"""
+        return config.QUALITY_TIERS[self.tier][0]
+
+    def update(self, frame_ms: float) -> bool:
+        """
+        Prend en compte le temps de calcul d'une frame
+
+        Args:
+            frame_ms: Temps de la frame hors attente (clock.get_rawtime())
+
+        Returns:
+            True si le palier a changé
+        """
+        if self.frame_time is None:
+            self.frame_time = frame_ms
+        else:
+            self.frame_time += config.QUALITY_SMOOTHING * (frame_ms - self.frame_time)
+
+        budget = 1000.0 / config.TARGET_FPS
+        if self.frame_time > budget * config.QUALITY_DOWNGRADE_RATIO:
+            self._slow_frames += 1
+            self._fast_frames = 0
+        elif self.frame_time < budget * config.QUALITY_UPGRADE_RATIO:
+            self._fast_frames += 1
+            self._slow_frames = 0
+        else:
+            # Zone d'hystérésis: on garde le palier
+            self._slow_frames = 0
+            self._fast_frames = 0
+
+        if self._slow_frames >= config.QUALITY_DOWNGRADE_FRAMES and self.tier < len(config.QUALITY_TIERS) - 1:
+            self.set_tier(self.tier + 1)
+            return True
+        if self._fast_frames >= config.QUALITY_UPGRADE_FRAMES and self.tier > 0:
+            self.set_tier(self.tier - 1)
+            return True
+        return False
+
+    def set_tier(self, tier: int):
+        """
+        Applique un palier de qualité
+
+        Args:
+            tier: Index dans config.QUALITY_TIERS
+        """
+        self.tier = tier
+        self._slow_frames = 0
+        self._fast_frames = 0
+        self._apply()
+
+    def toggle(self, name: str) -> bool:
+        """
+        Inverse un réglage de l'utilisateur (touches) en gardant le palier actif
+
+        Args:
+            name: Nom du réglage dans config
+
+        Returns:
+            Nouvelle valeur voulue par l'utilisateur
+        """
+        value = not self._user_settings.get(name, getattr(config, name))
+        if name in self._user_settings:
+            self._user_settings[name] = value
+            self._apply()
+        else:
+            setattr(config, name, value)
+        return value
+
+    def _apply(self):
+        """
+        Recalcule config à partir des réglages de l'utilisateur et du palier
+
+        Les réglages forcés ne font que réduire ceux de l'utilisateur: un effet
+        désactivé par l'utilisateur n'est jamais réactivé.
+        """
+        for name, value in self._user_settings.items():
+            setattr(config, name, value)
+
+        for _, overrides in config.QUALITY_TIERS[1:self.tier + 1]:
+            for name, value in overrides.items():
+                current = getattr(config, name)
+                if isinstance(value, bool):
+                    setattr(config, name, current and value)
+                else:
+                    setattr(config, name, max(current, value))
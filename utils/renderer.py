@@ -0,0 +1,139 @@
+"""
+Module de rendu par rectangles modifiés
+Utilisé quand la caméra est masquée: le fond est statique, seules les zones
+qui changent sont redessinées puis présentées avec pygame.display.update(rects)
+"""
+
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import pygame
+
+
+# Un widget de la scène: (identifiant, zone couverte, état visuel, fonction de dessin)
+Widget = Tuple[Hashable, pygame.Rect, Hashable, Callable[[pygame.Surface], None]]
+
+
+class DirtyRectRenderer:
+    """Redessine uniquement les widgets modifiés sur un fond statique"""
+
+    def __init__(self, screen: pygame.Surface,
+                 present: Callable[[Optional[List[pygame.Rect]]], None] = None):
+        """
+        Initialise le renderer
+
+        Args:
+            screen: Surface de rendu
+            present: Affiche les zones données (None = tout l'écran),
+                par défaut pygame.display.update / flip
+        """
+        self.screen = screen
+        self.present = present or self._present_display
+        self.background = None
+        # Par widget: (zone, état) au dernier rendu
+        self._widgets: Dict[Hashable, Tuple[pygame.Rect, Hashable]] = {}
+        # Zones des éléments dessinés par-dessus (curseurs, effets) au dernier rendu
+        self._overlay_rects: List[pygame.Rect] = []
+        self._full_redraw = True
+
+    @staticmethod
+    def _present_display(rects: Optional[List[pygame.Rect]]):
+        """Présente directement la surface d'affichage"""
+        if rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
+
+    def set_background(self, background: pygame.Surface):
+        """
+        Change le fond statique (thème, layout) et force un rendu complet
+
+        Args:
+            background: Surface de la taille de l'écran
+        """
+        self.background = background
+        self.invalidate()
+
+    def invalidate(self):
+        """Force un rendu complet à la prochaine frame"""
+        self._full_redraw = True
+
+    def render(self, widgets: Sequence[Widget],
+               draw_overlays: Callable[[pygame.Surface], List[pygame.Rect]]) -> int:
+        """
+        Dessine une frame et la présente
+
+        Les widgets (dans l'ordre d'empilement) ne sont redessinés que si leur
+        état ou leur zone a changé, ou s'ils recouvrent une zone à restaurer.
+        Les éléments dessinés par draw_overlays sont effacés à la frame suivante.
+
+        Args:
+            widgets: Widgets de la scène
+            draw_overlays: Dessine les éléments animés et retourne leurs zones
+
+        Returns:
+            Nombre de rectangles présentés (0 pour un rendu complet)
+        """
+        if self._full_redraw or self.background is None:
+            return self._render_full(widgets, draw_overlays)
+
+        dirty = list(self._overlay_rects)
+        selected = set()
+
+        # Widgets dont l'état a changé: ancienne et nouvelle zone à redessiner
+        for widget_id, bounds, state, _ in widgets:
+            previous = self._widgets.get(widget_id)
+            if previous is None or previous[1] != state or previous[0] != bounds:
+                selected.add(widget_id)
+                dirty.append(bounds)
+                if previous is not None:
+                    dirty.append(previous[0])
+
+        # Widgets disparus de la scène
+        current_ids = {widget[0] for widget in widgets}
+        for widget_id, (bounds, _) in self._widgets.items():
+            if widget_id not in current_ids:
+                dirty.append(bounds)
+
+        # Point fixe: un widget qui recouvre une zone restaurée doit être redessiné,
+        # ce qui peut à son tour salir d'autres widgets
+        changed = True
+        while changed:
+            changed = False
+            for widget_id, bounds, _, _ in widgets:
+                if widget_id not in selected and bounds.collidelist(dirty) != -1:
+                    selected.add(widget_id)
+                    dirty.append(bounds)
+                    changed = True
+
+        # Restaurer le fond puis redessiner dans l'ordre d'empilement
+        for rect in dirty:
+            self.screen.blit(self.background, rect, rect)
+        for widget_id, _, _, draw in widgets:
+            if widget_id in selected:
+                draw(self.screen)
+
+        overlay_rects = draw_overlays(self.screen)
+        self._remember(widgets, overlay_rects)
+
+        rects = dirty + overlay_rects
+        self.present(rects)
+        return len(rects)
+
+    def _render_full(self, widgets: Sequence[Widget],
+                     draw_overlays: Callable[[pygame.Surface], List[pygame.Rect]]) -> int:
+        """Redessine et présente tout l'écran"""
+        if self.background is not None:
+            self.screen.blit(self.background, (0, 0))
+        for _, _, _, draw in widgets:
+            draw(self.screen)
+        overlay_rects = draw_overlays(self.screen)
+        self._remember(widgets, overlay_rects)
+        self._full_redraw = False
+
+        self.present(None)
+        return 0
+
+    def _remember(self, widgets: Sequence[Widget], overlay_rects: List[pygame.Rect]):
+        """Mémorise l'état affiché pour la frame suivante"""
+        self._widgets = {widget_id: (bounds, state) for widget_id, bounds, state, _ in widgets}
+        self._overlay_rects = overlay_rects
@@ -0,0 +1,257 @@
+"""
+Module d'analyse hors ligne des journaux de session
+Calcule sur chaque segment (mappé en mémoire) des agrégats vectorisés qui
+s'additionnent ensuite par session, par utilisateur et pour tout le parc
+"""
+
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+from .journal import (
+    EVENT_GESTURE, EVENT_KEY, GESTURE_NAMES, SPECIAL_KEYS, key_char, load_journal
+)
+
+
+# Histogramme des latences: pas de 5 ms jusqu'à 2 s (la dernière case regroupe le reste)
+LATENCY_EDGES = np.append(np.linspace(0.0, 2.0, 401), np.inf)
+
+# Colonnes des statistiques par touche
+KEY_COLUMNS = ('presses', 'corrections', 'latency_sum', 'latency_count', 'x_sum', 'y_sum', 'position_count')
+
+BACKSPACE_CODE = SPECIAL_KEYS["<-"]
+SHIFT_CODE = SPECIAL_KEYS["SHIFT"]
+
+
+def analyze_segment(path: str, bucket: float = 60.0, false_trigger_window: float = 1.0) -> Dict:
+    """
+    Agrège un segment de journal
+
+    Args:
+        path: Fichier .atj
+        bucket: Durée (s) des intervalles de l'évolution du WPM
+        false_trigger_window: Un geste à moins de cette durée (s) d'une frappe
+            est compté comme déclenchement involontaire
+
+    Returns:
+        Agrégats partiels du segment (voir merge_partials)
+    """
+    header, records = load_journal(path)
+    events = records['event']
+    keys = records[events == EVENT_KEY]
+    gestures = records[events == EVENT_GESTURE]
+
+    times = np.asarray(keys['t'], dtype=np.float64)
+    codes = np.asarray(keys['key'], dtype=np.int64)
+    typed = (codes != BACKSPACE_CODE) & (codes != SHIFT_CODE)
+
+    # Caractères tapés par intervalle depuis le début de la session
+    if len(times):
+        bins = (times // bucket).astype(np.int64)
+        wpm_chars = np.bincount(bins, weights=typed, minlength=1)
+    else:
+        wpm_chars = np.zeros(0)
+
+    latency = np.asarray(keys['latency'], dtype=np.float64)
+    measured = ~np.isnan(latency)
+    latency_hist = np.histogram(latency[measured], bins=LATENCY_EDGES)[0]
+
+    # Statistiques par touche: une ligne par code présent
+    unique, inverse = np.unique(codes, return_inverse=True)
+    per_key = np.zeros((len(unique), len(KEY_COLUMNS)), dtype=np.float64)
+    if len(unique):
+        x = np.asarray(keys['x'], dtype=np.float64)
+        y = np.asarray(keys['y'], dtype=np.float64)
+        located = ~np.isnan(x)
+        # Une correction = la touche suivante est un backspace
+        corrected = np.zeros(len(codes), dtype=bool)
+        corrected[:-1] = (codes[1:] == BACKSPACE_CODE) & (codes[:-1] != BACKSPACE_CODE)
+
+        per_key[:, 0] = np.bincount(inverse, minlength=len(unique))
+        per_key[:, 1] = np.bincount(inverse, weights=corrected, minlength=len(unique))
+        per_key[:, 2] = np.bincount(inverse[measured], weights=latency[measured], minlength=len(unique))
+        per_key[:, 3] = np.bincount(inverse[measured], minlength=len(unique))
+        per_key[:, 4] = np.bincount(inverse[located], weights=x[located], minlength=len(unique))
+        per_key[:, 5] = np.bincount(inverse[located], weights=y[located], minlength=len(unique))
+        per_key[:, 6] = np.bincount(inverse[located], minlength=len(unique))
+
+    # Gestes déclenchés et déclenchements au milieu de la frappe
+    gesture_ids = np.asarray(gestures['key'], dtype=np.int64)
+    gesture_times = np.asarray(gestures['t'], dtype=np.float64)
+    valid = (gesture_ids >= 0) & (gesture_ids < len(GESTURE_NAMES))
+    gesture_ids, gesture_times = gesture_ids[valid], gesture_times[valid]
+    false_mask = np.zeros(len(gesture_times), dtype=bool)
+    if len(times) and len(gesture_times):
+        after = np.searchsorted(times, gesture_times)
+        next_gap = np.abs(times[np.minimum(after, len(times) - 1)] - gesture_times)
+        previous_gap = np.abs(gesture_times - times[np.maximum(after - 1, 0)])
+        false_mask = np.minimum(next_gap, previous_gap) <= false_trigger_window
+
+    return {
+        'path': path,
+        'user': header['user'],
+        'session_start': header['session_start'],
+        'keystrokes': len(codes),
+        'chars': int(typed.sum()),
+        'backspaces': int((codes == BACKSPACE_CODE).sum()),
+        'first': float(times[0]) if len(times) else None,
+        'last': float(times[-1]) if len(times) else None,
+        'wpm_chars': wpm_chars,
+        'latency_hist': latency_hist,
+        'key_codes': unique,
+        'per_key': per_key,
+        'gestures': np.bincount(gesture_ids, minlength=len(GESTURE_NAMES)),
+        'false_gestures': np.bincount(gesture_ids[false_mask], minlength=len(GESTURE_NAMES)),
+    }
+
+
+def _add_padded(total: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Additionne deux tableaux 1D de longueurs différentes"""
+    if len(values) > len(total):
+        total, values = values, total
+    total = total.copy()
+    total[:len(values)] += values
+    return total
+
+
+def merge_partials(partials: Iterable[Dict]) -> Dict:
+    """
+    Additionne des agrégats partiels (segments d'une même session ou sessions)
+
+    Args:
+        partials: Agrégats retournés par analyze_segment ou merge_partials
+
+    Returns:
+        Agrégat combiné
+    """
+    merged = {
+        'segments': 0, 'keystrokes': 0, 'chars': 0, 'backspaces': 0, 'active_time': 0.0,
+        'wpm_chars': np.zeros(0), 'latency_hist': np.zeros(len(LATENCY_EDGES) - 1, dtype=np.int64),
+        'per_key': {}, 'gestures': np.zeros(len(GESTURE_NAMES), dtype=np.int64),
+        'false_gestures': np.zeros(len(GESTURE_NAMES), dtype=np.int64),
+    }
+    for partial in partials:
+        merged['segments'] += partial.get('segments', 1)
+        for name in ('keystrokes', 'chars', 'backspaces'):
+            merged[name] += partial[name]
+        merged['active_time'] += partial.get('active_time', 0.0)
+        merged['wpm_chars'] = _add_padded(merged['wpm_chars'], partial['wpm_chars'])
+        merged['latency_hist'] += partial['latency_hist']
+        merged['gestures'] += partial['gestures']
+        merged['false_gestures'] += partial['false_gestures']
+
+        per_key = partial['per_key']
+        if isinstance(per_key, dict):
+            items = per_key.items()
+        else:
+            items = zip(partial['key_codes'].tolist(), per_key)
+        for code, row in items:
+            if code in merged['per_key']:
+                merged['per_key'][code] = merged['per_key'][code] + row
+            else:
+                merged['per_key'][code] = np.array(row, dtype=np.float64)
+    return merged
+
+
+def merge_session(segments: List[Dict]) -> Dict:
+    """
+    Combine les segments d'une session (même utilisateur et même début)
+
+    Args:
+        segments: Agrégats de analyze_segment
+
+    Returns:
+        Agrégat de la session, avec sa durée de frappe active
+    """
+    merged = merge_partials(segments)
+    firsts = [s['first'] for s in segments if s['first'] is not None]
+    lasts = [s['last'] for s in segments if s['last'] is not None]
+    merged['active_time'] = max(lasts) - min(firsts) if firsts else 0.0
+    merged['user'] = segments[0]['user']
+    merged['session_start'] = segments[0]['session_start']
+    return merged
+
+
+def latency_percentiles(histogram: np.ndarray, quantiles=(0.5, 0.9, 0.99)) -> Dict[str, float]:
+    """
+    Percentiles des latences à partir de l'histogramme (borne haute de la case)
+
+    Args:
+        histogram: Effectifs par case de LATENCY_EDGES
+        quantiles: Quantiles demandés
+
+    Returns:
+        {'p50': secondes, ...} (None sans mesure)
+    """
+    total = histogram.sum()
+    result = {}
+    cumulative = np.cumsum(histogram)
+    for q in quantiles:
+        name = f"p{q * 100:g}"
+        if total == 0:
+            result[name] = None
+            continue
+        index = int(np.searchsorted(cumulative, q * total))
+        result[name] = float(LATENCY_EDGES[min(index + 1, len(LATENCY_EDGES) - 2)])
+    return result
+
+
+def wpm_series(wpm_chars: np.ndarray, bucket: float) -> List[float]:
+    """
+    Évolution du WPM par intervalle (1 mot = 5 caractères)
+
+    Args:
+        wpm_chars: Caractères tapés par intervalle
+        bucket: Durée d'un intervalle (s)
+    """
+    return (wpm_chars / 5 / (bucket / 60)).round(2).tolist()
+
+
+def summarize(merged: Dict, bucket: float = None) -> Dict:
+    """
+    Résumé lisible (sérialisable en JSON) d'un agrégat
+
+    Args:
+        merged: Agrégat de merge_partials / merge_session
+        bucket: Durée des intervalles de WPM (s), None pour omettre l'évolution
+            (les intervalles ne sont comparables qu'au sein d'une session)
+    """
+    minutes = merged['active_time'] / 60
+    keystrokes = merged['keystrokes']
+    summary = {
+        'segments': merged['segments'],
+        'keystrokes': keystrokes,
+        'chars': merged['chars'],
+        'wpm': round(merged['chars'] / 5 / minutes, 2) if minutes > 0 else 0.0,
+        'error_rate': round(merged['backspaces'] / keystrokes, 4) if keystrokes else 0.0,
+        'latency': latency_percentiles(merged['latency_hist']),
+        'gestures': dict(zip(GESTURE_NAMES, merged['gestures'].tolist())),
+        'false_gestures': dict(zip(GESTURE_NAMES, merged['false_gestures'].tolist())),
+    }
+    if bucket is not None:
+        summary['wpm_over_time'] = wpm_series(merged['wpm_chars'], bucket)
+    return summary
+
+
+def key_table(per_key: Dict[int, np.ndarray]) -> List[Dict]:
+    """
+    Statistiques par touche (carte de chaleur), triées par nombre d'appuis
+
+    Args:
+        per_key: {code: ligne KEY_COLUMNS}
+
+    Returns:
+        Liste de dictionnaires (touche, appuis, taux de correction, latence et position moyennes)
+    """
+    rows = []
+    for code, row in sorted(per_key.items(), key=lambda item: -item[1][0]):
+        presses, corrections, latency_sum, latency_count, x_sum, y_sum, positions = row.tolist()
+        rows.append({
+            'key': key_char(code),
+            'presses': int(presses),
+            'error_rate': round(corrections / presses, 4) if presses else 0.0,
+            'latency': round(latency_sum / latency_count, 4) if latency_count else None,
+            'x': round(x_sum / positions, 1) if positions else None,
+            'y': round(y_sum / positions, 1) if positions else None,
+        })
+    return rows
@@ -4,25 +4,81 @@ Calcule WPM, précision, temps de session et autres métriques
 """
 
 import time
+from collections import deque
 from typing import List, Dict
-from datetime import datetime
+
+import numpy as np
+
+import config
+
+
+# Code de la touche retour arrière dans l'historique
+BACKSPACE = "<-"
+BACKSPACE_CODE = 8
 
 
 class StatsTracker:
     """Tracker de statistiques de frappe en temps réel"""
     
-    def __init__(self):
-        """Initialise le tracker de statistiques"""
+    def __init__(self, history_size: int = None):
+        """
+        Initialise le tracker de statistiques
+        
+        Args:
+            history_size: Nombre maximal de frappes conservées (config par défaut)
+        """
         self.session_start = time.time()
         self.total_chars = 0
         self.total_words = 0
-        self.keystrokes = []  # Liste de (timestamp, char)
+        self.total_keystrokes = 0
         self.errors = 0
         self.backspaces = 0
         
-        # Pour calcul WPM sur fenêtre glissante
-        self.wpm_window = 60  # Secondes
+        # Pour calcul WPM sur fenêtre glissante: (timestamp, caractère compté)
+        self.wpm_window = config.STATS_WPM_WINDOW  # Secondes
+        self._window = deque()
+        self._window_chars = 0
+        
+        # Historique borné (tampon circulaire): horodatages et codes des caractères
+        self.history_size = history_size or config.STATS_HISTORY_SIZE
+        self._times = np.zeros(self.history_size, dtype=np.float64)
+        self._codes = np.zeros(self.history_size, dtype=np.int32)
+        self._head = 0
+        self._count = 0
         
+        # Touches de plusieurs caractères: code négatif = -(index + 1)
+        self._tokens: List[str] = []
+    
+    @property
+    def keystrokes(self) -> List[tuple]:
+        """Frappes conservées, de la plus ancienne à la plus récente: (timestamp, char)"""
+        return self._history_slice(0)
+    
+    def _encode(self, char: str) -> int:
+        """Code entier d'une touche"""
+        if char == BACKSPACE:
+            return BACKSPACE_CODE
+        if len(char) == 1:
+            return ord(char)
+        if char not in self._tokens:
+            self._tokens.append(char)
+        return -(self._tokens.index(char) + 1)
+    
+    def _decode(self, code: int) -> str:
+        """Touche correspondant à un code"""
+        if code == BACKSPACE_CODE:
+            return BACKSPACE
+        if code < 0:
+            return self._tokens[-code - 1]
+        return chr(code)
+    
+    def _expire(self, current_time: float):
+        """Retire de la fenêtre glissante les frappes trop anciennes"""
+        window = self._window
+        while window and current_time - window[0][0] > self.wpm_window:
+            _, counted = window.popleft()
+            self._window_chars -= counted
+    
     def track_keystroke(self, char: str):
         """
         Enregistre une frappe
@@ -31,9 +87,20 @@ class StatsTracker:
             char: Caractère tapé
         """
         timestamp = time.time()
-        self.keystrokes.append((timestamp, char))
+        self.total_keystrokes += 1
         
-        if char == "<-":
+        # Historique: écrase la frappe la plus ancienne quand il est plein
+        self._times[self._head] = timestamp
+        self._codes[self._head] = self._encode(char)
+        self._head = (self._head + 1) % self.history_size
+        self._count = min(self._count + 1, self.history_size)
+        
+        counted = char != BACKSPACE
+        self._window.append((timestamp, counted))
+        self._window_chars += counted
+        self._expire(timestamp)
+        
+        if char == BACKSPACE:
             self.backspaces += 1
         else:
             self.total_chars += 1
@@ -50,28 +117,20 @@ class StatsTracker:
             WPM (mots par minute)
         """
         current_time = time.time()
+        self._expire(current_time)
         
-        # Filtrer les frappes dans la fenêtre
-        recent_keystrokes = [
-            (t, c) for t, c in self.keystrokes
-            if current_time - t <= self.wpm_window
-        ]
-        
-        if not recent_keystrokes:
+        if not self._window:
             return 0.0
         
-        # Compter les caractères (hors backspace)
-        char_count = sum(1 for _, c in recent_keystrokes if c != "<-")
-        
         # Calculer le temps écoulé
-        time_elapsed = current_time - recent_keystrokes[0][0]
+        time_elapsed = current_time - self._window[0][0]
         
         if time_elapsed < 1:
             return 0.0
         
         # WPM = (caractères / 5) / (temps en minutes)
         # Standard: 1 mot = 5 caractères
-        words = char_count / 5
+        words = self._window_chars / 5
         minutes = time_elapsed / 60
         
         return words / minutes if minutes > 0 else 0.0
@@ -83,7 +142,7 @@ class StatsTracker:
         Returns:
             Précision en pourcentage (0-100)
         """
-        total_keystrokes = len(self.keystrokes)
+        total_keystrokes = self.total_keystrokes
         
         if total_keystrokes == 0:
             return 100.0
@@ -128,7 +187,7 @@ class StatsTracker:
             'backspaces': self.backspaces,
             'session_time': self.get_session_time(),
             'session_time_formatted': self.get_session_time_formatted(),
-            'total_keystrokes': len(self.keystrokes)
+            'total_keystrokes': self.total_keystrokes
         }
     
     def reset_session(self):
@@ -136,22 +195,39 @@ class StatsTracker:
         self.session_start = time.time()
         self.total_chars = 0
         self.total_words = 0
-        self.keystrokes.clear()
+        self.total_keystrokes = 0
+        self._window.clear()
+        self._window_chars = 0
+        self._head = 0
+        self._count = 0
         self.errors = 0
         self.backspaces = 0
     
+    def get_history_arrays(self) -> tuple:
+        """
+        Retourne l'historique conservé sous forme de tableaux (ordre chronologique)
+        
+        Returns:
+            (horodatages float64, codes int32) - copies
+        """
+        start = (self._head - self._count) % self.history_size
+        order = (start + np.arange(self._count)) % self.history_size
+        return self._times[order], self._codes[order]
+    
+    def _history_slice(self, since: float) -> List[tuple]:
+        """Frappes conservées depuis un horodatage, en (timestamp, char)"""
+        times, codes = self.get_history_arrays()
+        first = int(np.searchsorted(times, since, side='left'))
+        return [(t, self._decode(c)) for t, c in zip(times[first:].tolist(), codes[first:].tolist())]
+    
     def get_keystroke_history(self, seconds: int = 10) -> List[tuple]:
         """
         Retourne l'historique des frappes récentes
         
         Args:
             seconds: Nombre de secondes à récupérer
-            
+        
         Returns:
             Liste de (timestamp, char)
         """
-        current_time = time.time()
-        return [
-            (t, c) for t, c in self.keystrokes
-            if current_time - t <= seconds
-        ]
+        return self._history_slice(time.time() - seconds)
@@ -0,0 +1,291 @@
+"""
+Module de saisie gestuelle (swipe)
+Capture la trajectoire de l'index pendant le pincement et la décode en mots
+"""
+
+import math
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pygame
+
+import config
+from .background import BackgroundCache
+from .dictionary import strip_accents
+
+
+def resample_polylines(points: np.ndarray, n_points: int) -> np.ndarray:
+    """
+    Rééchantillonne des polylignes à pas constant (vectorisé)
+
+    Args:
+        points: Tableau (W, L, 2) de polylignes (les points répétés en fin
+            de ligne servent de remplissage: segments de longueur nulle)
+        n_points: Nombre de points en sortie
+
+    Returns:
+        Tableau (W, n_points, 2)
+    """
+    points = np.asarray(points, dtype=np.float32)
+    if points.shape[1] == 1:
+        return np.repeat(points, n_points, axis=1)
+
+    segments = np.linalg.norm(np.diff(points, axis=1), axis=2)             # (W, L-1)
+    cumulative = np.concatenate(
+        [np.zeros((points.shape[0], 1), dtype=np.float32), np.cumsum(segments, axis=1)],
+        axis=1
+    )                                                                       # (W, L)
+    total = cumulative[:, -1:]                                              # (W, 1)
+    targets = np.linspace(0.0, 1.0, n_points, dtype=np.float32)[None, :] * total  # (W, N)
+
+    # Segment contenant chaque point cible
+    seg = (cumulative[:, None, :] <= targets[:, :, None]).sum(axis=2) - 1   # (W, N)
+    seg = np.clip(seg, 0, points.shape[1] - 2)
+
+    rows = np.arange(points.shape[0])[:, None]
+    start = points[rows, seg]                                               # (W, N, 2)
+    end = points[rows, seg + 1]
+    seg_len = segments[rows, seg]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        ratio = np.where(seg_len > 0, (targets - cumulative[rows, seg]) / seg_len, 0.0)
+    return start + (end - start) * ratio[:, :, None]
+
+
+def _normalize_shapes(paths: np.ndarray) -> np.ndarray:
+    """Centre et met à l'échelle des chemins (W, N, 2) pour comparer leur forme"""
+    centered = paths - paths.mean(axis=1, keepdims=True)
+    extent = np.ptp(paths, axis=1).max(axis=1)                              # (W,)
+    extent = np.where(extent > 0, extent, 1.0)
+    return centered / extent[:, None, None]
+
+
+class SwipeDecoder:
+    """Décode une trajectoire sur le clavier en mots du dictionnaire"""
+
+    def __init__(self, keyboard, dictionary=None):
+        """
+        Initialise le décodeur
+
+        Args:
+            keyboard: VirtualKeyboard (positions des touches)
+            dictionary: BinaryDictionary source des mots (optionnel)
+        """
+        self.n_points = config.SWIPE_SAMPLE_POINTS
+        self.key_chars: List[str] = []
+        self.key_centers = np.zeros((0, 2), dtype=np.float32)
+        self.words: List[str] = []
+        self.templates = np.zeros((0, self.n_points, 2), dtype=np.float32)
+        self.shapes = np.zeros((0, self.n_points, 2), dtype=np.float32)
+        self.start_keys = np.zeros(0, dtype=np.int32)
+        self.end_keys = np.zeros(0, dtype=np.int32)
+        self.log_freqs = np.zeros(0, dtype=np.float32)
+        # Chemins idéaux déjà calculés, par (dictionnaire, position des touches)
+        self._models = BackgroundCache('swipe-templates')
+
+        self.rebuild(keyboard, dictionary)
+
+    def rebuild(self, keyboard, dictionary=None, background: bool = False):
+        """
+        Recalcule les chemins idéaux (changement de layout ou de langue)
+
+        En arrière-plan, les chemins de la langue précédente restent utilisés
+        jusqu'à ce que les nouveaux soient prêts (si le layout n'a pas changé).
+
+        Args:
+            keyboard: VirtualKeyboard
+            dictionary: BinaryDictionary ou None
+            background: Calculer sur un thread (touches L et K)
+        """
+        key_index: Dict[str, int] = {}
+        centers = []
+        for key in keyboard.keys:
+            if len(key.char) == 1 and key.char.isalpha():
+                char = key.char.lower()
+                if char not in key_index:
+                    key_index[char] = len(centers)
+                    centers.append((key.x + key.w / 2, key.y + key.h / 2))
+        key_centers = np.array(centers, dtype=np.float32).reshape(-1, 2)
+        if dictionary is None or list(key_index) != self.key_chars \
+                or not np.array_equal(key_centers, self.key_centers):
+            # Les chemins de l'ancien layout ne correspondent plus aux touches
+            self._set_model(self._build_model(None, key_index, key_centers))
+        self.key_chars = list(key_index)
+        self.key_centers = key_centers
+        if dictionary is None:
+            return
+
+        key = (dictionary.path, tuple(key_index), key_centers.tobytes())
+        model = self._models.request(
+            key, lambda: self._build_model(dictionary, key_index, key_centers), background
+        )
+        if model is not None:
+            self._set_model(model)
+
+    def _set_model(self, model: tuple):
+        """Remplace les chemins idéaux (mots, chemins, formes, touches de début/fin, fréquences)"""
+        self.words, self.templates, self.shapes, self.start_keys, self.end_keys, self.log_freqs = model
+
+    def _build_model(self, dictionary, key_index: Dict[str, int], key_centers: np.ndarray) -> tuple:
+        """
+        Calcule les chemins idéaux des mots d'un dictionnaire pour un layout
+
+        Args:
+            dictionary: BinaryDictionary ou None
+            key_index: Lettre -> index de la touche
+            key_centers: Centres des touches (N, 2)
+
+        Returns:
+            (mots, chemins, formes, touches de début, touches de fin, log-fréquences)
+        """
+        words, sequences, freqs = [], [], []
+        if dictionary is not None:
+            indices = dictionary.top_indices(config.SWIPE_VOCABULARY_SIZE)
+            for word, freq in dictionary.iter_words(indices):
+                sequence = []
+                for char in word:
+                    index = key_index.get(char, key_index.get(strip_accents(char)))
+                    if index is None:
+                        sequence = None
+                        break
+                    # Les lettres doublées ne changent pas la trajectoire
+                    if not sequence or sequence[-1] != index:
+                        sequence.append(index)
+                if sequence:
+                    words.append(word)
+                    sequences.append(sequence)
+                    freqs.append(freq)
+
+        if not words:
+            templates = np.zeros((0, self.n_points, 2), dtype=np.float32)
+            empty = np.zeros(0, dtype=np.int32)
+            return words, templates, templates, empty, empty, np.zeros(0, dtype=np.float32)
+
+        # Séquences de touches complétées par répétition de la dernière
+        max_len = max(len(s) for s in sequences)
+        padded = np.array([s + [s[-1]] * (max_len - len(s)) for s in sequences], dtype=np.int32)
+        templates = resample_polylines(key_centers[padded], self.n_points)
+        return (
+            words, templates, _normalize_shapes(templates), padded[:, 0],
+            np.array([s[-1] for s in sequences], dtype=np.int32),
+            np.log1p(np.array(freqs, dtype=np.float32)),
+        )
+
+    def _nearby_keys(self, point: np.ndarray) -> np.ndarray:
+        """Touches dont le centre est proche d'un point (au moins la plus proche)"""
+        distances = np.linalg.norm(self.key_centers - point, axis=1)
+        nearby = np.flatnonzero(distances < config.SWIPE_KEY_RADIUS)
+        if len(nearby) == 0:
+            nearby = np.array([int(np.argmin(distances))])
+        return nearby
+
+    def decode(self, path: List[Tuple[int, int]], limit: int = None) -> List[str]:
+        """
+        Décode une trajectoire en mots candidats
+
+        Args:
+            path: Positions successives du curseur pendant le pincement
+            limit: Nombre maximum de candidats (config.MAX_PREDICTIONS par défaut)
+
+        Returns:
+            Mots triés du plus probable au moins probable
+        """
+        limit = limit or config.MAX_PREDICTIONS
+        model = self._models.take()
+        if model is not None:
+            self._set_model(model)
+        if len(self.words) == 0 or len(path) < 2:
+            return []
+
+        points = np.asarray(path, dtype=np.float32)[None, :, :]
+        sampled = resample_polylines(points, self.n_points)[0]
+
+        # Élagage par touches de début et de fin
+        candidates = np.flatnonzero(
+            np.isin(self.start_keys, self._nearby_keys(sampled[0]))
+            & np.isin(self.end_keys, self._nearby_keys(sampled[-1]))
+        )
+        if len(candidates) == 0:
+            return []
+
+        # Canal position: distance moyenne point à point (pixels)
+        location = np.linalg.norm(self.templates[candidates] - sampled, axis=2).mean(axis=1)
+        # Canal forme: même calcul après normalisation translation/échelle
+        shape = _normalize_shapes(sampled[None])[0]
+        shape_dist = np.linalg.norm(self.shapes[candidates] - shape, axis=2).mean(axis=1)
+
+        scores = (
+            -0.5 * (location / config.SWIPE_LOCATION_SIGMA) ** 2
+            - 0.5 * (shape_dist / config.SWIPE_SHAPE_SIGMA) ** 2
+            + config.SWIPE_FREQUENCY_WEIGHT * self.log_freqs[candidates]
+        )
+        order = np.argsort(-scores)[:limit]
+        return [self.words[int(candidates[i])] for i in order]
+
+
+class SwipeCapture:
+    """Enregistre la trajectoire de chaque main pendant le pincement"""
+
+    def __init__(self):
+        """Initialise la capture"""
+        self.paths: Dict[str, List[Tuple[int, int]]] = {'left': [], 'right': []}
+        self.active: Dict[str, bool] = {'left': False, 'right': False}
+
+    def update(self, hand: str, pos: Optional[Tuple[int, int]], clicking: bool) -> Optional[List[Tuple[int, int]]]:
+        """
+        Met à jour la trajectoire d'une main
+
+        Args:
+            hand: 'left' ou 'right'
+            pos: Position du curseur ou None
+            clicking: État du pincement
+
+        Returns:
+            La trajectoire complète au relâchement du pincement, sinon None
+        """
+        if clicking and pos:
+            if not self.active[hand]:
+                self.active[hand] = True
+                self.paths[hand] = []
+            self.paths[hand].append(pos)
+            return None
+
+        if self.active[hand]:
+            self.active[hand] = False
+            path = self.paths[hand]
+            self.paths[hand] = []
+            return path
+
+        return None
+
+    @staticmethod
+    def is_swipe(path: List[Tuple[int, int]]) -> bool:
+        """
+        Indique si une trajectoire est un geste de mot (et non un simple appui)
+
+        Args:
+            path: Trajectoire capturée
+
+        Returns:
+            True si la longueur parcourue dépasse le seuil de swipe
+        """
+        length = 0.0
+        for (x0, y0), (x1, y1) in zip(path, path[1:]):
+            length += math.hypot(x1 - x0, y1 - y0)
+        return length >= config.SWIPE_MIN_PATH_LENGTH
+
+    def draw(self, screen: pygame.Surface, theme: dict) -> List[pygame.Rect]:
+        """
+        Dessine les trajectoires en cours
+
+        Args:
+            screen: Surface Pygame
+            theme: Thème de couleurs
+
+        Returns:
+            Zones dessinées
+        """
+        rects = []
+        for path in self.paths.values():
+            if len(path) >= 2:
+                rects.append(pygame.draw.lines(screen, theme['cursor'], False, path, 3))
+        return rects
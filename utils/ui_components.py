@@ -5,9 +5,153 @@ Contient les éléments visuels réutilisables
 
 import pygame
 import math
-import random
+import numpy as np
+from bisect import bisect_right
+from collections import OrderedDict
 from typing import Optional, Tuple, List
 import config
+from .fonts import get_font, render_text
+from .hud import HudText, RefreshLimiter
+from .viewport import layout_px
+
+
+class TextLayout:
+    """Césure incrémentale d'un texte en lignes (retours à la ligne et mots)"""
+    
+    def __init__(self, font: pygame.font.Font, width: int):
+        """
+        Initialise la mise en page
+        
+        Args:
+            font: Police utilisée pour mesurer le texte
+            width: Largeur maximale d'une ligne en pixels
+        """
+        self.font = font
+        self.width = width
+        self.text = ""
+        # Lignes (début, fin) en indices du texte, fin exclue, sans le '\n'
+        self.lines: List[Tuple[int, int]] = [(0, 0)]
+        self._starts: List[int] = [0]
+        self._space_width = font.size(" ")[0]
+        self._word_widths = {}
+    
+    def _word_width(self, word: str) -> int:
+        """Largeur d'un mot (mise en cache)"""
+        width = self._word_widths.get(word)
+        if width is None:
+            if len(self._word_widths) > 10000:
+                self._word_widths.clear()
+            width = self.font.size(word)[0]
+            self._word_widths[word] = width
+        return width
+    
+    def _wrap(self, text: str, pos: int) -> List[Tuple[int, int]]:
+        """
+        Découpe le texte en lignes à partir d'un début de ligne
+        
+        Args:
+            text: Texte complet
+            pos: Indice du début de ligne où reprendre
+            
+        Returns:
+            Liste des lignes (début, fin) jusqu'à la fin du texte
+        """
+        lines = []
+        length = len(text)
+        while True:
+            # Fin du paragraphe courant
+            para_end = text.find("\n", pos)
+            if para_end < 0:
+                para_end = length
+            
+            line_start = pos
+            x = 0
+            i = pos
+            while i < para_end:
+                word_end = text.find(" ", i, para_end)
+                if word_end < 0:
+                    word_end = para_end
+                token_end = word_end
+                while token_end < para_end and text[token_end] == " ":
+                    token_end += 1
+                
+                word_width = self._word_width(text[i:word_end])
+                if x > 0 and x + word_width > self.width:
+                    # Le mot passe à la ligne suivante
+                    lines.append((line_start, i))
+                    line_start = i
+                    x = 0
+                
+                if x == 0 and word_width > self.width:
+                    # Mot plus long qu'une ligne: coupure par caractères
+                    while self.font.size(text[line_start:word_end])[0] > self.width:
+                        lo, hi = line_start + 1, word_end
+                        while lo < hi:
+                            mid = (lo + hi + 1) // 2
+                            if self.font.size(text[line_start:mid])[0] <= self.width:
+                                lo = mid
+                            else:
+                                hi = mid - 1
+                        lines.append((line_start, lo))
+                        line_start = lo
+                    word_width = self.font.size(text[line_start:word_end])[0]
+                
+                # Les espaces finaux peuvent déborder (invisibles)
+                x += word_width + (token_end - word_end) * self._space_width
+                i = token_end
+            
+            lines.append((line_start, para_end))
+            if para_end >= length:
+                return lines
+            pos = para_end + 1
+    
+    def update(self, text: str) -> bool:
+        """
+        Met à jour la mise en page après une modification
+        
+        Seules les lignes à partir de la première modification (et la ligne
+        précédente, qui peut récupérer un mot raccourci) sont recalculées.
+        
+        Args:
+            text: Nouveau texte
+            
+        Returns:
+            True si le texte a changé
+        """
+        old = self.text
+        if text == old:
+            return False
+        
+        # Longueur du préfixe commun (cas usuels: ajout ou suppression en fin)
+        if text.startswith(old):
+            first_diff = len(old)
+        elif old.startswith(text):
+            first_diff = len(text)
+        else:
+            lo, hi = 0, min(len(old), len(text))
+            while lo < hi:
+                mid = (lo + hi + 1) // 2
+                if text.startswith(old[:mid]):
+                    lo = mid
+                else:
+                    hi = mid - 1
+            first_diff = lo
+        
+        index = max(0, bisect_right(self._starts, first_diff) - 2)
+        restart = self.lines[index][0]
+        del self.lines[index:]
+        del self._starts[index:]
+        
+        new_lines = self._wrap(text, restart)
+        self.lines.extend(new_lines)
+        self._starts.extend(start for start, _ in new_lines)
+        self.text = text
+        return True
+    
+    def line_text(self, index: int) -> str:
+        """Retourne le texte d'une ligne"""
+        start, end = self.lines[index]
+        return self.text[start:end]
 
 
 class TextBox:
@@ -20,78 +164,216 @@ class TextBox:
         self.w = config.TEXT_BOX_WIDTH
         self.h = config.TEXT_BOX_HEIGHT
         
-    def draw(self, screen: pygame.Surface, text: str, theme: dict, font: pygame.font.Font):
+        # Cadre (fond, halo, contour) pré-rendu, invalidé au changement de couleurs
+        self._chrome = None
+        self._chrome_key = None
+        
+        # Texte visible pré-rendu (ombre comprise), invalidé au changement de texte
+        self._text_surface = None
+        self._text_key = None
+        self._text_overflow = False
+        
+        # Nombre max de caractères pouvant tenir dans la largeur, par police
+        self._max_chars = {}
+        
+        # Mode multi-lignes: mise en page incrémentale et une surface par ligne
+        self.multiline = config.TEXT_BOX_MULTILINE
+        self._line_font = None
+        self._layout = None
+        self._line_cache = OrderedDict()
+    
+    @property
+    def bounds(self) -> pygame.Rect:
+        """Zone couverte par la zone de texte (halo compris)"""
+        return pygame.Rect(self.x - 5, self.y - 5, self.w + 10, self.h + 10)
+    
+    def _get_chrome(self, theme: dict) -> pygame.Surface:
         """
-        Dessine la zone de texte avec glassmorphism
+        Retourne le cadre de la zone de texte, rendu une seule fois par thème
         
         Args:
-            screen: Surface Pygame
-            text: Texte à afficher
             theme: Thème de couleurs
-            font: Police pour le texte
+            
+        Returns:
+            Surface (w + 10, h + 10) à blitter en (x - 5, y - 5)
         """
-        # Fond glassmorphism avec blur simulé
-        bg_surface = pygame.Surface((self.w, self.h), pygame.SRCALPHA)
+        key = (theme['text_box_bg'], theme['text_box_border'])
+        if self._chrome is not None and self._chrome_key == key:
+            return self._chrome
         
-        # Check if theme color has alpha
-        theme_bg = theme['text_box_bg']
-        if len(theme_bg) == 4:
-            bg_color = theme_bg
-        else:
-            bg_color = theme_bg + (220,)  # Default opacity if not specified
-            
+        chrome = pygame.Surface((self.w + 10, self.h + 10), pygame.SRCALPHA)
+        
+        # Fond glassmorphism avec blur simulé
         pygame.draw.rect(
-            bg_surface,
-            bg_color,
-            (0, 0, self.w, self.h),
+            chrome,
+            theme['text_box_bg_rgba'],
+            (5, 5, self.w, self.h),
             border_radius=config.TEXT_BOX_BORDER_RADIUS
         )
-        screen.blit(bg_surface, (self.x, self.y))
         
         # Glow externe
         glow_surface = pygame.Surface((self.w + 10, self.h + 10), pygame.SRCALPHA)
-        
-        theme_border = theme['text_box_border']
-        if len(theme_border) == 4:
-             # If border has alpha, use a fraction of it for glow, or fixed low alpha
-             glow_color = theme_border[:3] + (30,)
-        else:
-             glow_color = theme_border + (30,)
-             
         pygame.draw.rect(
             glow_surface,
-            glow_color,
+            theme['text_box_glow'],
             (0, 0, self.w + 10, self.h + 10),
             border_radius=config.TEXT_BOX_BORDER_RADIUS + 2
         )
-        screen.blit(glow_surface, (self.x - 5, self.y - 5))
+        chrome.blit(glow_surface, (0, 0))
         
         # Contour lumineux
         pygame.draw.rect(
-            screen,
+            chrome,
             theme['text_box_border'],
-            (self.x, self.y, self.w, self.h),
+            (5, 5, self.w, self.h),
             3,
             border_radius=config.TEXT_BOX_BORDER_RADIUS
         )
         
-        # Texte avec défilement si trop long
-        text_surface = font.render(text, True, theme['text'])
+        self._chrome = chrome
+        self._chrome_key = key
+        return chrome
+    
+    def _max_visible_chars(self, font: pygame.font.Font, available: int) -> int:
+        """Borne supérieure du nombre de caractères visibles (glyphe le plus étroit)"""
+        if font not in self._max_chars:
+            narrowest = min(max(1, font.size(c)[0]) for c in " .,'il|!:;")
+            self._max_chars[font] = available // narrowest + 1
+        return self._max_chars[font]
+    
+    def _render_visible_text(self, tail: str, font: pygame.font.Font, color: Tuple[int, int, int],
+                             available: int) -> Tuple[pygame.Surface, bool]:
+        """
+        Rend la partie visible de la fin du texte, avec son ombre
+        
+        Args:
+            tail: Fin du texte (au moins tout ce qui peut être visible)
+            font: Police pour le texte
+            color: Couleur du texte
+            available: Largeur disponible en pixels
+            
+        Returns:
+            Tuple (surface contenant l'ombre et le texte, True si le début est masqué)
+        """
+        # Recherche dichotomique du premier caractère visible
+        lo, hi = 0, len(tail)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if font.size(tail[mid:])[0] <= available:
+                hi = mid
+            else:
+                lo = mid + 1
+        visible = tail[lo:]
+        
+        text_surface = font.render(visible, True, color)
+        text_shadow = font.render(visible, True, (0, 0, 0))
         
-        # Calculer la position pour que le texte soit visible
+        surface = pygame.Surface(
+            (text_surface.get_width() + 2, text_surface.get_height() + 2), pygame.SRCALPHA
+        )
+        # Ombre du texte puis texte principal
+        surface.blit(text_shadow, (2, 2))
+        surface.blit(text_surface, (0, 0))
+        return surface, lo > 0
+    
+    def _get_line_surface(self, line: str, font: pygame.font.Font, color: Tuple[int, int, int]) -> pygame.Surface:
+        """
+        Retourne la surface d'une ligne (texte et ombre), depuis le cache LRU
+        
+        Args:
+            line: Texte de la ligne
+            font: Police
+            color: Couleur du texte
+            
+        Returns:
+            Surface de la ligne
+        """
+        key = (line, color)
+        surface = self._line_cache.get(key)
+        if surface is not None:
+            self._line_cache.move_to_end(key)
+            return surface
+        
+        text_surface = font.render(line, True, color)
+        text_shadow = font.render(line, True, (0, 0, 0))
+        surface = pygame.Surface(
+            (text_surface.get_width() + 2, text_surface.get_height() + 2), pygame.SRCALPHA
+        )
+        surface.blit(text_shadow, (2, 2))
+        surface.blit(text_surface, (0, 0))
+        
+        self._line_cache[key] = surface
+        if len(self._line_cache) > config.TEXT_BOX_LINE_CACHE_SIZE:
+            self._line_cache.popitem(last=False)
+        return surface
+    
+    def _draw_multiline(self, screen: pygame.Surface, text: str, theme: dict):
+        """
+        Dessine le texte sur plusieurs lignes en suivant le curseur d'insertion
+        
+        Args:
+            screen: Surface Pygame
+            text: Texte à afficher
+            theme: Thème de couleurs
+        """
+        if self._line_font is None:
+            self._line_font = get_font(config.TEXT_BOX_MULTILINE_FONT_SIZE)
+            self._layout = TextLayout(self._line_font, self.w - config.TEXT_BOX_PADDING * 2)
+        self._layout.update(text)
+        
+        line_height = self._line_font.get_linesize()
+        visible_count = max(1, (self.h - config.TEXT_BOX_LINE_PADDING * 2) // line_height)
+        
+        # Défilement: les dernières lignes, où se trouve le curseur d'insertion
+        first = max(0, len(self._layout.lines) - visible_count)
         text_x = self.x + config.TEXT_BOX_PADDING
-        if text_surface.get_width() > self.w - config.TEXT_BOX_PADDING * 2:
-            # Décaler vers la gauche si trop long
-            text_x = self.x + self.w - config.TEXT_BOX_PADDING - text_surface.get_width()
+        text_y = self.y + config.TEXT_BOX_LINE_PADDING
+        line_surface = None
+        for index in range(first, len(self._layout.lines)):
+            line_surface = self._get_line_surface(self._layout.line_text(index), self._line_font, theme['text'])
+            screen.blit(line_surface, (text_x, text_y))
+            text_y += line_height
+        
+        # Curseur d'insertion en fin de texte
+        caret_x = text_x + (line_surface.get_width() - 2 if line_surface else 0) + 2
+        caret_y = text_y - line_height
+        pygame.draw.line(screen, theme['text'], (caret_x, caret_y + 4), (caret_x, caret_y + line_height - 4), 2)
+    
+    def draw(self, screen: pygame.Surface, text: str, theme: dict, font: pygame.font.Font):
+        """
+        Dessine la zone de texte avec glassmorphism
         
-        text_y = self.y + (self.h - text_surface.get_height()) // 2
+        Seule la fin visible du texte est mesurée et rendue, et uniquement
+        quand elle change: le coût ne dépend pas de la longueur du document.
         
-        # Ombre du texte
-        text_shadow = font.render(text, True, (0, 0, 0))
-        screen.blit(text_shadow, (text_x + 2, text_y + 2))
+        Args:
+            screen: Surface Pygame
+            text: Texte à afficher
+            theme: Thème de couleurs
+            font: Police pour le texte (mode une ligne)
+        """
+        screen.blit(self._get_chrome(theme), (self.x - 5, self.y - 5))
+        
+        if self.multiline:
+            self._draw_multiline(screen, text, theme)
+            return
+        
+        available = self.w - config.TEXT_BOX_PADDING * 2
+        tail = text[-self._max_visible_chars(font, available):]
+        key = (tail, font, theme['text'])
+        if key != self._text_key:
+            self._text_surface, overflow = self._render_visible_text(tail, font, theme['text'], available)
+            self._text_overflow = overflow or len(tail) < len(text)
+            self._text_key = key
         
-        # Texte principal
-        screen.blit(text_surface, (text_x, text_y))
+        # Texte avec défilement si trop long: aligné à droite dès qu'il déborde
+        text_width = self._text_surface.get_width() - 2
+        text_x = self.x + config.TEXT_BOX_PADDING
+        if self._text_overflow:
+            text_x = self.x + self.w - config.TEXT_BOX_PADDING - text_width
+        text_y = self.y + (self.h - self._text_surface.get_height() + 2) // 2
+        
+        screen.blit(self._text_surface, (text_x, text_y))
 
 
 class StatusBar:
@@ -101,17 +383,68 @@ class StatusBar:
         """Initialise la barre d'état"""
         self.fps = 0
         self.theme_name = ""
+        self.quality = None
+        self.bar_height = config.STATUS_BAR_HEIGHT
+        
+        # Widgets retenus: rendus seulement quand leur valeur change
+        self.fps_label = HudText()
+        self.theme_label = HudText()
+        self._fps_limiter = RefreshLimiter()
+        
+        # Fond et instructions (statiques) rendus une seule fois par thème
+        self._background = None
+        self._background_key = None
         
-    def update(self, fps: float, theme_name: str):
+    def update(self, fps: float, theme_name: str, quality: str = None):
         """
         Met à jour les informations
         
         Args:
-            fps: FPS actuel
+            fps: FPS actuel (pris en compte à la fréquence HUD_REFRESH_RATE)
             theme_name: Nom du thème actuel
+            quality: Palier de qualité actif (optionnel)
         """
-        self.fps = fps
+        if self._fps_limiter.ready():
+            self.fps = fps
         self.theme_name = theme_name
+        self.quality = quality
+    
+    @property
+    def bounds(self) -> pygame.Rect:
+        """Zone couverte par la barre d'état"""
+        if not config.SHOW_FPS:
+            return pygame.Rect(0, 0, 0, 0)
+        return pygame.Rect(0, config.RENDER_HEIGHT - self.bar_height, config.RENDER_WIDTH, self.bar_height)
+    
+    def render_state(self) -> tuple:
+        """Valeurs affichées: la barre n'est redessinée que si elles changent"""
+        return (config.SHOW_FPS, int(self.fps), self.theme_name, self.quality)
+    
+    def _get_background(self, theme: dict, font: pygame.font.Font) -> pygame.Surface:
+        """
+        Retourne le fond de la barre avec les instructions, rendu une fois par thème
+        
+        Args:
+            theme: Thème de couleurs
+            font: Police pour le texte
+        """
+        key = (theme['status_bar'], theme['text'], font)
+        if self._background is not None and self._background_key == key:
+            return self._background
+        
+        bg_surface = pygame.Surface((config.RENDER_WIDTH, self.bar_height), pygame.SRCALPHA)
+        
+        bg_surface.fill(theme['status_bar_rgba'])
+        
+        # Instructions
+        instructions = "ESC: Menu | T: Changer thème | S: Sauvegarder"
+        inst_surface = render_text(instructions, font, theme['text'])
+        inst_x = (config.RENDER_WIDTH - inst_surface.get_width()) // 2
+        bg_surface.blit(inst_surface, (inst_x, layout_px(10)))
+        
+        self._background = bg_surface
+        self._background_key = key
+        return bg_surface
         
     def draw(self, screen: pygame.Surface, theme: dict, font: pygame.font.Font):
         """
@@ -125,100 +458,134 @@ class StatusBar:
         if not config.SHOW_FPS:
             return
         
-        # Fond
-        bar_height = 40
-        bg_surface = pygame.Surface((config.WINDOW_WIDTH, bar_height), pygame.SRCALPHA)
-        
-        theme_status = theme['status_bar']
-        if len(theme_status) == 4:
-            bg_color = theme_status
-        else:
-            bg_color = theme_status + (150,)
-            
-        bg_surface.fill(bg_color)
-        screen.blit(bg_surface, (0, config.WINDOW_HEIGHT - bar_height))
+        top = config.RENDER_HEIGHT - self.bar_height
+        screen.blit(self._get_background(theme, font), (0, top))
         
         # Texte FPS
-        fps_text = f"FPS: {int(self.fps)}"
-        fps_surface = font.render(fps_text, True, theme['text'])
-        screen.blit(fps_surface, (10, config.WINDOW_HEIGHT - bar_height + 10))
+        self.fps_label.set(f"FPS: {int(self.fps)}", theme['text'], font)
+        margin = layout_px(10)
+        self.fps_label.draw(screen, (margin, top + margin))
         
         # Texte thème
         theme_text = f"Thème: {self.theme_name}"
-        theme_surface = font.render(theme_text, True, theme['text'])
-        screen.blit(
-            theme_surface,
-            (config.WINDOW_WIDTH - theme_surface.get_width() - 10,
-             config.WINDOW_HEIGHT - bar_height + 10)
-        )
-        
-        # Instructions
-        instructions = "ESC: Menu | T: Changer thème | S: Sauvegarder"
-        inst_surface = font.render(instructions, True, theme['text'])
-        inst_x = (config.WINDOW_WIDTH - inst_surface.get_width()) // 2
-        screen.blit(inst_surface, (inst_x, config.WINDOW_HEIGHT - bar_height + 10))
+        if self.quality:
+            theme_text += f" | Qualité: {self.quality}"
+        self.theme_label.set(theme_text, theme['text'], font)
+        self.theme_label.draw(screen, (config.RENDER_WIDTH - margin, top + margin), 'topright')
 
 
-class Particle:
-    """Particule pour les effets visuels"""
+class EffectAtlas:
+    """Atlas partagé de sprites d'effets (points et anneaux pré-rendus)"""
     
-    def __init__(self, x: int, y: int, color: Tuple[int, int, int]):
+    def __init__(self):
+        """Initialise l'atlas (les sprites sont rendus à la première demande)"""
+        self._dots = {}
+        self._rings = {}
+    
+    @staticmethod
+    def alpha_bucket(alpha: float) -> int:
         """
-        Initialise une particule
+        Quantifie un alpha (0-255) en niveau de l'atlas
         
         Args:
-            x: Position X initiale
-            y: Position Y initiale
-            color: Couleur de la particule
-        """
-        self.x = float(x)
-        self.y = float(y)
-        self.color = color
-        
-        # Vélocité aléatoire
-        angle = random.uniform(0, 2 * math.pi)
-        speed = random.uniform(1, 3)
-        self.vx = math.cos(angle) * speed
-        self.vy = math.sin(angle) * speed
+            alpha: Transparence souhaitée
         
-        # Durée de vie
-        self.lifetime = config.PARTICLE_LIFETIME
-        self.max_lifetime = config.PARTICLE_LIFETIME
-        
-    def update(self):
-        """Met à jour la particule"""
-        self.x += self.vx
-        self.y += self.vy
-        self.lifetime -= 1
+        Returns:
+            Niveau entre 0 et EFFECT_ALPHA_BUCKETS - 1
+        """
+        bucket = int(alpha * config.EFFECT_ALPHA_BUCKETS / 256)
+        return min(max(bucket, 0), config.EFFECT_ALPHA_BUCKETS - 1)
+    
+    @staticmethod
+    def _bucket_alpha(bucket: int) -> int:
+        """Alpha représentatif d'un niveau"""
+        return int(255 * (bucket + 1) / config.EFFECT_ALPHA_BUCKETS)
+    
+    def dot(self, color: Tuple[int, int, int], radius: int, bucket: int) -> pygame.Surface:
+        """
+        Retourne un disque plein de taille (2*radius, 2*radius)
         
-        # Ralentir progressivement
-        self.vx *= 0.95
-        self.vy *= 0.95
+        Args:
+            color: Couleur RGB
+            radius: Rayon en pixels
+            bucket: Niveau d'alpha (voir alpha_bucket)
+        """
+        key = (color, radius, bucket)
+        sprite = self._dots.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color + (self._bucket_alpha(bucket),), (radius, radius), radius)
+            self._dots[key] = sprite
+        return sprite
+    
+    def ring(self, color: Tuple[int, int, int], radius: int, bucket: int, width: int = 2) -> pygame.Surface:
+        """
+        Retourne un cercle (contour) de taille (2*radius, 2*radius)
         
-    def is_alive(self) -> bool:
-        """Retourne True si la particule est encore vivante"""
-        return self.lifetime > 0
+        Args:
+            color: Couleur RGB
+            radius: Rayon en pixels
+            bucket: Niveau d'alpha (voir alpha_bucket)
+            width: Épaisseur du trait
+        """
+        key = (color, radius, bucket, width)
+        sprite = self._rings.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color + (self._bucket_alpha(bucket),), (radius, radius), radius, width)
+            self._rings[key] = sprite
+        return sprite
     
-    def draw(self, screen: pygame.Surface):
-        """Dessine la particule"""
-        # Alpha basé sur la durée de vie restante
-        alpha = int(255 * (self.lifetime / self.max_lifetime))
-        size = int(5 * (self.lifetime / self.max_lifetime))
-        
-        if size > 0:
-            particle_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-            color_with_alpha = self.color + (alpha,)
-            pygame.draw.circle(particle_surface, color_with_alpha, (size, size), size)
-            screen.blit(particle_surface, (int(self.x) - size, int(self.y) - size))
+    def clear(self):
+        """Libère tous les sprites (changement de thème)"""
+        self._dots.clear()
+        self._rings.clear()
 
 
 class ParticleSystem:
-    """Système de particules pour les effets visuels"""
+    """Système de particules à capacité fixe (structure de tableaux NumPy)"""
     
-    def __init__(self):
-        """Initialise le système de particules"""
-        self.particles: List[Particle] = []
+    def __init__(self, capacity: int = None, atlas: EffectAtlas = None):
+        """
+        Initialise le système de particules
         
+        Args:
+            capacity: Nombre maximal de particules vivantes (config par défaut)
+            atlas: Atlas de sprites partagé (créé si absent)
+        """
+        self.atlas = atlas or EffectAtlas()
+        self.capacity = capacity or config.PARTICLE_CAPACITY
+        
+        # État des particules: une ligne par emplacement
+        self.positions = np.zeros((self.capacity, 2), dtype=np.float32)
+        self.velocities = np.zeros((self.capacity, 2), dtype=np.float32)
+        self.lifetimes = np.zeros(self.capacity, dtype=np.int32)
+        self.color_ids = np.zeros(self.capacity, dtype=np.int32)
+        self.alive = np.zeros(self.capacity, dtype=bool)
+        
+        # Pile des emplacements libres
+        self._free = np.arange(self.capacity - 1, -1, -1, dtype=np.int32)
+        self._free_count = self.capacity
+        
+        # Couleurs indexées et sprites de l'atlas par (couleur, taille, alpha)
+        self._colors: List[Tuple[int, int, int]] = []
+        self._color_index = {}
+        self._sprites = {}
+    
+    def __len__(self) -> int:
+        """Nombre de particules vivantes"""
+        return self.capacity - self._free_count
+    
+    def _color_id(self, color: Tuple[int, int, int]) -> int:
+        """Retourne l'index d'une couleur (ajoutée si nouvelle)"""
+        color = tuple(color[:3])
+        index = self._color_index.get(color)
+        if index is None:
+            index = len(self._colors)
+            self._colors.append(color)
+            self._color_index[color] = index
+        return index
+    
     def emit(self, x: int, y: int, color: Tuple[int, int, int], count: int = None):
         """
         Émet des particules
@@ -232,26 +599,91 @@ class ParticleSystem:
         if not config.ENABLE_ANIMATIONS:
             return
         
-        count = count or config.PARTICLE_COUNT
-        for _ in range(count):
-            self.particles.append(Particle(x, y, color))
+        count = min(count or config.PARTICLE_COUNT, self._free_count)
+        if count <= 0:
+            return
+        
+        slots = self._free[self._free_count - count:self._free_count]
+        self._free_count -= count
+        
+        # Vélocité aléatoire
+        angles = np.random.uniform(0, 2 * math.pi, count)
+        speeds = np.random.uniform(1, 3, count)
+        self.positions[slots] = (x, y)
+        self.velocities[slots, 0] = np.cos(angles) * speeds
+        self.velocities[slots, 1] = np.sin(angles) * speeds
+        self.lifetimes[slots] = config.PARTICLE_LIFETIME
+        self.color_ids[slots] = self._color_id(color)
+        self.alive[slots] = True
     
     def update(self):
-        """Met à jour toutes les particules"""
-        for particle in self.particles:
-            particle.update()
+        """Met à jour toutes les particules (vectorisé)"""
+        if self._free_count == self.capacity:
+            return
+        
+        live = np.flatnonzero(self.alive)
+        self.positions[live] += self.velocities[live]
+        self.lifetimes[live] -= 1
+        
+        # Ralentir progressivement
+        self.velocities[live] *= 0.95
+        
+        # Libérer les particules mortes
+        dead = live[self.lifetimes[live] <= 0]
+        if len(dead):
+            self.alive[dead] = False
+            self._free[self._free_count:self._free_count + len(dead)] = dead
+            self._free_count += len(dead)
+    
+    def _get_sprite(self, color_id: int, size: int, bucket: int) -> pygame.Surface:
+        """Retourne le sprite d'une particule depuis l'atlas"""
+        sprite = self.atlas.dot(self._colors[color_id], size, bucket)
+        self._sprites[(color_id, size, bucket)] = sprite
+        return sprite
+    
+    def collect(self, batch: List[Tuple[pygame.Surface, Tuple[int, int]]]):
+        """
+        Ajoute les sprites des particules à un lot de blits
+        
+        Args:
+            batch: Liste de (sprite, position) complétée sur place
+        """
+        if self._free_count == self.capacity:
+            return
+        
+        live = np.flatnonzero(self.alive)
+        # Alpha et taille basés sur la durée de vie restante
+        ratio = self.lifetimes[live] / config.PARTICLE_LIFETIME
+        sizes = (5 * ratio).astype(np.int32)
+        visible = sizes > 0
+        live, ratio, sizes = live[visible], ratio[visible], sizes[visible]
+        if len(live) == 0:
+            return
         
-        # Supprimer les particules mortes
-        self.particles = [p for p in self.particles if p.is_alive()]
+        buckets = np.minimum(
+            (ratio * config.EFFECT_ALPHA_BUCKETS).astype(np.int32), config.EFFECT_ALPHA_BUCKETS - 1
+        )
+        corners = (self.positions[live].astype(np.int32) - sizes[:, None]).tolist()
+        keys = zip(self.color_ids[live].tolist(), sizes.tolist(), buckets.tolist())
+        sprites = [self._sprites.get(key) or self._get_sprite(*key) for key in keys]
+        batch.extend(zip(sprites, corners))
     
     def draw(self, screen: pygame.Surface):
-        """Dessine toutes les particules"""
-        for particle in self.particles:
-            particle.draw(screen)
+        """Dessine toutes les particules en un seul appel à blits"""
+        batch = []
+        self.collect(batch)
+        if batch:
+            screen.blits(batch, doreturn=False)
+    
+    def invalidate_sprites(self):
+        """Oublie les sprites mémorisés (après EffectAtlas.clear)"""
+        self._sprites.clear()
     
     def clear(self):
         """Supprime toutes les particules"""
-        self.particles.clear()
+        self.alive[:] = False
+        self._free = np.arange(self.capacity - 1, -1, -1, dtype=np.int32)
+        self._free_count = self.capacity
 
 
 class Cursor:
@@ -265,7 +697,20 @@ class Cursor:
         """Met à jour l'animation du curseur"""
         self.pulse = (self.pulse + 0.1) % (2 * math.pi)
     
-    def draw(self, screen: pygame.Surface, pos: Tuple[int, int], theme: dict, clicking: bool = False):
+    @staticmethod
+    def bounds(pos: Tuple[int, int]) -> pygame.Rect:
+        """
+        Zone couverte par le curseur (pulsation, arc et label compris)
+        
+        Args:
+            pos: Position (x, y)
+        """
+        radius = config.CURSOR_OUTER_RADIUS + 3 + 6
+        top = config.CURSOR_OUTER_RADIUS + 3 + config.CURSOR_LABEL_FONT_SIZE
+        return pygame.Rect(pos[0] - radius, pos[1] - top, radius * 2, top + radius)
+    
+    def draw(self, screen: pygame.Surface, pos: Tuple[int, int], theme: dict, clicking: bool = False,
+             dwell: float = 0.0):
         """
         Dessine le curseur (version par défaut - main droite)
         
@@ -274,10 +719,12 @@ class Cursor:
             pos: Position (x, y)
             theme: Thème de couleurs
             clicking: True si en train de cliquer
+            dwell: Progression de l'appui par temporisation (0-1)
         """
-        self.draw_right(screen, pos, theme, clicking)
+        self.draw_right(screen, pos, theme, clicking, dwell)
     
-    def draw_left(self, screen: pygame.Surface, pos: Tuple[int, int], theme: dict, clicking: bool = False):
+    def draw_left(self, screen: pygame.Surface, pos: Tuple[int, int], theme: dict, clicking: bool = False,
+                  dwell: float = 0.0):
         """
         Dessine le curseur de la main gauche
         
@@ -286,15 +733,14 @@ class Cursor:
             pos: Position (x, y)
             theme: Thème de couleurs
             clicking: True si en train de cliquer
+            dwell: Progression de l'appui par temporisation (0-1)
         """
         x, y = pos
         # Couleur légèrement modifiée pour la main gauche (plus bleutée)
-        base_color = theme['cursor']
-        color = tuple(min(255, max(0, c + offset)) for c, offset in zip(base_color, (-20, -10, 20)))
-        
-        self._draw_cursor_shape(screen, x, y, color, clicking, "L")
+        self._draw_cursor_shape(screen, x, y, theme['cursor_left'], clicking, "L", dwell)
     
-    def draw_right(self, screen: pygame.Surface, pos: Tuple[int, int], theme: dict, clicking: bool = False):
+    def draw_right(self, screen: pygame.Surface, pos: Tuple[int, int], theme: dict, clicking: bool = False,
+                   dwell: float = 0.0):
         """
         Dessine le curseur de la main droite
         
@@ -303,16 +749,14 @@ class Cursor:
             pos: Position (x, y)
             theme: Thème de couleurs
             clicking: True si en train de cliquer
+            dwell: Progression de l'appui par temporisation (0-1)
         """
         x, y = pos
         # Couleur légèrement modifiée pour la main droite (plus orangée)
-        base_color = theme['cursor']
-        color = tuple(min(255, max(0, c + offset)) for c, offset in zip(base_color, (20, 10, -20)))
-        
-        self._draw_cursor_shape(screen, x, y, color, clicking, "R")
+        self._draw_cursor_shape(screen, x, y, theme['cursor_right'], clicking, "R", dwell)
     
     def _draw_cursor_shape(self, screen: pygame.Surface, x: int, y: int, color: Tuple[int, int, int], 
-                          clicking: bool, label: str):
+                          clicking: bool, label: str, dwell: float = 0.0):
         """
         Dessine la forme du curseur
         
@@ -322,6 +766,7 @@ class Cursor:
             color: Couleur du curseur
             clicking: True si en train de cliquer
             label: Label à afficher (L ou R)
+            dwell: Progression de l'appui par temporisation (0-1)
         """
         # Rayon avec pulsation
         pulse_offset = int(math.sin(self.pulse) * 3)
@@ -338,6 +783,11 @@ class Cursor:
             click_radius = outer_radius - 5
             pygame.draw.circle(screen, color, (x, y), click_radius, 1)
         
+        # Progression de l'appui par temporisation (mode tap)
+        if dwell > 0:
+            arc_rect = (x - outer_radius - 4, y - outer_radius - 4, 2 * outer_radius + 8, 2 * outer_radius + 8)
+            pygame.draw.arc(screen, color, arc_rect, math.pi / 2, math.pi / 2 + dwell * 2 * math.pi, 3)
+        
         # Lignes de visée (croix)
         line_length = 10
         pygame.draw.line(screen, color, (x - line_length, y), (x - 5, y), 1)
@@ -346,8 +796,7 @@ class Cursor:
         pygame.draw.line(screen, color, (x, y + 5), (x, y + line_length), 1)
         
         # Label pour identifier la main
-        font = pygame.font.Font(None, 20)
-        label_surface = font.render(label, True, color)
+        label_surface = render_text(label, get_font(config.CURSOR_LABEL_FONT_SIZE), color)
         label_rect = label_surface.get_rect(center=(x, y - outer_radius - 10))
         screen.blit(label_surface, label_rect)
 
@@ -360,55 +809,107 @@ class StatsDisplay:
         self.x = config.STATS_POSITION_X
         self.y = config.STATS_POSITION_Y
         
-    def draw(self, screen: pygame.Surface, stats: dict, theme: dict, font: pygame.font.Font):
+        # Widgets retenus: rendus seulement quand leur valeur change
+        self.wpm_label = HudText()
+        self.accuracy_label = HudText()
+        self.time_label = HudText()
+        self.chars_label = HudText()
+        self.labels = (self.wpm_label, self.accuracy_label, self.time_label, self.chars_label)
+        self._time_limiter = RefreshLimiter()
+    
+    def update(self, stats: dict, theme: dict, font: pygame.font.Font):
         """
-        Dessine les statistiques
+        Met à jour les textes affichés (rendus seulement s'ils changent)
         
         Args:
-            screen: Surface Pygame
             stats: Dictionnaire des statistiques
             theme: Thème de couleurs
             font: Police pour le texte
         """
-        if not config.ENABLE_STATS:
-            return
-        
         color = theme['text']
-        y_offset = 0
         
         # WPM (plus gros)
-        wpm_text = f"WPM: {int(stats['wpm'])}"
-        wpm_font = pygame.font.Font(None, config.STATS_FONT_SIZE + 10)
-        wpm_surface = wpm_font.render(wpm_text, True, theme['key_hover'])
-        screen.blit(wpm_surface, (self.x, self.y + y_offset))
-        y_offset += 30
+        self.wpm_label.set(f"WPM: {int(stats['wpm'])}", theme['key_hover'],
+                           get_font(config.STATS_FONT_SIZE + layout_px(10)))
+        self.wpm_label.place((self.x, self.y))
         
         # Précision
-        acc_text = f"Précision: {int(stats['accuracy'])}%"
-        acc_surface = font.render(acc_text, True, color)
-        screen.blit(acc_surface, (self.x, self.y + y_offset))
-        y_offset += 25
+        self.accuracy_label.set(f"Précision: {int(stats['accuracy'])}%", color, font)
+        self.accuracy_label.place((self.x, self.y + layout_px(30)))
         
-        # Temps de session
-        time_text = f"Temps: {stats['session_time_formatted']}"
-        time_surface = font.render(time_text, True, color)
-        screen.blit(time_surface, (self.x, self.y + y_offset))
-        y_offset += 25
+        # Temps de session (rafraîchi à la fréquence HUD_REFRESH_RATE)
+        if self.time_label.surface is None or self._time_limiter.ready():
+            self.time_label.set(f"Temps: {stats['session_time_formatted']}", color, font)
+        self.time_label.place((self.x, self.y + layout_px(55)))
         
         # Caractères
-        chars_text = f"Caractères: {stats['total_chars']}"
-        chars_surface = font.render(chars_text, True, color)
-        screen.blit(chars_surface, (self.x, self.y + y_offset))
+        self.chars_label.set(f"Caractères: {stats['total_chars']}", color, font)
+        self.chars_label.place((self.x, self.y + layout_px(80)))
+    
+    @property
+    def bounds(self) -> pygame.Rect:
+        """Zone couverte par les statistiques"""
+        if not config.ENABLE_STATS:
+            return pygame.Rect(0, 0, 0, 0)
+        return self.labels[0].rect.unionall([label.rect for label in self.labels[1:]])
+    
+    def render_state(self) -> tuple:
+        """Textes affichés: redessiner seulement s'ils changent"""
+        return (config.ENABLE_STATS,) + tuple((label.text, label.color) for label in self.labels)
+    
+    def draw_labels(self, screen: pygame.Surface):
+        """Dessine les textes préparés par update"""
+        if not config.ENABLE_STATS:
+            return
+        for label in self.labels:
+            label.draw(screen)
+        
+    def draw(self, screen: pygame.Surface, stats: dict, theme: dict, font: pygame.font.Font):
+        """
+        Dessine les statistiques
+        
+        Args:
+            screen: Surface Pygame
+            stats: Dictionnaire des statistiques
+            theme: Thème de couleurs
+            font: Police pour le texte
+        """
+        if not config.ENABLE_STATS:
+            return
+        
+        self.update(stats, theme, font)
+        self.draw_labels(screen)
 
 
 class TrailEffect:
     """Effet de traînée derrière les curseurs"""
     
-    def __init__(self):
-        """Initialise l'effet de traînée"""
-        self.left_trail = []
-        self.right_trail = []
+    # Mains suivies (couleurs 'cursor_left' / 'cursor_right' de la palette)
+    HANDS = ('left', 'right')
+    
+    def __init__(self, atlas: EffectAtlas = None):
+        """
+        Initialise l'effet de traînée
         
+        Args:
+            atlas: Atlas de sprites partagé (créé si absent)
+        """
+        self.atlas = atlas or EffectAtlas()
+        # Tampons circulaires de positions: (TRAIL_LENGTH, 2) par main
+        self.length = config.TRAIL_LENGTH
+        self.buffers = {hand: np.zeros((self.length, 2), dtype=np.int32) for hand in self.HANDS}
+        self.heads = {hand: 0 for hand in self.HANDS}
+        self.counts = {hand: 0 for hand in self.HANDS}
+        
+        # Rayon et niveau d'alpha selon l'âge et le nombre de points
+        self._styles = {}
+    
+    def _push(self, hand: str, pos: Tuple[int, int]):
+        """Ajoute une position au tampon circulaire d'une main"""
+        self.buffers[hand][self.heads[hand]] = pos
+        self.heads[hand] = (self.heads[hand] + 1) % self.length
+        self.counts[hand] = min(self.counts[hand] + 1, self.length)
+    
     def update(self, left_pos: Optional[Tuple[int, int]], right_pos: Optional[Tuple[int, int]]):
         """
         Met à jour les traînées
@@ -422,45 +923,57 @@ class TrailEffect:
         
         # Ajouter positions actuelles
         if left_pos:
-            self.left_trail.append(left_pos)
-            if len(self.left_trail) > config.TRAIL_LENGTH:
-                self.left_trail.pop(0)
-        
+            self._push('left', left_pos)
         if right_pos:
-            self.right_trail.append(right_pos)
-            if len(self.right_trail) > config.TRAIL_LENGTH:
-                self.right_trail.pop(0)
+            self._push('right', right_pos)
     
-    def draw(self, screen: pygame.Surface, theme: dict):
+    def _style(self, count: int) -> List[Tuple[int, int]]:
+        """(rayon, niveau d'alpha) de chaque point, du plus ancien au plus récent"""
+        style = self._styles.get(count)
+        if style is None:
+            style = []
+            for i in range(count):
+                # Alpha et taille basés sur la position dans la traînée
+                alpha = 255 * (i / count) * 0.5
+                size = int(3 + (i / count) * 5)
+                style.append((size, EffectAtlas.alpha_bucket(alpha)))
+            self._styles[count] = style
+        return style
+    
+    def collect(self, batch: List[Tuple[pygame.Surface, Tuple[int, int]]], theme: dict):
         """
-        Dessine les traînées
+        Ajoute les sprites des traînées à un lot de blits
         
         Args:
-            screen: Surface Pygame
+            batch: Liste de (sprite, position) complétée sur place
             theme: Thème de couleurs
         """
         if not config.ENABLE_TRAIL_EFFECT:
             return
         
-        self._draw_trail(screen, self.left_trail, theme['cursor'], -20, -10, 20)
-        self._draw_trail(screen, self.right_trail, theme['cursor'], 20, 10, -20)
+        for hand, buffer in self.buffers.items():
+            count = self.counts[hand]
+            if count == 0:
+                continue
+            color = theme['cursor_' + hand]
+            # Du plus ancien au plus récent
+            start = (self.heads[hand] - count) % self.length
+            order = (start + np.arange(count)) % self.length
+            for (x, y), (size, bucket) in zip(buffer[order].tolist(), self._style(count)):
+                batch.append((self.atlas.dot(color, size, bucket), (x - size, y - size)))
     
-    def _draw_trail(self, screen: pygame.Surface, trail: List[Tuple[int, int]], 
-                   base_color: Tuple[int, int, int], r_offset: int, g_offset: int, b_offset: int):
-        """Dessine une traînée"""
-        for i, pos in enumerate(trail):
-            # Alpha basé sur la position dans la traînée
-            alpha = int(255 * (i / len(trail)) * 0.5)
-            size = int(3 + (i / len(trail)) * 5)
-            
-            # Couleur avec offset
-            color = tuple(min(255, max(0, c + offset)) 
-                         for c, offset in zip(base_color, (r_offset, g_offset, b_offset)))
-            
-            # Dessiner cercle semi-transparent
-            trail_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(trail_surface, color + (alpha,), (size, size), size)
-            screen.blit(trail_surface, (pos[0] - size, pos[1] - size))
+    def draw(self, screen: pygame.Surface, theme: dict):
+        """
+        Dessine les traînées
+        
+        Args:
+            screen: Surface Pygame
+            theme: Thème de couleurs
+        """
+        batch = []
+        self.collect(batch, theme)
+        if batch:
+            screen.blits(batch, doreturn=False)
 
 
 class ComboIndicator:
@@ -471,6 +984,8 @@ class ComboIndicator:
         self.combo_count = 0
         self.last_keystroke_time = 0
         self.combo_display_alpha = 0
+        self.label = HudText()
+        self._alpha_surface = None
         
     def update(self, keystroke_occurred: bool):
         """
@@ -500,6 +1015,24 @@ class ComboIndicator:
                 self.combo_count = 0
                 self.combo_display_alpha = max(0, self.combo_display_alpha - 5)
     
+    def _visible(self) -> bool:
+        """Indique si le combo est affiché"""
+        return config.ENABLE_COMBO_SYSTEM and self.combo_count >= config.COMBO_MULTIPLIER_THRESHOLD
+    
+    @property
+    def bounds(self) -> pygame.Rect:
+        """Zone couverte par le texte du combo (mesuré sans rendu)"""
+        if not self._visible():
+            return pygame.Rect(0, 0, 0, 0)
+        w, h = get_font(config.COMBO_FONT_SIZE).size(f"{self.combo_count}x COMBO!")
+        return pygame.Rect(0, 0, w, h).move(
+            config.RENDER_WIDTH // 2 - w // 2, config.COMBO_POSITION_Y - h // 2
+        ).inflate(4, 4)
+    
+    def render_state(self) -> tuple:
+        """Texte et transparence: redessiner seulement s'ils changent"""
+        return (self._visible(), self.combo_count, int(self.combo_display_alpha))
+    
     def draw(self, screen: pygame.Surface, theme: dict):
         """
         Dessine l'indicateur de combo
@@ -508,29 +1041,21 @@ class ComboIndicator:
             screen: Surface Pygame
             theme: Thème de couleurs
         """
-        if not config.ENABLE_COMBO_SYSTEM or self.combo_count < config.COMBO_MULTIPLIER_THRESHOLD:
+        if not self._visible():
             return
         
         # Position centrale en haut
-        x = config.WINDOW_WIDTH // 2
-        y = 100
-        
-        # Texte du combo
-        font = pygame.font.Font(None, 60)
-        combo_text = f"{self.combo_count}x COMBO!"
-        
-        # Couleur avec alpha
-        color = theme['key_hover'] + (int(self.combo_display_alpha),)
+        x = config.RENDER_WIDTH // 2
+        y = config.COMBO_POSITION_Y
         
-        # Surface avec alpha
-        text_surface = font.render(combo_text, True, theme['key_hover'])
-        alpha_surface = pygame.Surface(text_surface.get_size(), pygame.SRCALPHA)
-        alpha_surface.blit(text_surface, (0, 0))
-        alpha_surface.set_alpha(int(self.combo_display_alpha))
+        # Texte du combo (surface propre au widget pour régler son alpha)
+        if self.label.set(f"{self.combo_count}x COMBO!", theme['key_hover'], get_font(config.COMBO_FONT_SIZE)):
+            self._alpha_surface = self.label.surface.copy()
+        self._alpha_surface.set_alpha(int(self.combo_display_alpha))
         
         # Centrer
-        text_rect = alpha_surface.get_rect(center=(x, y))
-        screen.blit(alpha_surface, text_rect)
+        text_rect = self._alpha_surface.get_rect(center=(x, y))
+        screen.blit(self._alpha_surface, text_rect)
 
 
 class EnergyWave:
@@ -554,21 +1079,34 @@ class EnergyWave:
         """Retourne True si l'onde est encore visible"""
         return self.radius < self.max_radius
     
-    def draw(self, screen: pygame.Surface):
-        """Dessine l'onde"""
-        if self.alpha > 0:
-            wave_surface = pygame.Surface((self.max_radius * 2, self.max_radius * 2), pygame.SRCALPHA)
-            color_with_alpha = self.color + (self.alpha,)
-            pygame.draw.circle(wave_surface, color_with_alpha, 
-                             (self.max_radius, self.max_radius), int(self.radius), 2)
-            screen.blit(wave_surface, (self.x - self.max_radius, self.y - self.max_radius))
+    def sprite(self, atlas: EffectAtlas) -> Optional[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """
+        Retourne le sprite de l'onde et sa position
+        
+        Args:
+            atlas: Atlas de sprites
+        
+        Returns:
+            (sprite, position) ou None si l'onde est invisible
+        """
+        radius = int(self.radius)
+        if self.alpha <= 0 or radius <= 0:
+            return None
+        sprite = atlas.ring(self.color, radius, EffectAtlas.alpha_bucket(self.alpha))
+        return sprite, (self.x - radius, self.y - radius)
 
 
 class EnergyWaveSystem:
     """Système de gestion des ondes d'énergie"""
     
-    def __init__(self):
-        """Initialise le système d'ondes"""
+    def __init__(self, atlas: EffectAtlas = None):
+        """
+        Initialise le système d'ondes
+        
+        Args:
+            atlas: Atlas de sprites partagé (créé si absent)
+        """
+        self.atlas = atlas or EffectAtlas()
         self.waves: List[EnergyWave] = []
     
     def emit(self, x: int, y: int, color: Tuple[int, int, int]):
@@ -581,7 +1119,7 @@ class EnergyWaveSystem:
             color: Couleur de l'onde
         """
         if config.ENABLE_ENERGY_WAVES:
-            self.waves.append(EnergyWave(x, y, color))
+            self.waves.append(EnergyWave(x, y, tuple(color[:3])))
     
     def update(self):
         """Met à jour toutes les ondes"""
@@ -591,7 +1129,21 @@ class EnergyWaveSystem:
         # Supprimer les ondes mortes
         self.waves = [w for w in self.waves if w.is_alive()]
     
+    def collect(self, batch: List[Tuple[pygame.Surface, Tuple[int, int]]]):
+        """
+        Ajoute les sprites des ondes à un lot de blits
+        
+        Args:
+            batch: Liste de (sprite, position) complétée sur place
+        """
+        for wave in self.waves:
+            item = wave.sprite(self.atlas)
+            if item:
+                batch.append(item)
+    
     def draw(self, screen: pygame.Surface):
         """Dessine toutes les ondes"""
-        for wave in self.waves:
-            wave.draw(screen)
+        batch = []
+        self.collect(batch)
+        if batch:
+            screen.blits(batch, doreturn=False)
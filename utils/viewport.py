@@ -0,0 +1,131 @@
+"""
+Module de mise à l'échelle du rendu
+L'interface est rendue à une résolution interne (RENDER_SCALE) dans une surface
+hors écran, puis agrandie à la taille de la fenêtre une fois par frame
+"""
+
+import math
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+import config
+
+
+# Valeurs d'origine (unités de mise en page) des réglages convertis
+_layout_defaults: Dict[str, float] = {}
+
+
+def layout_px(value: float) -> int:
+    """
+    Convertit une longueur de mise en page en pixels de rendu
+
+    Args:
+        value: Longueur en unités de mise en page
+    """
+    return round(value * config.LAYOUT_SCALE)
+
+
+class Viewport:
+    """Correspondance entre mise en page, surface de rendu et fenêtre"""
+
+    def __init__(self, window_size: Tuple[int, int], render_scale: float = None):
+        """
+        Initialise la correspondance
+
+        Args:
+            window_size: Taille de la fenêtre (pixels écran)
+            render_scale: Résolution interne relative à la fenêtre (config par défaut)
+        """
+        scale = render_scale or config.RENDER_SCALE
+        self.window_size = window_size
+        self.render_size = (max(1, round(window_size[0] * scale)), max(1, round(window_size[1] * scale)))
+        self.scaled = self.render_size != tuple(window_size)
+
+        # Pixels de rendu par unité de mise en page (uniforme pour garder les proportions)
+        self.layout_scale = min(self.render_size[0] / config.LAYOUT_WIDTH,
+                                self.render_size[1] / config.LAYOUT_HEIGHT)
+
+        # Pixels de fenêtre par pixel de rendu
+        self._sx = window_size[0] / self.render_size[0]
+        self._sy = window_size[1] / self.render_size[1]
+
+    def apply(self):
+        """
+        Convertit les réglages de mise en page en pixels de rendu
+
+        Les valeurs d'origine sont conservées: l'appel peut être répété.
+        """
+        for name in config.LAYOUT_SCALED_SETTINGS:
+            default = _layout_defaults.setdefault(name, getattr(config, name))
+            value = default * self.layout_scale
+            if isinstance(default, int):
+                value = max(1, round(value)) if default > 0 else round(value)
+            setattr(config, name, value)
+
+        config.RENDER_WIDTH, config.RENDER_HEIGHT = self.render_size
+        config.LAYOUT_SCALE = self.layout_scale
+
+    def create_render_surface(self, window: pygame.Surface) -> pygame.Surface:
+        """
+        Retourne la surface de rendu (la fenêtre elle-même si l'échelle vaut 1)
+
+        Args:
+            window: Surface de la fenêtre
+        """
+        if not self.scaled:
+            return window
+        return pygame.Surface(self.render_size).convert()
+
+    def window_rect(self, rect: pygame.Rect) -> pygame.Rect:
+        """
+        Convertit une zone de rendu en zone de fenêtre (arrondie vers l'extérieur)
+
+        Args:
+            rect: Zone en pixels de rendu
+        """
+        left = math.floor(rect.left * self._sx)
+        top = math.floor(rect.top * self._sy)
+        right = math.ceil(rect.right * self._sx)
+        bottom = math.ceil(rect.bottom * self._sy)
+        return pygame.Rect(left, top, right - left, bottom - top)
+
+    def _scale(self, source: pygame.Surface, size: Tuple[int, int], dest: pygame.Surface = None):
+        """Agrandit une surface (plus proche voisin ou lissé), dans dest si fournie"""
+        scale = pygame.transform.smoothscale if config.SMOOTH_UPSCALE else pygame.transform.scale
+        if dest is None:
+            return scale(source, size)
+        return scale(source, size, dest)
+
+    def present(self, render: pygame.Surface, window: pygame.Surface,
+                rects: Optional[List[pygame.Rect]] = None):
+        """
+        Agrandit le rendu dans la fenêtre et l'affiche
+
+        Args:
+            render: Surface de rendu
+            window: Surface de la fenêtre
+            rects: Zones modifiées (pixels de rendu), None pour tout l'écran
+        """
+        if not self.scaled:
+            if rects is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(rects)
+            return
+
+        if rects is None:
+            self._scale(render, self.window_size, window)
+            pygame.display.flip()
+            return
+
+        bounds = render.get_rect()
+        updated = []
+        for rect in rects:
+            rect = rect.clip(bounds)
+            if rect.width == 0 or rect.height == 0:
+                continue
+            target = self.window_rect(rect)
+            window.blit(self._scale(render.subsurface(rect), target.size), target)
+            updated.append(target)
+        pygame.display.update(updated)